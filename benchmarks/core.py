@@ -0,0 +1,231 @@
+"""Benchmarks for fugo's core hot paths.
+
+Each benchmark takes a synthetic `Corpus` and returns a function that
+runs one pass over it; `run.py` times those functions.
+"""
+
+import random
+from dataclasses import dataclass
+from typing import Callable
+
+from fugo import Chord, Clock, Duration, Interval, Key, Melody, Meter, Mode, Note
+from fugo import NoteName, Packed, TempoMap, analyze_motion, consonances, distance
+from fugo import extract_features, track_keys
+
+Benchmark = Callable[['Corpus'], Callable[[], object]]
+
+BENCHMARKS: dict[str, Benchmark] = {}
+
+
+def benchmark(name: str) -> Callable[[Benchmark], Benchmark]:
+    def register(function: Benchmark) -> Benchmark:
+        BENCHMARKS[name] = function
+        return function
+
+    return register
+
+
+@dataclass
+class Corpus:
+    """Random (but reproducible) material for the benchmarks."""
+
+    melody: list[Note]
+    bass: list[Note]
+    names: list[NoteName]
+    intervals: list[Interval]
+    chords: list[str]
+    keys: list[Key]
+    durations: list[Duration]
+
+    @classmethod
+    def generate(cls, size: int, seed: int = 0) -> 'Corpus':
+        rng = random.Random(seed)
+
+        tonics = 'C G D A E F Bb Eb Ab'.split()
+        letters = 'CDEFGAB'
+        accidentals = ['b', '', '', '#']
+        qualities = ['', 'm', 'º', '7', 'M7', 'm7', 'ø7']
+        intervals = [
+            Interval(i) for i in 'P1 m2 M2 m3 M3 P4 A4 d5 P5 m6 M6 m7 M7 P8'.split()
+        ]
+
+        def name() -> str:
+            return rng.choice(letters) + rng.choice(accidentals)
+
+        # Two diatonic voices, changing key every 32 notes, so that every
+        # pair of notes is a nameable interval.
+        melody, bass = [], []
+        for start in range(0, size, 32):
+            key = Key(rng.choice(tonics))
+            melody += _walk(rng, key, 4, min(32, size - start))
+            bass += _walk(rng, key, 2, min(32, size - start))
+
+        return cls(
+            melody=melody,
+            bass=bass,
+            names=[NoteName(name()) for _ in range(size)],
+            intervals=[rng.choice(intervals) for _ in range(size)],
+            chords=[
+                name() + rng.choice(qualities) + rng.choice(['', '/'])
+                for _ in range(size)
+            ],
+            keys=[Key(name() + rng.choice(['', 'm'])) for _ in range(size // 10 + 1)],
+            durations=[
+                Duration(1, rng.choice([2, 4, 8, 16, 12])) for _ in range(size)
+            ],
+        )
+
+
+@benchmark('Interval.steps')
+def interval_steps(corpus: Corpus):
+    intervals = corpus.intervals
+    return lambda: [interval.steps for interval in intervals]
+
+
+@benchmark('Interval.__add__')
+def interval_add(corpus: Corpus):
+    pairs = list(zip(corpus.intervals, corpus.intervals[1:]))
+    return lambda: [a + b for a, b in pairs]
+
+
+@benchmark('Note.__add__')
+def note_add(corpus: Corpus):
+    pairs = list(zip(corpus.melody, corpus.intervals))
+    return lambda: [note + interval for note, interval in pairs]
+
+
+@benchmark('Note.__sub__')
+def note_sub(corpus: Corpus):
+    pairs = list(zip(corpus.melody, corpus.intervals))
+    return lambda: [note - interval for note, interval in pairs]
+
+
+@benchmark('distance')
+def note_distance(corpus: Corpus):
+    pairs = list(zip(corpus.melody, corpus.bass))
+    return lambda: [distance(high, low) for high, low in pairs]
+
+
+@benchmark('consonances')
+def interval_consonances(corpus: Corpus):
+    codes = Packed(corpus.intervals).codes
+    return lambda: consonances(codes)
+
+
+@benchmark('NoteName.__add__')
+def name_add(corpus: Corpus):
+    pairs = list(zip(corpus.names, corpus.intervals))
+    return lambda: [name + interval for name, interval in pairs]
+
+
+@benchmark('Chord.from_string')
+def chord_from_string(corpus: Corpus):
+    symbols = [_slash(symbol) for symbol in corpus.chords]
+    return lambda: [Chord.from_string(symbol) for symbol in symbols]
+
+
+@benchmark('Chord.figures')
+def chord_figures(corpus: Corpus):
+    chords = [Chord.from_string(_slash(symbol)) for symbol in corpus.chords]
+    keys = [corpus.keys[i % len(corpus.keys)] for i in range(len(chords))]
+    return lambda: [chord.figures(key) for chord, key in zip(chords, keys)]
+
+
+@benchmark('Key.__iter__')
+def key_iter(corpus: Corpus):
+    keys = corpus.keys * 10
+    return lambda: [list(key) for key in keys]
+
+
+@benchmark('track_keys')
+def key_tracking(corpus: Corpus):
+    # Each chord costs about 0.15 ms, so only a tenth of them are used.
+    symbols = corpus.chords[: len(corpus.chords) // 10 + 1]
+    chords = [Chord.from_string(_slash(symbol)) for symbol in symbols]
+    modes = [Mode.MAJOR, Mode.MINOR]
+    return lambda: track_keys(chords, modes=modes)
+
+
+@benchmark('analyze_motion')
+def motion(corpus: Corpus):
+    melody, bass = corpus.melody, corpus.bass
+    return lambda: analyze_motion(melody, bass)
+
+
+@benchmark('Melody pipeline')
+def melody_pipeline(corpus: Corpus):
+    melody = Melody(corpus.melody, corpus.durations)
+    fifth, third = Interval('P5'), Interval('m3')
+
+    def run():
+        answer = melody.transpose(fifth).invert().transpose(third, down=True)
+        return answer.retrograde().augment(2).notes()
+
+    return run
+
+
+@benchmark('extract_features')
+def melody_features(corpus: Corpus):
+    melodies = [corpus.melody[i : i + 32] for i in range(0, len(corpus.melody), 32)]
+    return lambda: extract_features(melodies)
+
+
+@benchmark('Duration arithmetic')
+def duration_arithmetic(corpus: Corpus):
+    durations = corpus.durations
+
+    def run():
+        total = Duration(0)
+        for duration in durations:
+            total = (total + duration * 2 - duration) % Duration.WHOLE
+        return total
+
+    return run
+
+
+@benchmark('Clock.tick')
+def clock_tick(corpus: Corpus):
+    durations = corpus.durations
+
+    def run():
+        clock = Clock(Meter(3, 4))
+        return [clock.tick(duration) for duration in durations]
+
+    return run
+
+
+@benchmark('TempoMap.seconds_many')
+def tempo_seconds(corpus: Corpus):
+    # A tempo change every whole note (at least one, at the start), and
+    # the onsets (in ticks) of a voice with the corpus durations.
+    changes = max(1, len(corpus.durations) // 4)
+    tempo = TempoMap((i, 60 + i % 60) for i in range(changes))
+    resolution = 48
+    onsets, total = [], 0
+    for duration in corpus.durations:
+        onsets.append(total)
+        total += duration.numerator * (resolution // duration.denominator)
+    return lambda: tempo.seconds_many(onsets, resolution)
+
+
+def _slash(symbol: str) -> str:
+    # Turn a trailing '/' into a valid inversion (the chord's third).
+    if not symbol.endswith('/'):
+        return symbol
+    chord = Chord.from_string(symbol[:-1])
+    return f'{symbol}{chord.note_names[1]}'
+
+
+def _walk(rng: random.Random, key: Key, octave: int, length: int) -> list[Note]:
+    # A random walk by steps and small leaps through two octaves of the
+    # scale of `key`, starting on its tonic in `octave`.
+    tonic = Note.from_attrs(key.tonic.letter, key.tonic.accidental, octave)
+    scale = [tonic + interval for interval in key.mode.intervals]
+    scale += [note + Interval('P8') for note in scale]
+
+    notes, degree = [], 0
+    for _ in range(length):
+        degree = max(0, min(13, degree + rng.choice([-3, -2, -1, 1, 2, 3])))
+        notes.append(scale[degree])
+
+    return notes
@@ -0,0 +1,98 @@
+"""Measure the memory used by fugo objects, with `tracemalloc`.
+
+usage:
+    python benchmarks/memory.py [--size N] [--voice LENGTH]
+
+Reports the bytes per `Note` and per `Chord` held in a list, and packed
+(`Packed`), and the bytes per voice of a score loaded with `load_voices`,
+with and without a budget. Memory that Python doesn't allocate itself
+(e.g. the pages of a mapped score file) isn't traced.
+"""
+
+import argparse
+import gc
+import os
+import sys
+import tempfile
+import tracemalloc
+from pathlib import Path
+from typing import Callable
+
+# Measure the working tree, not an installed copy of fugo.
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+import core  # noqa: E402
+from fugo import Chord, Duration, Note, Packed, load_voices, write_score  # noqa: E402
+
+
+def measure(build: Callable[[], object]) -> int:
+    """Return the number of bytes allocated by `build()` that are still
+    in use by its result."""
+    gc.collect()
+    tracemalloc.start()
+    try:
+        before = tracemalloc.get_traced_memory()[0]
+        result = build()
+        gc.collect()
+        size = tracemalloc.get_traced_memory()[0] - before
+    finally:
+        tracemalloc.stop()
+    del result
+    return size
+
+
+def run(size: int = 20_000, voice: int = 1_000) -> dict[str, tuple[float, str]]:
+    """Return the bytes used per item by each representation, with the
+    kind of item."""
+    voice = min(voice, size)
+    corpus = core.Corpus.generate(size)
+    codes = [note.code for note in corpus.melody]
+    symbols = [core._slash(symbol) for symbol in corpus.chords]
+    notes = [Note.from_code(code) for code in codes]
+    chords = [Chord.from_string(symbol) for symbol in symbols]
+
+    voices = [
+        (notes[start : start + voice], [Duration(1, 8)] * voice)
+        for start in range(0, size - voice + 1, voice)
+    ]
+
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, 'score.fugo')
+        write_score(path, voices)
+
+        # (unit, number of units, function building them)
+        cases = {
+            'Note': ('note', size, lambda: [Note.from_code(c) for c in codes]),
+            'Note (packed)': ('note', size, lambda: Packed(notes)),
+            'Chord': ('chord', size, lambda: [Chord.from_string(s) for s in symbols]),
+            'Chord (packed)': ('chord', size, lambda: Packed(chords)),
+            'voice': ('voice', len(voices), lambda: load_voices(path)),
+            'voice (budget)': (
+                'voice',
+                len(voices),
+                lambda: load_voices(path, budget=0),
+            ),
+        }
+
+        # Warm every cache first, so that only the results are counted.
+        for _, _, build in cases.values():
+            build()
+
+        return {
+            name: (measure(build) / count, unit)
+            for name, (unit, count, build) in cases.items()
+        }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--size', type=int, default=20_000, help='number of items')
+    parser.add_argument('--voice', type=int, default=1_000, help='notes per voice')
+    args = parser.parse_args()
+
+    for name, (value, unit) in run(args.size, args.voice).items():
+        print(f'{name:16} {value:12,.1f} bytes per {unit}')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,142 @@
+"""Run fugo's benchmarks and compare them against a baseline.
+
+usage:
+    python benchmarks/run.py [--size N] [--repeat R] [--filter TEXT]
+                             [--output FILE] [--baseline FILE]
+                             [--threshold RATIO] [--startup] [--memory]
+
+Save a baseline with `--output baseline.json`, then pass it back with
+`--baseline baseline.json` after making changes. Any benchmark slower
+than the baseline by more than `--threshold` is reported as a
+regression, and the script exits with status 1. With `--memory`, the
+bytes used per item (see `memory.py`) are compared the same way.
+"""
+
+import argparse
+import json
+import platform
+import sys
+import time
+from datetime import datetime, timezone
+from pathlib import Path
+
+# Benchmark the working tree, not an installed copy of fugo.
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+import core  # noqa: E402
+import memory  # noqa: E402
+import startup  # noqa: E402
+
+
+def measure(function, repeat: int) -> float:
+    """Return the best of `repeat` timings of `function`, in seconds."""
+    best = float('inf')
+    for _ in range(repeat):
+        start = time.perf_counter()
+        function()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def run(
+    size: int,
+    repeat: int,
+    pattern: str = '',
+    include_startup: bool = False,
+    include_memory: bool = False,
+) -> dict:
+    """Run the benchmarks whose names contain `pattern`, and return the
+    results in the format saved by `--output`."""
+    corpus = core.Corpus.generate(size)
+
+    results = {}
+    for name, benchmark in core.BENCHMARKS.items():
+        if pattern.lower() not in name.lower():
+            continue
+        results[name] = {'seconds': measure(benchmark(corpus), repeat)}
+
+    if include_startup:
+        for name, seconds in startup.run(repeat).items():
+            results[f'startup: {name}'] = {'seconds': seconds}
+
+    if include_memory:
+        for name, (bytes_, unit) in memory.run(size).items():
+            results[f'memory: {name}'] = {'bytes': bytes_, 'unit': unit}
+
+    return {
+        'meta': {
+            'date': datetime.now(timezone.utc).isoformat(timespec='seconds'),
+            'python': platform.python_version(),
+            'implementation': platform.python_implementation(),
+            'machine': platform.machine(),
+            'size': size,
+            'repeat': repeat,
+        },
+        'results': results,
+    }
+
+
+def compare(results: dict, baseline: dict | None, threshold: float) -> list[str]:
+    """Print each benchmark's time (relative to the baseline, if any), and
+    return the names of those that regressed."""
+    old = baseline['results'] if baseline else {}
+    regressions = []
+
+    if baseline and results['meta']['size'] != baseline['meta']['size']:
+        print('warning: the baseline was run with a different --size')
+
+    for name, result in results['results'].items():
+        metric = 'bytes' if 'bytes' in result else 'seconds'
+        value = result[metric]
+        if metric == 'bytes':
+            line = f'{name:36} {value:9.1f} B per {result["unit"]}'
+        else:
+            line = f'{name:36} {value * 1000:9.2f} ms'
+
+        if name in old:
+            ratio = value / old[name][metric]
+            line += f'  {ratio:6.2f}x'
+            if ratio > threshold:
+                line += '  REGRESSION'
+                regressions.append(name)
+        print(line)
+
+    return regressions
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--size', type=int, default=10_000, help='corpus size')
+    parser.add_argument('--repeat', type=int, default=5, help='timings per case')
+    parser.add_argument('--filter', default='', help='only run matching cases')
+    parser.add_argument('--output', type=Path, help='save results as JSON')
+    parser.add_argument('--baseline', type=Path, help='compare with saved results')
+    parser.add_argument(
+        '--threshold',
+        type=float,
+        default=1.25,
+        help='slowdown ratio reported as a regression (default: 1.25)',
+    )
+    parser.add_argument(
+        '--startup', action='store_true', help='also time `import fugo`'
+    )
+    parser.add_argument(
+        '--memory', action='store_true', help='also measure memory per item'
+    )
+    args = parser.parse_args()
+
+    results = run(args.size, args.repeat, args.filter, args.startup, args.memory)
+
+    if args.output:
+        args.output.write_text(json.dumps(results, indent=2) + '\n')
+
+    baseline = json.loads(args.baseline.read_text()) if args.baseline else None
+    regressions = compare(results, baseline, args.threshold)
+
+    if regressions:
+        print(f'{len(regressions)} regression(s): {", ".join(regressions)}')
+        sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,57 @@
+"""Measure the time it takes to start Python and import fugo.
+
+usage:
+    python benchmarks/startup.py [--runs N]
+
+Each statement runs in a fresh interpreter. The time of a bare
+interpreter (`pass`) is subtracted from the others.
+"""
+
+import argparse
+import statistics
+import subprocess
+import sys
+import time
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+
+STATEMENTS = {
+    'python': 'pass',
+    'import fugo': 'import fugo',
+    'from fugo import Note': 'from fugo import Note',
+    'from fugo import Chord, Key': 'from fugo import Chord, Key',
+    'from fugo import *': 'from fugo import *',
+}
+
+
+def measure(statement: str, runs: int) -> float:
+    """Return the median wall time of running `statement` in a new
+    interpreter, in seconds."""
+    times = []
+    for _ in range(runs):
+        start = time.perf_counter()
+        subprocess.run([sys.executable, '-c', statement], check=True, cwd=ROOT)
+        times.append(time.perf_counter() - start)
+    return statistics.median(times)
+
+
+def run(runs: int = 20) -> dict[str, float]:
+    """Return the median startup time of each statement, in seconds, with
+    the bare interpreter's time subtracted."""
+    results = {name: measure(stmt, runs) for name, stmt in STATEMENTS.items()}
+    baseline = results.pop('python')
+    return {name: t - baseline for name, t in results.items()}
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--runs', type=int, default=20)
+    args = parser.parse_args()
+
+    for name, t in run(args.runs).items():
+        print(f'{name:30} {t * 1000:7.1f} ms')
+
+
+if __name__ == '__main__':
+    main()
@@ -1,8 +1,80 @@
-from .interval import *
-from .note import *
-from .key import *
-from .chord import *
-from .motion import *
-from .duration import *
-from .meter import *
-from .time import *
+from importlib import import_module
+
+# Importing `typing` would cost more than the rest of this module; type
+# checkers treat any variable with this name like `typing.TYPE_CHECKING`.
+TYPE_CHECKING = False
+
+# Submodules are imported on first use (PEP 562), so `import fugo` stays
+# cheap. Each public name maps to the submodule that defines it.
+_EXPORTS = {
+    module: names.split()
+    for module, names in {
+        'interval': 'Interval Consonance consonances',
+        'note': 'LetterName Accidental Note NoteName distance',
+        'key': 'Mode Degree Key',
+        'chord': 'Quality Chord figures_many precompute_figures',
+        'motion': 'Motion Direction analyze_motion',
+        'duration': 'Duration',
+        'meter': 'Meter',
+        'time': 'Time Clock TempoMap',
+        'stretto': 'Stretto find_strettos',
+        'search': 'Entry SubjectIndex',
+        'similarity': 'Match MelodyIndex signature edit_distance',
+        'voicing': 'SATB voice_lead realize',
+        'modulation': 'track_keys find_keys',
+        'setclass': 'SetClass pitch_class_set set_class set_classes equivalent',
+        'row': 'ToneRow RowMatch',
+        'markov': 'ChordModel',
+        'cadence': 'Cadence CadencePoint find_cadences metric_weight',
+        'spelling': 'spell spell_voices',
+        'score': 'ScoreFile VoiceView write_score open_score load_voices',
+        'packed': 'Packed',
+        'instrumentation': 'Instrumentation',
+        'melody': 'Melody Features extract_features',
+    }.items()
+}
+_MODULES = {name: module for module, names in _EXPORTS.items() for name in names}
+
+__all__ = [*_MODULES]
+
+
+def __getattr__(name: str):
+    if name in _MODULES:
+        value = getattr(import_module(f'.{_MODULES[name]}', __name__), name)
+    elif name in _EXPORTS:
+        value = import_module(f'.{name}', __name__)
+    else:
+        raise AttributeError(f'module {__name__!r} has no attribute {name!r}')
+
+    # Cache the value so that later lookups skip this function.
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted({*globals(), *_MODULES, *_EXPORTS})
+
+
+if TYPE_CHECKING:
+    from .interval import *
+    from .note import *
+    from .key import *
+    from .chord import *
+    from .motion import *
+    from .duration import *
+    from .meter import *
+    from .time import *
+    from .stretto import *
+    from .search import *
+    from .similarity import *
+    from .voicing import *
+    from .modulation import *
+    from .setclass import *
+    from .row import *
+    from .markov import *
+    from .cadence import *
+    from .spelling import *
+    from .score import *
+    from .packed import *
+    from .instrumentation import *
+    from .melody import *
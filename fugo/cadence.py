@@ -0,0 +1,204 @@
+__all__ = ['Cadence', 'CadencePoint', 'find_cadences', 'metric_weight']
+
+from enum import Enum
+from functools import cache
+from typing import NamedTuple, Sequence
+
+from fugo import Chord, Interval, Key, LetterName, Meter, Mode, NoteName, Time
+from fugo.chord import Quality
+
+
+class Cadence(Enum):
+    # fmt: off
+    PERFECT_AUTHENTIC   = 1.0
+    IMPERFECT_AUTHENTIC = 0.75
+    HALF                = 0.6
+    PHRYGIAN            = 0.55
+    DECEPTIVE           = 0.5
+    # fmt: on
+
+    def __repr__(self):
+        return f'Cadence.{self.name}'
+
+    @property
+    def strength(self) -> float:
+        """Get the strength of the cadence on a downbeat."""
+        return self.value
+
+
+class CadencePoint(NamedTuple):
+    """Describe a cadence found by `find_cadences`."""
+
+    index: int
+    time: Time
+    cadence: Cadence
+    strength: float
+
+
+def metric_weight(time: Time, meter: Meter) -> float:
+    """Return the metric strength of a position, from 0 to 1.
+
+    notes:
+        - downbeats are 1, other strong beats (the middle of duple and
+        quadruple bars, and each dotted beat of compound meters) 0.75,
+        weak beats 0.5, and positions between beats 0.25
+    """
+    if time.pulse:
+        return 0.25
+    if time.beat == 1:
+        return 1.0
+
+    compound = meter.beats % 3 == 0 and meter.beats > 3
+    if compound and (time.beat - 1) % 3 == 0:
+        return 0.75
+    if not compound and meter.beats % 2 == 0 and time.beat == meter.beats // 2 + 1:
+        return 0.75
+    return 0.5
+
+
+def find_cadences(
+    chords: Sequence[Chord], times: Sequence[Time], key: Key, meter: Meter
+) -> list[CadencePoint]:
+    """Find the cadences in a chord progression.
+
+    args:
+        - `chords`: chords of the progression
+        - `times`: position of each chord
+        - `key`: key of the progression
+        - `meter`: meter of the progression
+
+    returns:
+        - list of `CadencePoint`s, in order
+            - `index`: index of the cadence's final chord
+            - `time`: position of the cadence's final chord
+            - `cadence`: type of cadence
+            - `strength`: `cadence.strength` scaled by the
+            `metric_weight` of the final chord
+
+    notes:
+        - cadences are recognized by the harmony alone:
+            - perfect authentic: V(7) to I, both in root position
+            - imperfect authentic: V(7) or viiº(7) to I otherwise
+            - deceptive: V(7) to vi
+            - Phrygian: iv6 to V, with the bass falling a semitone
+            - half: V not followed by I, vi, or V (or at the end)
+        - each chord is reduced to a small code (scale degree, harmonic
+        function, and inversion) and a bass pitch class, both cached, so
+        the scan is a single pass over integer codes
+
+    examples:
+        >>> from fugo import Chord, Key, Meter, Time, find_cadences
+        >>> chords = [Chord(c) for c in 'C F G C Am G7 Am'.split()]
+        >>> times = [Time(m, b) for m in (1, 2, 3, 4) for b in (1, 3)][:7]
+        >>> for point in find_cadences(chords, times, Key('C'), Meter(4, 4)):
+        ...     print(point.index, point.cadence, point.strength)
+        3 Cadence.PERFECT_AUTHENTIC 0.75
+        6 Cadence.DECEPTIVE 0.5
+    """
+    if len(chords) != len(times):
+        raise ValueError('chords and times must have the same length')
+
+    attrs = key.tonic, key.mode
+    codes = [_code(attrs, c.root, tuple(c.quality), c.inversion) for c in chords]
+    basses = [_bass(c.root, tuple(c.quality), c.inversion) for c in chords]
+
+    points = []
+
+    def add(i: int, cadence: Cadence):
+        strength = cadence.strength * metric_weight(times[i], meter)
+        points.append(CadencePoint(i, times[i], cadence, strength))
+
+    for i, code in enumerate(codes):
+        previous = codes[i - 1] if i else _OTHER
+        following = codes[i + 1] if i + 1 < len(codes) else _OTHER
+        motion = (basses[i] - basses[i - 1]) % 12 if i else None
+
+        if previous in _DOMINANTS:
+            if code == _TONIC_ROOT and previous == _DOMINANT_ROOT:
+                add(i, Cadence.PERFECT_AUTHENTIC)
+                continue
+            if code in _TONICS:
+                add(i, Cadence.IMPERFECT_AUTHENTIC)
+                continue
+            if code in _SUBMEDIANTS and previous[1] == _DOMINANT:
+                add(i, Cadence.DECEPTIVE)
+                continue
+
+        if code == _DOMINANT_ROOT:
+            if previous == _PHRYGIAN_APPROACH and motion == _SEMITONE_DOWN:
+                add(i, Cadence.PHRYGIAN)
+            elif following[1] != _DOMINANT and following not in _RESOLUTIONS:
+                add(i, Cadence.HALF)
+
+    return points
+
+
+# Chord codes are (scale degree, function, inversion). The scale degree
+# is 0-6 counted from the tonic's letter (-1 if the root is chromatic).
+# fmt: off
+_OTHER       = (-1, 'other', 0)
+_TONIC       = 'tonic'
+_DOMINANT    = 'dominant'
+_LEADING     = 'leading'
+_SUBMEDIANT  = 'submediant'
+_SUBDOMINANT = 'subdominant'
+# fmt: on
+
+_TONIC_ROOT = (0, _TONIC, 0)
+_DOMINANT_ROOT = (4, _DOMINANT, 0)
+_PHRYGIAN_APPROACH = (3, _SUBDOMINANT, 1)
+
+_TONICS = {(0, _TONIC, inversion) for inversion in range(3)}
+_SUBMEDIANTS = {(5, _SUBMEDIANT, inversion) for inversion in range(3)}
+_DOMINANTS = {(4, _DOMINANT, inversion) for inversion in range(4)} | {
+    (6, _LEADING, inversion) for inversion in range(4)
+}
+_RESOLUTIONS = _TONICS | _SUBMEDIANTS
+_SEMITONE_DOWN = 11
+
+
+@cache
+def _code(
+    key: tuple[NoteName, Mode],
+    root: NoteName,
+    quality: tuple[Interval, ...],
+    inversion: int,
+) -> tuple[int, str, int]:
+    tonic, mode = key
+    scale = [*Key.from_attrs(tonic, mode)]
+
+    letters = [*LetterName]
+    degree = (letters.index(root.letter) - letters.index(tonic.letter)) % 7
+
+    # Allow the raised leading tone (and the major dominant) in minor.
+    leading_tone = (tonic.pitch - root.pitch) % 12 == 1
+    if root not in scale and not (degree == 6 and leading_tone):
+        return _OTHER
+
+    major = quality[:3] == tuple(Quality.MAJOR)
+    minor = quality[:3] == tuple(Quality.MINOR)
+    diminished = quality[:3] == tuple(Quality.DIMINISHED)
+
+    match degree:
+        case 0 if len(quality) == 3 and (major or minor):
+            function = _TONIC
+        case 4 if major and quality in _DOMINANT_QUALITIES:
+            function = _DOMINANT
+        case 6 if leading_tone and diminished:
+            function = _LEADING
+        case 5 if len(quality) == 3 and (major or minor):
+            function = _SUBMEDIANT
+        case 3 if len(quality) == 3 and minor:
+            function = _SUBDOMINANT
+        case _:
+            return _OTHER
+
+    return degree, function, inversion
+
+
+_DOMINANT_QUALITIES = {tuple(Quality.MAJOR), tuple(Quality.MAJ_MIN_7)}
+
+
+@cache
+def _bass(root: NoteName, quality: tuple[Interval, ...], inversion: int) -> int:
+    return (root + quality[inversion]).pitch % 12
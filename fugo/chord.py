@@ -1,10 +1,11 @@
-__all__ = ['Quality', 'Chord']
+__all__ = ['Quality', 'Chord', 'figures_many', 'precompute_figures']
 
 from dataclasses import dataclass
 from enum import Enum
-from typing import overload
+from functools import cache
+from typing import Iterable, Iterator, overload
 
-from fugo import Accidental, Interval, Key, LetterName, NoteName
+from fugo import Accidental, Interval, Key, LetterName, Mode, NoteName
 
 
 class Quality(list[Interval], Enum):
@@ -68,30 +69,39 @@ class Quality(list[Interval], Enum):
             raise ValueError(f'invalid symbol: {symbol!r}') from None
 
 
-@dataclass
+_QUALITIES = tuple(Quality)
+
+
+@dataclass(frozen=True, slots=True, init=False)
 class Chord:
     root: NoteName
     quality: list[Interval]
     inversion: int = 0
 
     @overload
-    def __init__(self, chord: str, /): ...
+    def __new__(cls, chord: str, /) -> 'Chord': ...
 
     @overload
-    def __init__(
-        self, root: NoteName, quality: list[Interval], inversion: int = 0, /
-    ): ...
+    def __new__(
+        cls, root: NoteName, quality: list[Interval], inversion: int = 0, /
+    ) -> 'Chord': ...
 
-    def __init__(self, *args):
+    def __new__(cls, *args):
         match args:
             case str(),:
-                copy = self.from_string(*args)
+                return cls.from_string(*args)
             case NoteName(), list(), *_:
-                copy = self.from_attrs(*args)
+                return cls.from_attrs(*args)
             case _:
                 raise TypeError('invalid arguments')
 
-        vars(self).update(vars(copy))
+    def __reduce__(self):
+        try:
+            return _chord, (self.code,)
+        except ValueError:
+            # Chords with qualities other than the named ones have no
+            # code.
+            return Chord.from_attrs, (self.root, list(self.quality), self.inversion)
 
     def __repr__(self):
         if pretty := self._pretty():
@@ -134,7 +144,7 @@ class Chord:
         return len(self.note_names)
 
     def __hash__(self):
-        return 0
+        return hash((self.root, *self.quality, self.inversion))
 
     @classmethod
     def from_string(cls, name: str):
@@ -179,12 +189,33 @@ class Chord:
                 f' (chord only has {len(quality)} members)'
             )
 
-        chord = super().__new__(cls)
-        chord.root = root
-        chord.quality = quality
-        chord.inversion = inversion
+        chord = object.__new__(cls)
+        object.__setattr__(chord, 'root', root)
+        object.__setattr__(chord, 'quality', quality)
+        object.__setattr__(chord, 'inversion', inversion)
         return chord
 
+    @property
+    def code(self) -> int:
+        """Get a small integer that identifies the chord (see `from_code`).
+
+        raises:
+            - `ValueError` if the chord's quality isn't a `Quality`
+        """
+        try:
+            quality = _QUALITIES.index(self.quality)
+        except ValueError:
+            raise ValueError(f'chord quality has no code: {self.quality!r}') from None
+
+        return (self.root.code * len(_QUALITIES) + quality) * 4 + self.inversion
+
+    @classmethod
+    def from_code(cls, code: int) -> 'Chord':
+        """Initialize a `Chord` from its `code`."""
+        code, inversion = divmod(code, 4)
+        root, quality = divmod(code, len(_QUALITIES))
+        return cls.from_attrs(NoteName.from_code(root), _QUALITIES[quality], inversion)
+
     @property
     def note_names(self) -> list[NoteName]:
         # Find the chord members.
@@ -224,6 +255,8 @@ class Chord:
 
         notes:
             - `shorthand` has no effect if `key is None`
+            - results are stored in a table shared by all chords (see
+            `precompute_figures`)
 
         examples:
             >>> from fugo import Chord, Key
@@ -235,41 +268,194 @@ class Chord:
             >>> D7.figures(Key('G'), shorthand=False)
             [(None, 7), (None, 5), (None, 3)]
         """
-        intervals = reversed(self.intervals)
-        *notes, bass = reversed(self.note_names)
-
-        def figure(note: NoteName, interval: Interval) -> tuple[Accidental | None, int]:
-            requires_accidental = key is None or note not in key
-            symbol = note.accidental if requires_accidental else None
-            number = interval.size.number
-            return symbol, number
-
-        figures = [figure(note, interval) for note, interval in zip(notes, intervals)]
-
-        if shorthand:
-            match figures:
-                # triad, root position (5/3 -> _)
-                case [(None, 5), (None, 3)]:
-                    figures = []
-
-                # triad, 1st inversion (6/3 -> 6)
-                case [(_, 6), (None, 3)]:
-                    figures = figures[:1]
-
-                # seventh, root position (7/5/3 -> 7)
-                case [(_, 7), (None, 5), (None, 3)]:
-                    figures = figures[:1]
+        return list(_figures(self, _key_code(key), shorthand))
+
+
+def figures_many(
+    chords: Iterable[Chord], key: Key | None = None, *, shorthand: bool = True
+) -> list[list[tuple[Accidental | None, int]]]:
+    """Return the figures for each chord in a progression.
+
+    args:
+        - `chords`: chords to label
+        - `key`, `shorthand`: as for `Chord.figures`
+
+    returns:
+        - list containing the figures of each chord
+    """
+    key_code = _key_code(key)
+    return [list(_figures(chord, key_code, shorthand)) for chord in chords]
+
+
+def precompute_figures(keys: Iterable[Key] | None = None) -> None:
+    """Fill the figure table ahead of time.
+
+    args:
+        - `keys`: keys to fill the table for (defaults to every key, as
+        well as `None`)
+
+    notes:
+        - `Chord.figures` fills the table lazily, so this is only
+        useful to move the cost out of a latency-sensitive path (e.g.
+        into worker start-up)
+        - filling the table for every key takes about a second and
+        35 MB
+    """
+    if keys is None:
+        # Every key, and `None`.
+        key_codes = range(-1, _KEYS - 1)
+    else:
+        key_codes = [key.code for key in keys]
+
+    scales = {}
+    for key_code in key_codes:
+        try:
+            scales[key_code] = _scale(key_code)
+        except ValueError:
+            # Skip keys (e.g. Fb locrian) whose scales need accidentals
+            # beyond double sharps and double flats.
+            continue
 
-                # seventh, 1st inversion (6/5/3 -> 6/5)
-                case [(_, 6), (_, 5), (None, 3)]:
-                    figures = figures[:2]
+    for code in range(_CHORDS):
+        try:
+            members = _members(code)
+        except ValueError:
+            # Likewise for chords such as Bx+ (and for inversions that
+            # triads don't have).
+            continue
+
+        variants = _variants(code, False), _variants(code, True)
+        for key_code, scale in scales.items():
+            mask = _mask(members, scale)
+            for shorthand in (False, True):
+                index = (code * _KEYS + key_code + 1) * 2 + shorthand
+                _FIGURES[index] = variants[shorthand][mask]
+
+
+# Figures of each chord (by code) in each key (by code, or -1 for
+# `None`), with and without shorthand. The domain is small (35 roots,
+# 10 qualities, up to 4 inversions, 245 keys), so every distinct request
+# is computed once and then looked up by a single integer.
+_FIGURES: dict[int, tuple[tuple[Accidental | None, int], ...]] = {}
+
+# Equal figures share one tuple, to keep the filled table small.
+_SHARED: dict[tuple, tuple] = {}
+
+_KEYS = 35 * len(Mode) + 1
+_CHORDS = 35 * len(_QUALITIES) * 4
+
+
+def _key_code(key: Key | None) -> int:
+    return -1 if key is None else key.code
+
+
+def _figures(
+    chord: Chord, key_code: int, shorthand: bool
+) -> tuple[tuple[Accidental | None, int], ...]:
+    try:
+        code = chord.code
+    except ValueError:
+        # Chords of other qualities aren't stored.
+        members = tuple(_upper_members(chord))
+        return _figure(members, _mask(members, _scale(key_code)), shorthand)
+    return _lookup(code, key_code, shorthand)
+
+
+def _lookup(
+    code: int, key_code: int, shorthand: bool
+) -> tuple[tuple[Accidental | None, int], ...]:
+    index = (code * _KEYS + key_code + 1) * 2 + shorthand
+    try:
+        return _FIGURES[index]
+    except KeyError:
+        pass
+
+    mask = _mask(_members(code), _scale(key_code))
+    figures = _FIGURES[index] = _variants(code, shorthand)[mask]
+    return figures
+
+
+@cache
+def _variants(code: int, shorthand: bool) -> tuple[tuple, ...]:
+    # Figures of a chord for each `_mask`, so a chord has at most eight
+    # distinct results, whatever the key.
+    members = _members(code)
+    variants = []
+    for mask in range(2 ** len(members)):
+        figures = _figure(members, mask, shorthand)
+        variants.append(_SHARED.setdefault(figures, figures))
+    return tuple(variants)
+
+
+def _mask(
+    members: tuple[tuple[int, Accidental, int], ...], scale: frozenset[int]
+) -> int:
+    # Set bit `i` if the `i`th upper member is in the scale.
+    return sum(1 << i for i, (note, _, _) in enumerate(members) if note in scale)
+
+
+def _figure(
+    members: tuple[tuple[int, Accidental, int], ...],
+    mask: int,
+    shorthand: bool,
+) -> tuple[tuple[Accidental | None, int], ...]:
+    figures = [
+        (None if mask >> i & 1 else accidental, number)
+        for i, (_, accidental, number) in enumerate(members)
+    ]
+
+    if shorthand:
+        match figures:
+            # triad, root position (5/3 -> _)
+            case [(None, 5), (None, 3)]:
+                figures = []
+
+            # triad, 1st inversion (6/3 -> 6)
+            case [(_, 6), (None, 3)]:
+                figures = figures[:1]
+
+            # seventh, root position (7/5/3 -> 7)
+            case [(_, 7), (None, 5), (None, 3)]:
+                figures = figures[:1]
+
+            # seventh, 1st inversion (6/5/3 -> 6/5)
+            case [(_, 6), (_, 5), (None, 3)]:
+                figures = figures[:2]
+
+            # seventh, 2nd inversion (6/4/3 -> 4/3)
+            case [(None, 6), (_, 4), (_, 3)]:
+                figures = figures[1:]
+
+            # seventh, 3rd inversion (6/4/2 -> 4/2)
+            case [(None, 6), (_, 4), (_, 2)]:
+                figures = figures[1:]
 
-                # seventh, 2nd inversion (6/4/3 -> 4/3)
-                case [(None, 6), (_, 4), (_, 3)]:
-                    figures = figures[1:]
+    return tuple(figures)
+
+
+@cache
+def _members(code: int) -> tuple[tuple[int, Accidental, int], ...]:
+    return tuple(_upper_members(Chord.from_code(code)))
 
-                # seventh, 3rd inversion (6/4/2 -> 4/2)
-                case [(None, 6), (_, 4), (_, 2)]:
-                    figures = figures[1:]
 
-        return figures
+def _upper_members(chord: Chord) -> Iterator[tuple[int, Accidental, int]]:
+    # Upper chord members (highest first), as (note name code,
+    # accidental, figure).
+    intervals = reversed(chord.intervals)
+    *notes, bass = reversed(chord.note_names)
+    for note, interval in zip(notes, intervals):
+        yield note.code, note.accidental, interval.size.number
+
+
+@cache
+def _scale(key_code: int) -> frozenset[int]:
+    # Codes of the note names of a key (by code), or none for no key (so
+    # that every member needs an accidental).
+    if key_code < 0:
+        return frozenset()
+    return frozenset(note.code for note in Key.from_code(key_code))
+
+
+@cache
+def _chord(code: int) -> Chord:
+    return Chord.from_code(code)
@@ -0,0 +1,236 @@
+__all__ = ['Instrumentation']
+
+import json
+import sys
+from functools import wraps
+from importlib import import_module
+from time import perf_counter
+from typing import Any, Callable
+
+# Operations that are counted and timed, as (module, class or None, name).
+_TARGETS = [
+    ('interval', 'Interval', 'steps'),
+    ('interval', 'Interval', '__add__'),
+    ('interval', 'Interval', 'from_string'),
+    ('note', 'NoteName', '__add__'),
+    ('note', 'NoteName', '__sub__'),
+    ('note', 'NoteName', 'from_string'),
+    ('note', 'Note', '__add__'),
+    ('note', 'Note', '__sub__'),
+    ('note', 'Note', 'from_string'),
+    ('note', None, 'distance'),
+    ('key', 'Key', '__iter__'),
+    ('key', 'Key', 'from_string'),
+    ('chord', 'Chord', 'figures'),
+    ('chord', 'Chord', 'from_string'),
+    ('motion', 'Motion', 'from_beats'),
+    ('motion', None, 'analyze_motion'),
+]
+
+
+class Instrumentation:
+    """Count and time calls to fugo's hot paths, and measure cache hit
+    rates.
+
+    notes:
+        - instrumentation is opt-in: `enable` replaces the operations
+        with counting wrappers and `disable` puts the originals back, so
+        there is no overhead at all while it is disabled
+        - functions (`distance` and `analyze_motion`) are replaced in
+        fugo's own modules; a name imported elsewhere before enabling
+        (e.g. `from fugo import distance`) still refers to the original,
+        so use `fugo.distance` to count such calls
+        - call times are inclusive (e.g. the time of `analyze_motion`
+        includes the calls to `distance` it makes)
+        - cache statistics cover every `functools` cache in the loaded
+        fugo modules, counting only lookups made while enabled
+        - `enable` starts counting from zero; only one `Instrumentation`
+        can be enabled at a time
+
+    examples:
+        >>> from fugo import Instrumentation, Note, analyze_motion
+        >>> upper = [Note(n) for n in 'E5 F5 G5'.split()]
+        >>> lower = [Note(n) for n in 'C5 D5 C5'.split()]
+        >>> with Instrumentation() as stats:
+        ...     motion = analyze_motion(upper, lower)
+        >>> calls = stats.snapshot()['calls']
+        >>> calls['motion.Motion.from_beats']['count']
+        2
+        >>> calls['note.distance']['count']
+        4
+    """
+
+    _active: 'Instrumentation | None' = None
+
+    def __init__(self):
+        self._calls: dict[str, list] = {}
+        self._caches: dict[str, Any] = {}
+        self._start: dict[str, tuple[int, int]] = {}
+        self._final: dict[str, tuple[int, int, int]] = {}
+        self._patches: list[tuple[list | None, str, object, object]] = []
+
+    def __enter__(self) -> 'Instrumentation':
+        self.enable()
+        return self
+
+    def __exit__(self, *_):
+        self.disable()
+
+    @property
+    def enabled(self) -> bool:
+        return Instrumentation._active is self
+
+    def enable(self) -> None:
+        """Start counting (and timing) calls."""
+        if self.enabled:
+            return
+        if Instrumentation._active is not None:
+            raise RuntimeError('another Instrumentation is already enabled')
+
+        Instrumentation._active = self
+        for module, owner, name in _TARGETS:
+            self._patch(module, owner, name)
+
+        self._caches = _caches()
+        self.reset()
+
+    def disable(self) -> None:
+        """Stop counting calls, keeping the counts so far."""
+        if not self.enabled:
+            return
+
+        self._final = self._cache_counts()
+        for namespaces, name, original, wrapper in reversed(self._patches):
+            # Modules imported while enabled may have bound a wrapped
+            # function too, so look for functions everywhere again.
+            for namespace in namespaces or _namespaces():
+                if _get(namespace, name) is wrapper:
+                    setattr(namespace, name, original)
+        self._patches = []
+        Instrumentation._active = None
+
+    def reset(self) -> None:
+        """Clear the counts (`enable` also does this)."""
+        # The wrappers hold on to these lists, so clear them in place.
+        for counts in self._calls.values():
+            counts[:] = [0, 0.0]
+        self._start = {
+            name: function.cache_info()[:2] for name, function in self._caches.items()
+        }
+        self._final = {}
+
+    def snapshot(self) -> dict[str, dict[str, dict[str, float]]]:
+        """Return the counts so far.
+
+        returns:
+            - `dict` with two entries:
+                - `'calls'`: `{'count', 'seconds'}` for each operation
+                that was called (e.g. `'note.distance'`)
+                - `'caches'`: `{'hits', 'misses', 'hit_rate', 'size'}` for
+                each cache that was used (e.g. `'key._scale'`)
+        """
+        calls = {
+            name: {'count': count, 'seconds': seconds}
+            for name, (count, seconds) in sorted(self._calls.items())
+            if count
+        }
+
+        caches = {}
+        counts = self._final or self._cache_counts()
+        for name, (hits, misses, size) in sorted(counts.items()):
+            if hits or misses:
+                caches[name] = {
+                    'hits': hits,
+                    'misses': misses,
+                    'hit_rate': hits / (hits + misses),
+                    'size': size,
+                }
+
+        return {'calls': calls, 'caches': caches}
+
+    def json(self, **kwargs) -> str:
+        """Return `snapshot()` as JSON (`kwargs` are passed to
+        `json.dumps`)."""
+        return json.dumps(self.snapshot(), **kwargs)
+
+    def _cache_counts(self) -> dict[str, tuple[int, int, int]]:
+        counts = {}
+        for name, function in self._caches.items():
+            info = function.cache_info()
+            hits, misses = self._start.get(name, (0, 0))
+            counts[name] = info.hits - hits, info.misses - misses, info.currsize
+        return counts
+
+    def _patch(self, module: str, owner: str | None, name: str) -> None:
+        module_object = import_module(f'{__package__}.{module}')
+        label = f'{module}.{owner}.{name}' if owner else f'{module}.{name}'
+        self._calls.setdefault(label, [0, 0.0])
+
+        if owner is None:
+            # Functions are also bound by name in every module that
+            # imported them (and in the package itself).
+            original = getattr(module_object, name)
+            wrapper = self._wrap(label, original)
+            targets = [m for m in _namespaces() if _get(m, name) is original]
+            namespaces = None
+        else:
+            cls = getattr(module_object, owner)
+            original = vars(cls)[name]
+            match original:
+                case property():
+                    wrapper = property(self._wrap(label, original.fget))
+                case classmethod():
+                    wrapper = classmethod(self._wrap(label, original.__func__))
+                case _:
+                    wrapper = self._wrap(label, original)
+            targets = namespaces = [cls]
+
+        for namespace in targets:
+            setattr(namespace, name, wrapper)
+        self._patches.append((namespaces, name, original, wrapper))
+
+    def _wrap(self, label: str, function: Callable) -> Callable:
+        counts = self._calls[label]
+
+        @wraps(function)
+        def wrapper(*args, **kwargs):
+            start = perf_counter()
+            try:
+                return function(*args, **kwargs)
+            finally:
+                counts[0] += 1
+                counts[1] += perf_counter() - start
+
+        return wrapper
+
+
+def _modules() -> list:
+    return [
+        module
+        for name, module in list(sys.modules.items())
+        if name.startswith(f'{__package__}.') and module is not None
+    ]
+
+
+def _namespaces() -> list:
+    return [sys.modules[__package__], *_modules()]
+
+
+def _get(namespace: object, name: str) -> object:
+    # Look in the namespace itself, so that e.g. the package's lazy
+    # `__getattr__` isn't triggered.
+    return vars(namespace).get(name)
+
+
+def _caches() -> dict[str, Any]:
+    # Every `functools.cache` (or `lru_cache`) defined at the top level of
+    # a loaded fugo module.
+    caches = {}
+    seen = set()
+    for module in _modules():
+        short = module.__name__.removeprefix(f'{__package__}.')
+        for name, value in vars(module).items():
+            if hasattr(value, 'cache_info') and id(value) not in seen:
+                seen.add(id(value))
+                caches[f'{short}.{name}'] = value
+    return caches
@@ -1,8 +1,11 @@
-__all__ = ['Interval']
+__all__ = ['Interval', 'Consonance', 'consonances']
 
+import sys
+from array import array
 from dataclasses import dataclass
 from enum import Enum, auto
-from typing import overload
+from functools import cache, lru_cache
+from typing import Iterable, overload
 
 
 class Size(Enum):
@@ -44,7 +47,18 @@ class Quality(Enum):
         return [*reversed(Quality)][index]
 
 
-@dataclass
+class Consonance(Enum):
+    # fmt: off
+    PERFECT    = 1
+    IMPERFECT  = 2
+    DISSONANT  = 3
+    # fmt: on
+
+    def __repr__(self):
+        return f'Consonance.{self.name}'
+
+
+@dataclass(frozen=True, slots=True, init=False)
 class Interval:
     """Represent the distance between two notes."""
 
@@ -52,21 +66,22 @@ class Interval:
     size: Size
 
     @overload
-    def __init__(self, interval: str, /): ...
+    def __new__(cls, interval: str, /) -> 'Interval': ...
 
     @overload
-    def __init__(self, quality: Quality, size: Size, /): ...
+    def __new__(cls, quality: Quality, size: Size, /) -> 'Interval': ...
 
-    def __init__(self, *args):
+    def __new__(cls, *args):
         match args:
             case str(),:
-                copy = self.from_string(*args)
+                return _parse(*args)
             case Quality(), Size():
-                copy = self.from_attrs(*args)
+                return cls.from_attrs(*args)
             case _:
                 raise ValueError('invalid arguments')
 
-        vars(self).update(vars(copy))
+    def __reduce__(self):
+        return _interval, (self.code,)
 
     def __repr__(self):
         string = str(self)
@@ -93,7 +108,7 @@ class Interval:
         return self.quality == other.quality and self.size == other.size
 
     def __hash__(self):
-        return self.quality.value + self.size.value
+        return self.code
 
     def __invert__(self):
         return self.from_attrs(~self.quality, ~self.size)
@@ -147,9 +162,9 @@ class Interval:
                 if size in (Size.SECOND, Size.THIRD, Size.SIXTH, Size.SEVENTH):
                     raise ValueError(f'invalid interval ({quality.name} {size.name})')
 
-        obj = super().__new__(cls)
-        obj.quality = quality
-        obj.size = size
+        obj = object.__new__(cls)
+        object.__setattr__(obj, 'quality', quality)
+        object.__setattr__(obj, 'size', size)
         return obj
 
     @classmethod
@@ -222,41 +237,159 @@ class Interval:
 
     @property
     def steps(self) -> int:
-        return {
-            # unisons
-            Interval('d1'): -1,
-            Interval('P1'): 0,
-            Interval('A1'): 1,
-            # seconds
-            Interval('d2'): 0,
-            Interval('m2'): 1,
-            Interval('M2'): 2,
-            Interval('A2'): 3,
-            # thirds
-            Interval('d3'): 2,
-            Interval('m3'): 3,
-            Interval('M3'): 4,
-            Interval('A3'): 5,
-            # fourths
-            Interval('d4'): 4,
-            Interval('P4'): 5,
-            Interval('A4'): 6,
-            # fifths
-            Interval('d5'): 6,
-            Interval('P5'): 7,
-            Interval('A5'): 8,
-            # sixths
-            Interval('d6'): 7,
-            Interval('m6'): 8,
-            Interval('M6'): 9,
-            Interval('A6'): 10,
-            # sevenths
-            Interval('d7'): 9,
-            Interval('m7'): 10,
-            Interval('M7'): 11,
-            Interval('A7'): 12,
-            # octaves
-            Interval('d8'): 11,
-            Interval('P8'): 12,
-            Interval('A8'): 13,
-        }[self]
+        return _STEPS[self]
+
+    @property
+    def code(self) -> int:
+        """Get a small integer that identifies the interval (see
+        `from_code`)."""
+        return self.quality.value * len(Size) + self.size.value
+
+    @classmethod
+    def from_code(cls, code: int) -> 'Interval':
+        """Initialize an `Interval` from its `code`."""
+        quality, size = divmod(code, len(Size))
+        return cls.from_attrs(Quality(quality), Size(size))
+
+    def consonance(self, *, bass: bool = True) -> Consonance:
+        """Classify the interval as a perfect consonance, an imperfect
+        consonance, or a dissonance.
+
+        args:
+            - `bass`: whether the lower note is in the bass
+
+        notes:
+            - unisons, fifths, and octaves are perfect consonances, and
+            major and minor thirds and sixths are imperfect consonances
+            - a perfect fourth is a dissonance above the bass, but a
+            perfect consonance between upper voices
+            - every other interval (including every augmented and
+            diminished interval) is a dissonance
+
+        examples:
+            >>> from fugo import Interval
+            >>> Interval('m6').consonance()
+            Consonance.IMPERFECT
+            >>> Interval('P4').consonance(), Interval('P4').consonance(bass=False)
+            (Consonance.DISSONANT, Consonance.PERFECT)
+        """
+        return _CONSONANCE[bass][self.code]
+
+
+@cache
+def _interval(code: int) -> Interval:
+    return Interval.from_code(code)
+
+
+# The same few interval strings are parsed over and over (by the `Mode`
+# and chord `Quality` tables, and throughout the analysis code), and
+# intervals are immutable, so share the results.
+@lru_cache(maxsize=1024)
+def _parse(interval: str) -> Interval:
+    return Interval.from_string(interval)
+
+
+# Number of semitones spanned by each (simple) interval.
+_STEPS = {
+    # unisons
+    Interval('d1'): -1,
+    Interval('P1'): 0,
+    Interval('A1'): 1,
+    # seconds
+    Interval('d2'): 0,
+    Interval('m2'): 1,
+    Interval('M2'): 2,
+    Interval('A2'): 3,
+    # thirds
+    Interval('d3'): 2,
+    Interval('m3'): 3,
+    Interval('M3'): 4,
+    Interval('A3'): 5,
+    # fourths
+    Interval('d4'): 4,
+    Interval('P4'): 5,
+    Interval('A4'): 6,
+    # fifths
+    Interval('d5'): 6,
+    Interval('P5'): 7,
+    Interval('A5'): 8,
+    # sixths
+    Interval('d6'): 7,
+    Interval('m6'): 8,
+    Interval('M6'): 9,
+    Interval('A6'): 10,
+    # sevenths
+    Interval('d7'): 9,
+    Interval('m7'): 10,
+    Interval('M7'): 11,
+    Interval('A7'): 12,
+    # octaves
+    Interval('d8'): 11,
+    Interval('P8'): 12,
+    Interval('A8'): 13,
+}
+
+
+def consonances(codes: Iterable[int], *, bass: bool = True) -> bytes:
+    """Classify many intervals at once (see `Interval.consonance`).
+
+    args:
+        - `codes`: `Interval.code` of each interval (e.g. the `codes` of a
+        `Packed` sequence of intervals)
+        - `bass`: whether the lower notes are in the bass
+
+    returns:
+        - `bytes` holding the `Consonance` value of each interval
+
+    notes:
+        - arrays and `memoryview`s are classified by `bytes.translate`,
+        without running any Python code per interval
+
+    examples:
+        >>> from fugo import Consonance, Interval, Packed, consonances
+        >>> intervals = Packed(Interval(i) for i in 'P8 M6 P4 m7 P5'.split())
+        >>> classes = consonances(intervals.codes)
+        >>> list(classes)
+        [1, 2, 3, 3, 1]
+        >>> classes.count(Consonance.DISSONANT.value)
+        2
+    """
+    if isinstance(codes, (array, memoryview)) and codes.itemsize > 1:
+        # Codes are less than 256, so only the lowest byte of each item
+        # is set.
+        width = codes.itemsize
+        low = 0 if sys.byteorder == 'little' else width - 1
+        data = codes.tobytes()[low::width]
+    else:
+        data = bytes(codes)
+
+    return data.translate(_TABLES[bass])
+
+
+def _classify(interval: Interval, bass: bool) -> Consonance:
+    match interval.quality, interval.size:
+        case Quality.PERFECT, Size.FOURTH:
+            return Consonance.DISSONANT if bass else Consonance.PERFECT
+        case Quality.PERFECT, _:
+            return Consonance.PERFECT
+        case Quality.MAJOR | Quality.MINOR, Size.THIRD | Size.SIXTH:
+            return Consonance.IMPERFECT
+        case _:
+            return Consonance.DISSONANT
+
+
+# Consonance of every interval, indexed by `bass` and then by code. Codes
+# of invalid intervals (e.g. a major fifth) map to `None` (or 0 in the
+# tables for `consonances`).
+_VALID = {interval.code for interval in _STEPS}
+_CONSONANCE = {
+    bass: tuple(
+        _classify(Interval.from_code(code), bass) if code in _VALID else None
+        for code in range(max(_VALID) + 1)
+    )
+    for bass in (False, True)
+}
+_TABLES = {
+    bass: bytes(c.value if c else 0 for c in table).ljust(256, b'\0')
+    for bass, table in _CONSONANCE.items()
+}
@@ -2,10 +2,14 @@ __all__ = ['Mode', 'Degree', 'Key']
 
 from dataclasses import dataclass
 from enum import Enum, auto
-from typing import overload
+from functools import cache
+from typing import TYPE_CHECKING, overload
 
 from fugo import Accidental, Interval, LetterName, NoteName
 
+if TYPE_CHECKING:
+    from fugo import Chord
+
 
 class Mode(Enum):
     parse = lambda s: tuple(Interval(i) for i in s.split())
@@ -68,7 +72,7 @@ class Degree(Enum):
         return degrees[i]
 
 
-@dataclass
+@dataclass(frozen=True, slots=True, init=False)
 class Key:
     """Represent a key."""
 
@@ -76,27 +80,31 @@ class Key:
     mode: Mode
 
     @overload
-    def __init__(self, key: str, /): ...
+    def __new__(cls, key: str, /) -> 'Key': ...
 
     @overload
-    def __init__(self, tonic: NoteName, mode: Mode, /): ...
+    def __new__(cls, tonic: NoteName, mode: Mode, /) -> 'Key': ...
 
-    def __init__(self, *args):
+    def __new__(cls, *args):
         match args:
             case str(),:
-                copy = self.from_string(*args)
+                return cls.from_string(*args)
             case NoteName(), Mode():
-                copy = self.from_attrs(*args)
+                return cls.from_attrs(*args)
             case _:
                 raise ValueError('invalid arguments')
 
-        vars(self).update(vars(copy))
+    def __reduce__(self):
+        return _key, (self.code,)
+
+    def __hash__(self):
+        return hash((self.tonic, self.mode))
 
     def __iter__(self):
-        return (self.tonic + interval for interval in self.mode.intervals)
+        return iter(_scale(self.tonic, self.mode))
 
     def __getitem__(self, degree: Degree) -> NoteName:
-        notes = [*self]
+        notes = _scale(self.tonic, self.mode)
         match degree:
             # fmt: off
             case Degree.TONIC:          return notes[0]
@@ -112,6 +120,46 @@ class Key:
             case _:
                 raise ValueError(f'unrecognized scale degree {degree!r}')
 
+    @property
+    def triads(self) -> tuple['Chord', ...]:
+        """Get the diatonic triads, starting on the tonic."""
+        return _chords(self.tonic, self.mode, 3)
+
+    @property
+    def sevenths(self) -> tuple['Chord', ...]:
+        """Get the diatonic seventh chords, starting on the tonic."""
+        return _chords(self.tonic, self.mode, 4)
+
+    def numeral(self, chord: 'Chord') -> str | None:
+        """Return the Roman numeral of a chord in this key.
+
+        args:
+            - `chord`: chord to analyze
+
+        returns:
+            - Roman numeral of `chord` (e.g. 'ii', 'V7', 'V7/V'), or
+            - `None` if `chord` isn't diatonic or an applied dominant
+
+        notes:
+            - in minor keys, the dominant (V, V7) and leading-tone (viiº,
+            viiº7) chords of the harmonic minor scale are also diatonic
+            - inversions are ignored (use `Chord.figures` to label them)
+            - applied dominants are the major triads and dominant
+            sevenths built a perfect fifth above each major or minor
+            triad other than the tonic
+
+        examples:
+            >>> from fugo import Chord, Key
+            >>> Key('C').numeral(Chord('Dm7'))
+            'ii7'
+            >>> Key('C').numeral(Chord('A7/C#'))
+            'V7/ii'
+            >>> Key('c').numeral(Chord('Ab'))
+            'VI'
+        """
+        table = _numerals(self.tonic, self.mode)
+        return table.get((chord.root, tuple(chord.quality)))
+
     @classmethod
     def from_string(cls, name: str) -> 'Key':
         rest = name.strip()
@@ -151,7 +199,109 @@ class Key:
 
     @classmethod
     def from_attrs(cls, tonic: NoteName, mode: Mode) -> 'Key':
-        key = super().__new__(cls)
-        key.tonic = tonic
-        key.mode = mode
+        key = object.__new__(cls)
+        object.__setattr__(key, 'tonic', tonic)
+        object.__setattr__(key, 'mode', mode)
         return key
+
+    @property
+    def code(self) -> int:
+        """Get a small integer that identifies the key (see
+        `from_code`)."""
+        return self.tonic.code * len(_MODES) + _MODES.index(self.mode)
+
+    @classmethod
+    def from_code(cls, code: int) -> 'Key':
+        """Initialize a `Key` from its `code`."""
+        tonic, mode = divmod(code, len(_MODES))
+        return cls.from_attrs(NoteName.from_code(tonic), _MODES[mode])
+
+
+_MODES = tuple(Mode)
+
+
+@cache
+def _key(code: int) -> Key:
+    return Key.from_code(code)
+
+
+# Scales and harmony tables depend only on the tonic and mode, so they
+# are computed once per key and shared by every `Key` object.
+@cache
+def _scale(tonic: NoteName, mode: Mode) -> tuple[NoteName, ...]:
+    return tuple(tonic + interval for interval in mode.intervals)
+
+
+@cache
+def _chords(tonic: NoteName, mode: Mode, size: int) -> tuple['Chord', ...]:
+    from fugo.chord import Chord, Quality
+
+    qualities = {tuple(quality): quality for quality in Quality}
+    scale = _scale(tonic, mode)
+
+    chords = []
+    for i, root in enumerate(scale):
+        members = [scale[(i + 2 * j) % len(scale)] for j in range(size)]
+        intervals = (Interval('P1'), *(member - root for member in members[1:]))
+        chords.append(Chord.from_attrs(root, qualities[intervals]))
+
+    return tuple(chords)
+
+
+@cache
+def _numerals(tonic: NoteName, mode: Mode) -> dict[tuple, str]:
+    from fugo.chord import Chord, Quality
+
+    # fmt: off
+    suffixes = {
+        'MAJOR':      ('upper', ''),
+        'MINOR':      ('lower', ''),
+        'DIMINISHED': ('lower', 'º'),
+        'AUGMENTED':  ('upper', '+'),
+        'MAJ_MIN_7':  ('upper', '7'),
+        'MAJ_7':      ('upper', 'M7'),
+        'MIN_7':      ('lower', '7'),
+        'MIN_MAJ_7':  ('lower', 'M7'),
+        'DIM_7':      ('lower', 'º7'),
+        'HALF_DIM_7': ('lower', 'ø7'),
+    }
+    # fmt: on
+    numerals = ['I', 'II', 'III', 'IV', 'V', 'VI', 'VII']
+
+    def numeral(degree: int, quality: Quality) -> str:
+        # `Quality` members are lists, so they can't be dict keys.
+        case, suffix = suffixes[quality.name]
+        roman = numerals[degree]
+        return (roman if case == 'upper' else roman.lower()) + suffix
+
+    table = {}
+    triads = _chords(tonic, mode, 3)
+    for degree, chord in enumerate(triads + _chords(tonic, mode, 4)):
+        degree %= len(triads)
+        table[chord.root, tuple(chord.quality)] = numeral(degree, chord.quality)
+
+    # Minor keys also use the dominant and leading-tone chords of the
+    # harmonic minor scale.
+    if mode is Mode.MINOR:
+        dominant = tonic + Interval('P5')
+        leading_tone = tonic - Interval('m2')
+        for degree, root, quality in (
+            (4, dominant, Quality.MAJOR),
+            (4, dominant, Quality.MAJ_MIN_7),
+            (6, leading_tone, Quality.DIMINISHED),
+            (6, leading_tone, Quality.DIM_7),
+        ):
+            table[root, tuple(quality)] = numeral(degree, quality)
+
+    for degree, chord in enumerate(triads):
+        if degree == 0 or chord.quality not in (Quality.MAJOR, Quality.MINOR):
+            continue
+        root = chord.root + Interval('P5')
+        target = numeral(degree, chord.quality)
+        for quality in (Quality.MAJOR, Quality.MAJ_MIN_7):
+            applied = Chord.from_attrs(root, quality)
+            key = applied.root, tuple(applied.quality)
+            # Diatonic chords keep their diatonic names.
+            table.setdefault(key, f'{numeral(4, quality)}/{target}')
+
+    return table
@@ -0,0 +1,188 @@
+__all__ = ['ChordModel']
+
+import random
+from bisect import bisect_right
+from collections import Counter
+from itertools import accumulate
+from typing import Hashable, Iterable, Sequence
+
+from fugo import Chord, Key
+
+
+Piece = tuple[Sequence[Chord], Key]
+
+# Token for "before the first chord" in a context.
+_START = -1
+
+
+class ChordModel:
+    """Model chord progressions as an n-gram Markov chain.
+
+    Chords are stored relative to the key of their piece (by the interval
+    from the tonic to the root, the quality, and the inversion), so
+    progressions learned in one key can be sampled in any other.
+
+    notes:
+        - each distinct chord is interned as a small integer, and
+        counts are stored sparsely: one `Counter` of following chords
+        per observed context
+        - contexts shorter than `order - 1` chords are counted too, so
+        sampling backs off to shorter contexts when a longer one was
+        never observed
+    """
+
+    def __init__(self, order: int = 2):
+        if order < 1:
+            raise ValueError(f'invalid order: {order}')
+
+        self.order = order
+        self._tokens: list[Hashable] = []
+        self._ids: dict[Hashable, int] = {}
+        self._counts: dict[tuple[int, ...], Counter[int]] = {}
+        self._distributions: dict[tuple[int, ...], tuple[list[int], list[int]]] = {}
+
+    def __len__(self):
+        """Return the number of distinct chords seen."""
+        return len(self._tokens)
+
+    def train(self, pieces: Iterable[Piece], *, processes: int | None = None) -> None:
+        """Count the progressions in some pieces.
+
+        args:
+            - `pieces`: `(chords, key)` pairs
+            - `processes`: number of worker processes (count in this
+            process if `None`)
+
+        notes:
+            - with `processes`, pieces are counted in parallel and the
+            per-worker counts are merged afterwards; this requires
+            `pieces` (and their chords) to be picklable
+        """
+        if processes is None:
+            self._merge(_count(list(pieces), self.order))
+            return
+
+        # Only import multiprocessing (which is slow to import) when it
+        # is used; `spell_voices` does the same.
+        from multiprocessing import Pool
+
+        pieces = list(pieces)
+        size = max(1, -(-len(pieces) // processes))
+        chunks = [pieces[i : i + size] for i in range(0, len(pieces), size)]
+
+        with Pool(processes) as pool:
+            results = pool.starmap(_count, [(chunk, self.order) for chunk in chunks])
+
+        for counts in results:
+            self._merge(counts)
+
+    def probability(self, chord: Chord, context: Sequence[Chord], key: Key) -> float:
+        """Return the probability of `chord` following `context` in `key`.
+
+        notes:
+            - only the last `order - 1` chords of `context` are used; a
+            shorter `context` uses the counts for contexts of that length
+            - no backoff is applied (unseen contexts have probability 0)
+        """
+        ids = self._context([_token(c, key) for c in context])
+        if ids is None or (token := self._ids.get(_token(chord, key))) is None:
+            return 0.0
+
+        counts = self._counts.get(ids)
+        if not counts:
+            return 0.0
+        return counts[token] / counts.total()
+
+    def sample(
+        self, length: int, key: Key, *, rng: random.Random | None = None
+    ) -> list[Chord]:
+        """Generate a progression.
+
+        args:
+            - `length`: number of chords
+            - `key`: key of the progression
+            - `rng`: source of randomness (the `random` module if `None`)
+
+        returns:
+            - list of `length` `Chord`s
+        """
+        if not self._counts:
+            raise ValueError('the model has not been trained')
+
+        uniform = rng.random if rng is not None else random.random
+        history = [_START] * (self.order - 1)
+        chords = []
+
+        for _ in range(length):
+            for start in range(len(history) + 1):
+                context = tuple(history[start:])
+                if context in self._counts:
+                    break
+
+            tokens, cumulative = self._distribution(context)
+            i = bisect_right(cumulative, uniform() * cumulative[-1])
+            token = tokens[i]
+
+            chords.append(_chord(self._tokens[token], key))
+            if history:
+                history = history[1:] + [token]
+
+        return chords
+
+    def _distribution(self, context: tuple[int, ...]) -> tuple[list[int], list[int]]:
+        # Cumulative counts are built once per context and reused until
+        # the model is trained again.
+        if context not in self._distributions:
+            counts = self._counts[context]
+            tokens = list(counts)
+            self._distributions[context] = tokens, list(
+                accumulate(counts[t] for t in tokens)
+            )
+        return self._distributions[context]
+
+    def _context(self, tokens: list[Hashable]) -> tuple[int, ...] | None:
+        tokens = tokens[-(self.order - 1) :] if self.order > 1 else []
+        ids = []
+        for token in tokens:
+            if (i := self._ids.get(token)) is None:
+                return None
+            ids.append(i)
+        return tuple(ids)
+
+    def _intern(self, token: Hashable) -> int:
+        if (i := self._ids.get(token)) is None:
+            i = self._ids[token] = len(self._tokens)
+            self._tokens.append(token)
+        return i
+
+    def _merge(self, counts: dict[tuple, Counter]) -> None:
+        # Workers count raw tokens, since their integer ids would not
+        # agree; intern them here.
+        self._distributions.clear()
+        for context, following in counts.items():
+            ids = tuple(_START if t is None else self._intern(t) for t in context)
+            target = self._counts.setdefault(ids, Counter())
+            for token, n in following.items():
+                target[self._intern(token)] += n
+
+
+def _count(pieces: Sequence[Piece], order: int) -> dict[tuple, Counter]:
+    counts: dict[tuple, Counter] = {}
+    for chords, key in pieces:
+        history = [None] * (order - 1)
+        for chord in chords:
+            token = _token(chord, key)
+            for start in range(len(history) + 1):
+                counts.setdefault(tuple(history[start:]), Counter())[token] += 1
+            if history:
+                history = history[1:] + [token]
+    return counts
+
+
+def _token(chord: Chord, key: Key) -> tuple:
+    return chord.root - key.tonic, tuple(chord.quality), chord.inversion
+
+
+def _chord(token: tuple, key: Key) -> Chord:
+    interval, quality, inversion = token
+    return Chord.from_attrs(key.tonic + interval, list(quality), inversion)
@@ -0,0 +1,442 @@
+__all__ = ['Melody', 'Features', 'extract_features']
+
+from array import array
+from fractions import Fraction
+from typing import Iterable, Iterator, NamedTuple, Sequence
+
+from fugo import Direction, Duration, Interval, LetterName, Note, Packed, distance
+
+
+class Features(NamedTuple):
+    """Describe a melody (see `Melody.features`).
+
+    attributes:
+        - `intervals`: `distance` between each pair of adjacent notes
+        - `contour`: `Direction.from_notes` of each pair of adjacent notes
+        - `lowest`, `highest`: lowest and highest notes (`None` if the
+        melody is empty)
+        - `histogram`: number of notes of each pitch class (C = 0)
+        - `leaps`: number of moves larger than a step (a second)
+    """
+
+    intervals: tuple[Interval, ...]
+    contour: tuple[Direction, ...]
+    lowest: Note | None
+    highest: Note | None
+    histogram: tuple[int, ...]
+    leaps: int
+
+
+class Melody:
+    """Transform a melody lazily.
+
+    args:
+        - `notes`: notes of the melody (e.g. a `list`, a `Packed` voice,
+        a `VoiceView`, or an iterator)
+        - `durations`: duration of each note (optional)
+
+    notes:
+        - `transpose`, `invert`, `retrograde`, `augment`, and `diminish`
+        return a new `Melody` without touching any notes; `notes`,
+        `durations`, `pack`, and iteration apply every step in a single
+        pass
+        - transpositions and inversions are spelled as by `Note.__add__`
+        and `Note.__sub__`; a chain of them is combined into a single
+        mapping of each distinct note, so a long voice costs about one
+        dictionary lookup per note
+        - only the final notes must be spellable, so e.g. transposing
+        up and back down by an augmented interval always succeeds
+        - notes (and durations) given as an iterator are read into a
+        `list` when the melody is built
+        - `melody[i]` transforms only the `i`th note
+        - `features` (and `intervals`, `contour`, `range`, `histogram`,
+        and `leaps`) are computed together, in one pass, the first time
+        one is needed; `append`, `extend`, and item assignment clear
+        them
+        - a melody copies its notes before changing them, so the list it
+        was built from (and melodies derived from it) are unaffected;
+        changes made to that list directly aren't seen by the cache
+
+    examples:
+        >>> from fugo import Duration, Interval, Melody, Note
+        >>> subject = Melody(
+        ...     [Note(n) for n in 'C4 D4 Eb4 G4'.split()],
+        ...     [Duration(1, 4), Duration(1, 8), Duration(1, 8), Duration(1, 2)],
+        ... )
+        >>> answer = subject.transpose(Interval('P5')).invert(around=Note('G4'))
+        >>> answer.notes()
+        [Note('G4'), Note('F4'), Note('E4'), Note('C4')]
+        >>> answer.retrograde().augment(2).durations()
+        [Duration(1, 1), Duration(1, 4), Duration(1, 4), Duration(1, 2)]
+    """
+
+    def __init__(
+        self,
+        notes: Iterable[Note],
+        durations: Iterable[Duration] | None = None,
+    ):
+        # Read iterators now, so that the melody can be read many times.
+        self._notes = _sequence(notes)
+        self._durations = None if durations is None else _sequence(durations)
+        self._steps: tuple[tuple, ...] = ()
+        self._reversed = False
+        self._factor = Fraction(1)
+        self._owned = False
+        self._features: Features | None = None
+
+    def __iter__(self) -> Iterator[Note]:
+        mapping, notes, codes = self._plan()
+        if codes is not None:
+            return map(Note.decode, map(mapping.code, codes))
+        return map(mapping.note, notes)
+
+    def __len__(self) -> int:
+        return len(self._notes)
+
+    def __getitem__(self, index: int) -> Note:
+        mapping, notes, codes = self._fold()
+        if self._reversed:
+            index = -1 - index
+        if codes is not None:
+            return Note.decode(mapping.code(codes[index]))
+        return mapping.note(notes[index])
+
+    def __setitem__(self, index: int, note: Note):
+        self._own()
+        self._notes[index] = note
+
+    def append(self, note: Note, duration: Duration | None = None) -> None:
+        """Add a note (with its duration, if the melody has durations)."""
+        self.extend([note], None if duration is None else [duration])
+
+    def extend(
+        self, notes: Iterable[Note], durations: Iterable[Duration] | None = None
+    ) -> None:
+        """Add some notes (with their durations, if the melody has
+        durations)."""
+        if (durations is None) != (self._durations is None):
+            raise ValueError('give durations if (and only if) the melody has them')
+
+        notes = list(notes)
+        if durations is not None:
+            durations = list(durations)
+            if len(durations) != len(notes):
+                raise ValueError('notes and durations must have the same length')
+
+        self._own()
+        self._notes.extend(notes)
+        if durations is not None:
+            self._durations.extend(durations)
+
+    @property
+    def features(self) -> Features:
+        """Get the melody's `Features`, computing them if needed."""
+        if self._features is None:
+            self._features = _extract(self, {}, {})
+        return self._features
+
+    @property
+    def intervals(self) -> tuple[Interval, ...]:
+        return self.features.intervals
+
+    @property
+    def contour(self) -> tuple[Direction, ...]:
+        return self.features.contour
+
+    @property
+    def range(self) -> tuple[Note, Note] | None:
+        """Get the lowest and highest notes (`None` if there are none)."""
+        features = self.features
+        if features.lowest is None:
+            return None
+        return features.lowest, features.highest
+
+    @property
+    def histogram(self) -> tuple[int, ...]:
+        return self.features.histogram
+
+    @property
+    def leaps(self) -> int:
+        return self.features.leaps
+
+    def transpose(self, interval: Interval, *, down: bool = False) -> 'Melody':
+        """Transpose the melody up (or down) by `interval`."""
+        return self._then(('transpose', interval, down))
+
+    def invert(self, around: Note | None = None) -> 'Melody':
+        """Invert the melody around a note (by default, its first note)."""
+        return self._then(('invert', around))
+
+    def retrograde(self) -> 'Melody':
+        """Reverse the melody."""
+        melody = self._then(('retrograde',))
+        melody._reversed = not self._reversed
+        return melody
+
+    def augment(self, factor: int | Fraction = 2) -> 'Melody':
+        """Multiply the durations of the melody by `factor`."""
+        if self._durations is None:
+            raise ValueError('melody has no durations')
+        melody = self._then()
+        melody._factor = self._factor * factor
+        return melody
+
+    def diminish(self, factor: int | Fraction = 2) -> 'Melody':
+        """Divide the durations of the melody by `factor`."""
+        return self.augment(1 / Fraction(factor))
+
+    def notes(self) -> list[Note]:
+        """Return the transformed notes."""
+        return list(self)
+
+    def durations(self) -> list[Duration]:
+        """Return the transformed durations."""
+        if self._durations is None:
+            raise ValueError('melody has no durations')
+
+        durations = self._durations
+        if self._reversed:
+            durations = reversed(durations)
+        if self._factor == 1:
+            return list(durations)
+
+        # Melodies use few distinct durations, so scale each only once.
+        scaled = {}
+        factor = self._factor
+        result = []
+        for duration in durations:
+            if duration not in scaled:
+                scaled[duration] = duration * factor
+            result.append(scaled[duration])
+        return result
+
+    def pack(self) -> Packed[Note]:
+        """Return the transformed notes as a `Packed` voice.
+
+        notes:
+            - if the melody was built from a `Packed` voice or a
+            `VoiceView`, this works on their codes without creating any
+            `Note`s
+        """
+        mapping, notes, codes = self._plan()
+        if codes is None:
+            codes = (_code(note) for note in notes)
+        return Packed.from_codes(Note, array('h', map(mapping.code, codes)))
+
+    def _then(self, *steps: tuple) -> 'Melody':
+        melody = object.__new__(Melody)
+        melody._notes = self._notes
+        melody._durations = self._durations
+        melody._steps = self._steps + steps
+        melody._reversed = self._reversed
+        melody._factor = self._factor
+        melody._owned = False
+        melody._features = None
+
+        # Both melodies now share the notes, so neither may change them.
+        self._owned = False
+        return melody
+
+    def _own(self) -> None:
+        # Apply any pending steps to a private copy of the notes (and
+        # durations), before they are changed.
+        if not self._owned:
+            notes = self.notes()
+            durations = None if self._durations is None else self.durations()
+            self._notes, self._durations = notes, durations
+            self._steps, self._reversed, self._factor = (), False, Fraction(1)
+            self._owned = True
+        self._features = None
+
+    def _plan(self) -> tuple['_Mapping', Iterable[Note], Iterable[int] | None]:
+        # Put the source (or its codes, if it has any) in order.
+        mapping, notes, codes = self._fold()
+        if self._reversed:
+            if codes is not None:
+                codes = codes[::-1]
+            else:
+                notes = reversed(notes)
+        return mapping, notes, codes
+
+    def _fold(self) -> tuple['_Mapping', Sequence[Note], Sequence[int] | None]:
+        # Combine the steps into one mapping. Only a default axis depends
+        # on the order of the steps: it is the source's last note if the
+        # melody was reversed (an odd number of times) before inverting.
+        notes = self._notes
+        codes = getattr(notes, 'codes', None)
+        backwards = False
+
+        mapping = _Mapping()
+        for step in self._steps:
+            match step:
+                case ('retrograde',):
+                    backwards = not backwards
+                case 'transpose', interval, down:
+                    mapping = mapping.transpose(interval, down)
+                case 'invert', around:
+                    if around is None:
+                        if not len(notes):
+                            continue
+                        around = mapping.note(notes[-1 if backwards else 0])
+                    mapping = mapping.invert(around)
+
+        return mapping, notes, codes
+
+
+def extract_features(melodies: Iterable[Iterable[Note]]) -> list[Features]:
+    """Compute the `Features` of many melodies.
+
+    args:
+        - `melodies`: `Melody`s (or sequences of notes)
+
+    returns:
+        - `Features` of each melody
+
+    notes:
+        - each note is read once, and the work for each distinct note
+        (and each distinct pair of adjacent notes) is shared by the
+        whole corpus
+        - features are cached on `Melody`s, as by `Melody.features`
+
+    examples:
+        >>> from fugo import Melody, Note, extract_features
+        >>> melodies = [
+        ...     Melody([Note(n) for n in 'C4 E4 D4 C4'.split()]),
+        ...     [Note(n) for n in 'G4 G4 C5'.split()],
+        ... ]
+        >>> [features.leaps for features in extract_features(melodies)]
+        [1, 1]
+    """
+    notes: dict[Note, tuple] = {}
+    steps: dict[tuple[Note, Note], tuple] = {}
+
+    result = []
+    for melody in melodies:
+        if isinstance(melody, Melody):
+            if melody._features is None:
+                melody._features = _extract(melody, notes, steps)
+            result.append(melody._features)
+        else:
+            result.append(_extract(melody, notes, steps))
+    return result
+
+
+def _extract(
+    melody: Iterable[Note],
+    notes: dict[Note, tuple],
+    steps: dict[tuple[Note, Note], tuple],
+) -> Features:
+    # `notes` and `steps` remember the work done for each distinct note
+    # and pair of notes.
+    intervals, contour = [], []
+    histogram = [0] * 12
+    leaps = 0
+    lowest = highest = previous = None
+    low = high = None
+
+    for note in melody:
+        try:
+            order, pitch_class = notes[note]
+        except KeyError:
+            order = (note.octave, note.letter.steps_above_C, note.accidental.offset)
+            pitch_class = note.pitch % 12
+            notes[note] = order, pitch_class
+
+        histogram[pitch_class] += 1
+        if lowest is None:
+            lowest = highest = note
+            low = high = order
+        elif order < low:
+            lowest, low = note, order
+        elif order > high:
+            highest, high = note, order
+
+        if previous is not None:
+            pair = previous, note
+            try:
+                interval, direction, leap = steps[pair]
+            except KeyError:
+                interval = distance(previous, note)
+                direction = Direction.from_notes(previous, note)
+                leap = abs(note.diatonic - previous.diatonic) > 1
+                steps[pair] = interval, direction, leap
+
+            intervals.append(interval)
+            contour.append(direction)
+            leaps += leap
+        previous = note
+
+    return Features(
+        tuple(intervals), tuple(contour), lowest, highest, tuple(histogram), leaps
+    )
+
+
+class _Mapping:
+    # Map each note to `(sign * diatonic + shift, sign * pitch + offset)`,
+    # remembering the result for each distinct note. Transpositions
+    # change `shift` and `offset`; inversions negate everything.
+
+    def __init__(self, sign: int = 1, shift: int = 0, offset: int = 0):
+        self.sign = sign
+        self.shift = shift
+        self.offset = offset
+        self._notes: dict[Note, Note] = {}
+        self._codes: dict[int, int] = {}
+
+    def transpose(self, interval: Interval, down: bool) -> '_Mapping':
+        direction = -1 if down else 1
+        return _Mapping(
+            self.sign,
+            self.shift + direction * interval.size.value,
+            self.offset + direction * interval.steps,
+        )
+
+    def invert(self, around: Note) -> '_Mapping':
+        return _Mapping(
+            -self.sign,
+            2 * around.diatonic - self.shift,
+            2 * around.pitch - self.offset,
+        )
+
+    def code(self, code: int) -> int:
+        try:
+            return self._codes[code]
+        except KeyError:
+            pass
+
+        diatonic, accidental = divmod(code, 5)
+        pitch = _natural(diatonic) + accidental - 2
+        diatonic = self.sign * diatonic + self.shift
+        accidental = self.sign * pitch + self.offset - _natural(diatonic)
+        if not -2 <= accidental <= 2:
+            raise ValueError(f'cannot spell {Note.decode(code)} after transformation')
+
+        result = self._codes[code] = diatonic * 5 + accidental + 2
+        return result
+
+    def note(self, note: Note) -> Note:
+        try:
+            return self._notes[note]
+        except KeyError:
+            pass
+
+        result = self._notes[note] = Note.decode(self.code(_code(note)))
+        return result
+
+
+# Semitones above C of each letter, in order.
+_STEPS = tuple(letter.steps_above_C for letter in LetterName)
+
+
+def _natural(diatonic: int) -> int:
+    # Pitch of the unaltered note `diatonic` letter-name steps above C-1.
+    octave, letter = divmod(diatonic, 7)
+    return octave * 12 + _STEPS[letter]
+
+
+def _code(note: Note) -> int:
+    return note.code
+
+
+def _sequence(items: Iterable) -> Sequence:
+    return items if isinstance(items, Sequence) else list(items)
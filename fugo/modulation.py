@@ -0,0 +1,280 @@
+__all__ = ['track_keys', 'find_keys']
+
+from functools import cache
+from typing import Iterable, Sequence
+
+from fugo import Accidental, Chord, Duration, Key, LetterName, Mode, Note, NoteName
+
+
+def track_keys(
+    chords: Sequence[Chord],
+    *,
+    modes: Iterable[Mode] = tuple(Mode),
+    chromatic: float = 2.0,
+    tonic: float = 1.0,
+    modulation: float = 1.5,
+    distance: float = 0.5,
+    mode_change: float = 0.5,
+) -> list[Key]:
+    """Label the local key of each chord in a progression.
+
+    args:
+        - `chords`: chords to label
+        - `modes`: modes to consider (defaults to all seven)
+        - `chromatic`: cost of each chord member outside the key
+        - `tonic`: reward for a chord built on the key's tonic
+        - `modulation`: cost of changing key
+        - `distance`: additional cost of a key change for each step
+        between key signatures on the circle of fifths
+        - `mode_change`: additional cost of a key change that changes
+        the mode
+
+    returns:
+        - list with one `Key` per chord
+
+    notes:
+        - this is a hidden Markov model decoded with the Viterbi
+        algorithm; the returned keys minimize the total cost of the
+        path
+        - transitions between all pairs of keys are never enumerated:
+        since the cost of a key change is linear in the distance
+        between key signatures, the cheapest predecessor of every key
+        is found with two sweeps along the circle of fifths, so each
+        chord costs O(keys) rather than O(keys²)
+        - in CPython, that is about 0.15 ms per chord with two modes
+        (0.5 ms with all seven), so a corpus of 10,000 chords takes
+        seconds rather than milliseconds
+
+    examples:
+        >>> from fugo import Chord, Mode, track_keys
+        >>> chords = [Chord(c) for c in 'C F G7 C D7 G Am D7 G'.split()]
+        >>> keys = track_keys(chords, modes=[Mode.MAJOR, Mode.MINOR])
+        >>> print(*(f'{k.tonic}{k.mode.name[:3].lower()}' for k in keys))
+        Cmaj Cmaj Cmaj Cmaj Gmaj Gmaj Gmaj Gmaj Gmaj
+    """
+    if not chords:
+        return []
+
+    modes = tuple(dict.fromkeys(modes))
+    keys, signatures = _keys(modes)
+    modes_of = [key.mode for key in keys]
+    n = len(keys)
+
+    # Visit keys in circle-of-fifths order, both all together and
+    # separately for each mode.
+    everything = sorted(range(n), key=signatures.__getitem__)
+    by_mode: dict[Mode, list[int]] = {}
+    for i in everything:
+        by_mode.setdefault(modes_of[i], []).append(i)
+
+    def emissions(chord: Chord) -> list[float]:
+        return _emissions(chord.root, tuple(chord.quality), modes, chromatic, tonic)
+
+    costs = emissions(chords[0])
+    pointers: list[list[int]] = []
+
+    for chord in chords[1:]:
+        near_all = _sweep(everything, signatures, costs, distance)
+        near_mode = [0.0] * n, [0] * n
+        for group in by_mode.values():
+            values, args = _sweep(group, signatures, costs, distance)
+            for i in group:
+                near_mode[0][i], near_mode[1][i] = values[i], args[i]
+
+        step = []
+        new_costs = []
+        for i, emission in enumerate(emissions(chord)):
+            best, arg = costs[i], i
+            if (c := near_mode[0][i] + modulation) < best:
+                best, arg = c, near_mode[1][i]
+            if (c := near_all[0][i] + modulation + mode_change) < best:
+                best, arg = c, near_all[1][i]
+            new_costs.append(best + emission)
+            step.append(arg)
+
+        pointers.append(step)
+        costs = new_costs
+
+    state = min(range(n), key=costs.__getitem__)
+    path = [state]
+    for step in reversed(pointers):
+        state = step[state]
+        path.append(state)
+
+    return [keys[i] for i in reversed(path)]
+
+
+def find_keys(
+    notes: Sequence[Note],
+    durations: Sequence[Duration] | None = None,
+    *,
+    window: int = 8,
+) -> list[Key]:
+    """Estimate the key of each passage of a melody.
+
+    args:
+        - `notes`: notes of the melody
+        - `durations`: length of each note (all equal if omitted)
+        - `window`: number of notes in each passage
+
+    returns:
+        - list with the most likely major or minor `Key` for each
+        window of `window` consecutive notes (or a single `Key` if the
+        melody is shorter than `window`)
+
+    notes:
+        - uses the Krumhansl-Schmuckler algorithm: the duration-weighted
+        pitch-class distribution of each window is correlated with the
+        Krumhansl-Kessler profiles of all 24 major and minor keys
+        - sliding the window only adds the entering note to and removes
+        the leaving note from the running correlations, so the whole
+        melody takes O(len(notes)) time
+
+    examples:
+        >>> from fugo import Note, find_keys
+        >>> melody = [Note(n) for n in 'G4 A4 B4 C5 D5 E5 F#5 G5'.split()]
+        >>> keys = find_keys(melody, window=8)
+        >>> [str(key.tonic) for key in keys], keys[0].mode.name
+        (['G'], 'MAJOR')
+    """
+    if durations is None:
+        durations = [Duration.QUARTER] * len(notes)
+    if len(durations) != len(notes):
+        raise ValueError('notes and durations must have the same length')
+    if window < 1:
+        raise ValueError(f'invalid window size: {window}')
+    if not notes:
+        return []
+
+    classes = [note.pitch % 12 for note in notes]
+    weights = [float(duration) for duration in durations]
+
+    # The profiles are centred and normalized, so each key's correlation
+    # with the window's pitch-class histogram is proportional to the
+    # dot product of the two. Only the dot products need to be kept.
+    dots = [0.0] * len(_PROFILES)
+
+    def add(pc: int, weight: float):
+        for k, profile in enumerate(_PROFILES):
+            dots[k] += weight * profile[pc]
+
+    def best() -> Key:
+        k = max(range(len(dots)), key=dots.__getitem__)
+        return _PROFILE_KEYS[k]
+
+    keys = []
+    for i, (pc, weight) in enumerate(zip(classes, weights)):
+        add(pc, weight)
+        if i >= window:
+            add(classes[i - window], -weights[i - window])
+        if i >= window - 1:
+            keys.append(best())
+
+    if not keys:
+        keys.append(best())
+
+    return keys
+
+
+def _sweep(
+    order: list[int], positions: list[int], values: list[float], weight: float
+) -> tuple[list[float], list[int]]:
+    """Compute min_j(values[j] + weight * |positions[i] - positions[j]|).
+
+    `order` lists the points to consider, sorted by position. Returns
+    the minimum and the minimizing point for each point in `order`.
+    """
+    best = [0.0] * len(values)
+    args = [0] * len(values)
+
+    for sweep in (order, order[::-1]):
+        carry, arg, last = None, 0, 0
+        for i in sweep:
+            if carry is not None:
+                carry += weight * abs(positions[i] - last)
+            if carry is None or values[i] <= carry:
+                carry, arg = values[i], i
+            last = positions[i]
+
+            if sweep is order or carry < best[i]:
+                best[i], args[i] = carry, arg
+
+    return best, args
+
+
+@cache
+def _keys(modes: tuple[Mode, ...]) -> tuple[list[Key], list[int]]:
+    names = [NoteName.from_attrs(n, a) for n in LetterName for a in Accidental]
+
+    keys = []
+    signatures = []
+    for tonic in names:
+        for mode in modes:
+            key = Key.from_attrs(tonic, mode)
+            try:
+                scale = [*key]
+            except ValueError:
+                # Skip keys (e.g. Fb locrian) whose scales need
+                # accidentals beyond double sharps and double flats.
+                continue
+
+            # The notes of a scale with k sharps occupy positions k - 1
+            # to k + 5 on the line of fifths (F = -1, C = 0, G = 1...).
+            total = sum(name.fifths for name in scale)
+            keys.append(key)
+            signatures.append((total - 14) // 7)
+
+    return keys, signatures
+
+
+@cache
+def _emissions(
+    root: NoteName,
+    quality: tuple,
+    modes: tuple[Mode, ...],
+    chromatic: float,
+    tonic: float,
+) -> list[float]:
+    # Chords recur constantly within a piece, so each distinct chord's
+    # emission costs are computed once.
+    chord = Chord.from_attrs(root, list(quality))
+    keys, _ = _keys(modes)
+
+    costs = []
+    for key in keys:
+        scale = set(key)
+        missing = sum(name not in scale for name in chord.note_names)
+        bonus = tonic if root == key.tonic else 0.0
+        costs.append(chromatic * missing - bonus)
+
+    return costs
+
+
+# Krumhansl-Kessler key profiles, starting on the tonic.
+# fmt: off
+_MAJOR = (6.35, 2.23, 3.48, 2.33, 4.38, 4.09, 2.52, 5.19, 2.39, 3.66, 2.29, 2.88)
+_MINOR = (6.33, 2.68, 3.52, 5.38, 2.60, 3.53, 2.54, 4.75, 3.98, 2.69, 3.34, 3.17)
+# fmt: on
+
+
+def _normalize(profile: tuple[float, ...], tonic: int) -> tuple[float, ...]:
+    # Rotate a profile to start on `tonic`, then centre and scale it so
+    # that a dot product with it gives a (scaled) correlation.
+    rotated = [profile[(pc - tonic) % 12] for pc in range(12)]
+    mean = sum(rotated) / 12
+    centred = [x - mean for x in rotated]
+    norm = sum(x * x for x in centred) ** 0.5
+    return tuple(x / norm for x in centred)
+
+
+_PROFILES = [_normalize(_MAJOR, t) for t in range(12)] + [
+    _normalize(_MINOR, t) for t in range(12)
+]
+_PROFILE_KEYS = [
+    Key.from_attrs(NoteName(name), mode)
+    for mode, names in (
+        (Mode.MAJOR, 'C Db D Eb E F F# G Ab A Bb B'),
+        (Mode.MINOR, 'C C# D Eb E F F# G G# A Bb B'),
+    )
+    for name in names.split()
+]
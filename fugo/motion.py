@@ -1,4 +1,4 @@
-__all__ = ['Motion', 'analyze_motion']
+__all__ = ['Motion', 'Direction', 'analyze_motion']
 
 from enum import Enum, auto
 from itertools import pairwise
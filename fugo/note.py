@@ -2,7 +2,7 @@ __all__ = ['LetterName', 'Accidental', 'Note', 'NoteName', 'distance']
 
 from dataclasses import dataclass
 from enum import Enum
-from functools import total_ordering
+from functools import cache, total_ordering
 from typing import overload
 
 from fugo import Interval
@@ -68,27 +68,36 @@ class Accidental(Enum):
             raise ValueError(f'invalid accidental: {accidental!r}') from None
 
 
-@dataclass
+# Letter names and accidentals in order, for lookups by position.
+_LETTERS = tuple(LetterName)
+_ACCIDENTALS = tuple(Accidental)
+
+# Position of each (natural) letter name on the line of fifths.
+_FIFTHS = (0, 2, 4, -1, 1, 3, 5)
+
+
+@dataclass(frozen=True, slots=True, init=False)
 class NoteName:
     letter: LetterName
     accidental: Accidental
 
     @overload
-    def __init__(self, name: str, /): ...
+    def __new__(cls, name: str, /) -> 'NoteName': ...
 
     @overload
-    def __init__(self, letter: LetterName, accidental: Accidental, /): ...
+    def __new__(cls, letter: LetterName, accidental: Accidental, /) -> 'NoteName': ...
 
-    def __init__(self, *args):
+    def __new__(cls, *args):
         match args:
             case str(),:
-                copy = self.from_string(*args)
+                return cls.from_string(*args)
             case LetterName(), Accidental():
-                copy = self.from_attrs(*args)
+                return cls.from_attrs(*args)
             case _:
-                raise ValueError('invalid arguments to NoteName.__init__()')
+                raise ValueError('invalid arguments to NoteName()')
 
-        vars(self).update(vars(copy))
+    def __reduce__(self):
+        return _note_name, (self.code,)
 
     def __repr__(self):
         string = str(self)
@@ -135,10 +144,10 @@ class NoteName:
             case Interval():
                 return self + ~other
             case NoteName():
-                n1 = Note(self.letter, self.accidental, 0)
-                n2 = Note(other.letter, other.accidental, 0)
+                n1 = Note.from_attrs(self.letter, self.accidental, 0)
+                n2 = Note.from_attrs(other.letter, other.accidental, 0)
                 if n1 < n2:
-                    n1.octave += 1
+                    n1 = Note.from_attrs(self.letter, self.accidental, 1)
                 return distance(n1, n2)
             case _:
                 return NotImplemented
@@ -154,10 +163,10 @@ class NoteName:
 
     @classmethod
     def from_attrs(cls, letter: LetterName, accidental: Accidental):
-        obj = super().__new__(cls)
+        obj = object.__new__(cls)
 
-        obj.letter = letter
-        obj.accidental = accidental
+        object.__setattr__(obj, 'letter', letter)
+        object.__setattr__(obj, 'accidental', accidental)
 
         return obj
 
@@ -165,30 +174,54 @@ class NoteName:
     def pitch(self) -> int:
         return (self.letter.steps_above_C + self.accidental.offset) % 12
 
+    @property
+    def code(self) -> int:
+        """Get a small integer (0-34) that identifies the note name (see
+        `from_code`)."""
+        return _LETTERS.index(self.letter) * 5 + self.accidental.offset + 2
+
+    @property
+    def fifths(self) -> int:
+        """Get the position on the line of fifths (C = 0, G = 1, F = -1,
+        Bb = -2, ...)."""
+        return _FIFTHS[_LETTERS.index(self.letter)] + 7 * self.accidental.offset
+
+    @classmethod
+    def from_code(cls, code: int) -> 'NoteName':
+        """Initialize a `NoteName` from its `code`."""
+        if not 0 <= code < 35:
+            raise ValueError(f'invalid note name code: {code!r}')
+
+        letter, accidental = divmod(code, 5)
+        return cls.from_attrs(_LETTERS[letter], _ACCIDENTALS[accidental])
+
 
 @total_ordering
-@dataclass
+@dataclass(frozen=True, slots=True, init=False)
 class Note:
     letter: LetterName
     accidental: Accidental
     octave: int
 
     @overload
-    def __init__(self, note: str, /): ...
+    def __new__(cls, note: str, /) -> 'Note': ...
 
     @overload
-    def __init__(self, letter: LetterName, accidental: Accidental, octave: int, /): ...
+    def __new__(
+        cls, letter: LetterName, accidental: Accidental, octave: int, /
+    ) -> 'Note': ...
 
-    def __init__(self, *args):
+    def __new__(cls, *args):
         match args:
             case str(),:
-                copy = self.from_string(*args)
+                return cls.from_string(*args)
             case LetterName(), Accidental(), int():
-                copy = self.from_attrs(*args)
+                return cls.from_attrs(*args)
             case _:
                 raise ValueError
 
-        vars(self).update(vars(copy))
+    def __reduce__(self):
+        return _note, (self.code,)
 
     def __repr__(self):
         string = str(self)
@@ -251,12 +284,13 @@ class Note:
     @classmethod
     def from_attrs(cls, letter: LetterName, accidental: Accidental, octave: int):
         # Create a new `Note` object without using the constructor,
-        # which relies on this method internally.
-        note = super().__new__(cls)
+        # which relies on this method internally. Notes are frozen, so
+        # bypass their `__setattr__`.
+        note = object.__new__(cls)
 
-        note.letter = letter
-        note.accidental = accidental
-        note.octave = octave
+        object.__setattr__(note, 'letter', letter)
+        object.__setattr__(note, 'accidental', accidental)
+        object.__setattr__(note, 'octave', octave)
 
         return note
 
@@ -311,6 +345,43 @@ class Note:
 
         return octave * 12 + self.letter.steps_above_C + self.accidental.offset
 
+    @property
+    def diatonic(self) -> int:
+        """Get the number of letter-name steps above C-1."""
+        octave = self.octave + 1
+
+        return octave * 7 + _LETTERS.index(self.letter)
+
+    @property
+    def code(self) -> int:
+        """Get a small integer that identifies the note (see `from_code`).
+
+        notes:
+            - codes are ordered by letter name, then accidental, so
+            `note.code // 5 == note.diatonic`
+        """
+        return self.diatonic * 5 + self.accidental.offset + 2
+
+    @classmethod
+    def from_code(cls, code: int) -> 'Note':
+        """Initialize a `Note` from its `code`."""
+        diatonic, accidental = divmod(code, 5)
+        octave, letter = divmod(diatonic, 7)
+
+        return cls.from_attrs(_LETTERS[letter], _ACCIDENTALS[accidental], octave - 1)
+
+    @classmethod
+    @cache
+    def decode(cls, code: int) -> 'Note':
+        """Get the `Note` with a `code`, like `from_code`, but return the
+        same instance for every call with that code.
+
+        notes:
+            - notes are immutable, so equal notes can share one instance;
+            this makes decoding many notes (e.g. a voice) cheap
+        """
+        return cls.from_code(code)
+
 
 def distance(note1: Note, note2: Note, /) -> Interval:
     """Return the interval between two notes.
@@ -398,3 +469,14 @@ def distance(note1: Note, note2: Note, /) -> Interval:
     quality = qualities[size][distance]
 
     return Interval.from_attrs(quality, size)
+
+
+# Unpickle notes from their codes. Notes are immutable, so equal notes
+# can share one instance.
+@cache
+def _note_name(code: int) -> NoteName:
+    return NoteName.from_code(code)
+
+
+def _note(code: int) -> Note:
+    return Note.decode(code)
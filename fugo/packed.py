@@ -0,0 +1,114 @@
+__all__ = ['Packed']
+
+import sys
+from array import array
+from functools import cache
+from typing import Callable, Iterable, Iterator, Sequence, TypeVar, overload
+
+from fugo import Chord, Interval, Key, Note, NoteName
+
+
+T = TypeVar('T', Note, NoteName, Interval, Key, Chord)
+
+
+class Packed(Sequence[T]):
+    """Store a sequence of `Note`s (or `NoteName`s, `Interval`s, `Key`s, or
+    `Chord`s) as an array of their codes.
+
+    args:
+        - `items`: objects to store, all of the same type
+        - `kind`: type of the objects (needed if `items` may be empty)
+
+    notes:
+        - each item takes two bytes, and a `Packed` pickles as a single
+        bytes object, so a voice of a million notes pickles to about
+        2 MB and unpickles without creating any `Note`s
+        - items are decoded when accessed; equal items share one
+        instance, since they are immutable
+        - individual objects also pickle by code (e.g. `pickle.dumps(note)`
+        stores a small int), but a `Packed` avoids the per-object
+        overhead
+
+    examples:
+        >>> import pickle
+        >>> from fugo import Note, Packed
+        >>> voice = Packed(Note(n) for n in 'C4 D4 Eb4 F4 G4'.split())
+        >>> copy = pickle.loads(pickle.dumps(voice))
+        >>> copy[2], len(copy), copy == voice
+        (Note('Eb4'), 5, True)
+    """
+
+    def __init__(self, items: Iterable[T] = (), kind: type[T] | None = None):
+        items = list(items)
+        if kind is None:
+            if not items:
+                raise ValueError('kind is required to pack an empty sequence')
+            kind = type(items[0])
+
+        if kind not in (Note, NoteName, Interval, Key, Chord):
+            raise TypeError(f'cannot pack {kind.__name__} objects')
+        if not all(type(item) is kind for item in items):
+            raise TypeError(f'all items must be {kind.__name__} objects')
+
+        self.kind = kind
+        self.codes = array('h', (item.code for item in items))
+
+    @classmethod
+    def from_codes(cls, kind: type[T], codes: Iterable[int]) -> 'Packed[T]':
+        """Initialize a `Packed` sequence from the codes of its items.
+
+        args:
+            - `kind`: type of the items
+            - `codes`: `code` of each item; an `array('h')` is used as is,
+            without copying it
+        """
+        packed = cls((), kind)
+        if isinstance(codes, array) and codes.typecode == 'h':
+            packed.codes = codes
+        else:
+            packed.codes.extend(codes)
+        return packed
+
+    def __repr__(self):
+        return f'Packed({list(self)!r})'
+
+    def __eq__(self, other):
+        if not isinstance(other, Packed):
+            return NotImplemented
+        return self.kind is other.kind and self.codes == other.codes
+
+    def __len__(self):
+        return len(self.codes)
+
+    @overload
+    def __getitem__(self, index: int) -> T: ...
+
+    @overload
+    def __getitem__(self, index: slice) -> 'Packed[T]': ...
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return Packed.from_codes(self.kind, self.codes[index])
+        return _decoder(self.kind)(self.codes[index])
+
+    def __iter__(self) -> Iterator[T]:
+        return map(_decoder(self.kind), self.codes)
+
+    def __reduce__(self):
+        codes = array('h', self.codes)
+        if sys.byteorder != 'little':
+            codes.byteswap()
+        return _unpack, (self.kind, codes.tobytes())
+
+
+def _unpack(kind: type[T], data: bytes) -> Packed[T]:
+    codes = array('h')
+    codes.frombytes(data)
+    if sys.byteorder != 'little':
+        codes.byteswap()
+    return Packed.from_codes(kind, codes)
+
+
+@cache
+def _decoder(kind: type[T]) -> Callable[[int], T]:
+    return cache(kind.from_code)
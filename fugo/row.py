@@ -0,0 +1,176 @@
+__all__ = ['ToneRow', 'RowMatch']
+
+from typing import Iterable, Iterator, NamedTuple, Sequence
+
+from fugo import Interval, Note, NoteName
+
+
+class RowMatch(NamedTuple):
+    """Locate a statement of a row form."""
+
+    voice: int
+    index: int
+    form: str
+
+
+class ToneRow:
+    """Represent a twelve-tone row.
+
+    notes:
+        - forms are labelled by their first pitch class (C = 0): P0 is
+        the prime form starting on C, I7 the inversion starting on G, R0
+        the retrograde of P0, and RI7 the retrograde of I7
+        - rows built from `Note`s or `NoteName`s remember their spelling,
+        which `transpose`, `invert`, and `retrograde` preserve
+    """
+
+    def __init__(self, row: Iterable[Note | NoteName | int], /):
+        items = list(row)
+        if all(isinstance(item, (Note, NoteName)) for item in items):
+            self.names: tuple[NoteName, ...] | None = tuple(
+                NoteName.from_attrs(item.letter, item.accidental) for item in items
+            )
+        else:
+            self.names = None
+
+        pitch_classes = tuple(
+            item % 12 if isinstance(item, int) else item.pitch % 12 for item in items
+        )
+        if sorted(pitch_classes) != list(range(12)):
+            raise ValueError('a tone row must contain each pitch class exactly once')
+
+        self.pitch_classes = pitch_classes
+        self._forms: dict[str, tuple[int, ...]] | None = None
+
+    def __repr__(self):
+        items = self.names if self.names is not None else self.pitch_classes
+        string = ' '.join(map(str, items))
+        return f'ToneRow({string!r})'
+
+    def __eq__(self, other):
+        if not isinstance(other, ToneRow):
+            return NotImplemented
+        return self.pitch_classes == other.pitch_classes and self.names == other.names
+
+    def __iter__(self) -> Iterator[int]:
+        return iter(self.pitch_classes)
+
+    def __len__(self):
+        return len(self.pitch_classes)
+
+    @classmethod
+    def from_string(cls, row: str) -> 'ToneRow':
+        """Initialize a `ToneRow` from space-separated note names (e.g.
+        'C C# D ...') or pitch classes (e.g. '0 1 2 ...')."""
+        items = row.split()
+        if all(item.isdigit() for item in items):
+            return cls(int(item) for item in items)
+        return cls(NoteName(item) for item in items)
+
+    @property
+    def matrix(self) -> tuple[tuple[int, ...], ...]:
+        """Get the 12x12 row matrix.
+
+        Rows read left to right are prime forms, right to left
+        retrogrades, columns read top to bottom inversions, and bottom to
+        top retrograde inversions. The first row is the row itself.
+        """
+        first = self.pitch_classes[0]
+        intervals = [pc - first for pc in self.pitch_classes]
+        return tuple(
+            tuple((start + i) % 12 for i in intervals)
+            for start in (first - i for i in intervals)
+        )
+
+    @property
+    def forms(self) -> dict[str, tuple[int, ...]]:
+        """Get all 48 row forms, keyed by label (e.g. 'RI5')."""
+        if self._forms is None:
+            matrix = self.matrix
+            columns = tuple(zip(*matrix))
+
+            forms = {}
+            for row in matrix:
+                forms[f'P{row[0]}'] = row
+                forms[f'R{row[0]}'] = row[::-1]
+            for column in columns:
+                forms[f'I{column[0]}'] = column
+                forms[f'RI{column[0]}'] = column[::-1]
+
+            self._forms = forms
+
+        return self._forms
+
+    def transpose(self, interval: Interval) -> 'ToneRow':
+        """Transpose the row up by `interval`."""
+        if self.names is not None:
+            return ToneRow(name + interval for name in self.names)
+        return ToneRow(pc + interval.steps for pc in self.pitch_classes)
+
+    def invert(self) -> 'ToneRow':
+        """Invert the row around its first note."""
+        if self.names is not None:
+            first = self.names[0]
+            return ToneRow(first - (name - first) for name in self.names)
+        first = self.pitch_classes[0]
+        return ToneRow(2 * first - pc for pc in self.pitch_classes)
+
+    def retrograde(self) -> 'ToneRow':
+        """Reverse the row."""
+        if self.names is not None:
+            return ToneRow(reversed(self.names))
+        return ToneRow(reversed(self.pitch_classes))
+
+    def find(self, *voices: Sequence[Note | NoteName | int]) -> list[RowMatch]:
+        """Find every statement of a row form in some voices.
+
+        args:
+            - `voices`: notes (or pitch classes) of each voice
+
+        returns:
+            - list of `RowMatch`es, sorted by voice and position
+                - `voice`: index of the voice containing the statement
+                - `index`: index of the statement's first note
+                - `form`: label of the row form (e.g. 'I4')
+
+        notes:
+            - the 48 forms are hashed once; each window of twelve
+            consecutive notes is encoded as a rolling base-12 number and
+            checked with a single dictionary lookup, so each voice is
+            scanned in linear time
+            - symmetrical rows can match more than one form at the same
+            position; every matching form is returned
+
+        examples:
+            >>> from fugo import ToneRow
+            >>> row = ToneRow.from_string('0 11 7 8 3 1 2 10 6 5 4 9')
+            >>> voice = [5, 0, 11, 7, 8, 3, 1, 2, 10, 6, 5, 4, 9, 2]
+            >>> row.find(voice)
+            [RowMatch(voice=0, index=1, form='P0')]
+        """
+        codes: dict[int, list[str]] = {}
+        for label, form in self.forms.items():
+            codes.setdefault(_encode(form), []).append(label)
+
+        high = 12**11
+        matches = []
+        for v, voice in enumerate(voices):
+            pcs = [x % 12 if isinstance(x, int) else x.pitch % 12 for x in voice]
+
+            code = 0
+            for i, pc in enumerate(pcs):
+                if i >= 12:
+                    code -= pcs[i - 12] * high
+                code = code * 12 + pc
+                if i >= 11:
+                    for label in codes.get(code, ()):
+                        matches.append(RowMatch(v, i - 11, label))
+
+        return matches
+
+
+def _encode(pitch_classes: Sequence[int]) -> int:
+    code = 0
+    for pc in pitch_classes:
+        code = code * 12 + pc
+    return code
@@ -0,0 +1,334 @@
+__all__ = ['ScoreFile', 'VoiceView', 'write_score', 'open_score', 'load_voices']
+
+import mmap
+import struct
+import sys
+from array import array
+from fractions import Fraction
+from math import lcm
+from os import PathLike
+from typing import Iterable, Iterator, Sequence, overload
+
+from fugo import Duration, Key, Meter, Mode, Note, NoteName, Packed
+
+
+Voice = tuple[Sequence[Note], Sequence[Duration]]
+
+VERSION = 1
+
+# File layout (all integers little-endian):
+#
+#   header      magic, version, resolution (ticks per whole note), and
+#               the number of voices, keys, and meters
+#   directory   number of notes in each voice (u64)
+#   keys        (onset i64, tonic i16, mode i16, padding) per key
+#   meters      (onset i64, beats i32, division i32) per meter
+#   voices      for each voice: note codes (i16, padded to 8 bytes),
+#               then onsets (i64), then durations (i64), in ticks
+#
+# Every section starts on an 8-byte boundary, so each column can be
+# viewed in place.
+_MAGIC = b'FUGO'
+_HEADER = struct.Struct('<4sHxxqIII4x')
+_COUNT = struct.Struct('<Q')
+_KEY = struct.Struct('<qhh4x')
+_METER = struct.Struct('<qii')
+
+_MODES = [*Mode]
+
+
+def write_score(
+    path: str | PathLike,
+    voices: Iterable[Voice],
+    *,
+    keys: Iterable[tuple[Fraction, Key]] = (),
+    meters: Iterable[tuple[Fraction, Meter]] = (),
+) -> None:
+    """Save a score in fugo's binary format.
+
+    args:
+        - `path`: file to write
+        - `voices`: `(notes, durations)` of each voice; notes follow each
+        other without gaps
+        - `keys`: `(onset, key)` of each key change
+        - `meters`: `(onset, meter)` of each meter change
+
+    notes:
+        - onsets and durations are stored as integer ticks; the tick
+        length is the smallest that represents every duration and
+        onset exactly
+    """
+    voices = [(list(notes), list(durations)) for notes, durations in voices]
+    for notes, durations in voices:
+        if len(notes) != len(durations):
+            raise ValueError('notes and durations must have the same length')
+
+    keys = [(Fraction(onset), key) for onset, key in keys]
+    meters = [(Fraction(onset), meter) for onset, meter in meters]
+
+    denominators = {onset.denominator for onset, _ in keys + meters}
+    for _, durations in voices:
+        denominators.update(d.denominator for d in durations)
+    resolution = lcm(1, *denominators)
+
+    # Scale by integers; `Fraction` arithmetic would dominate for long
+    # voices.
+    def ticks(value: Fraction) -> int:
+        return value.numerator * (resolution // value.denominator)
+
+    with open(path, 'wb') as file:
+        file.write(
+            _HEADER.pack(
+                _MAGIC, VERSION, resolution, len(voices), len(keys), len(meters)
+            )
+        )
+        for notes, _ in voices:
+            file.write(_COUNT.pack(len(notes)))
+        for onset, key in keys:
+            mode = _MODES.index(key.mode)
+            file.write(_KEY.pack(ticks(onset), key.tonic.code, mode))
+        for onset, meter in meters:
+            file.write(_METER.pack(ticks(onset), meter.beats, meter.division))
+
+        for notes, durations in voices:
+            lengths = [ticks(d) for d in durations]
+            onsets, total = [], 0
+            for length in lengths:
+                onsets.append(total)
+                total += length
+
+            codes = array('h', (note.code for note in notes))
+            codes.extend([0] * (-len(codes) % 4))
+            for column in (codes, array('q', onsets), array('q', lengths)):
+                if sys.byteorder != 'little':
+                    column.byteswap()
+                file.write(column.tobytes())
+
+
+def open_score(path: str | PathLike) -> 'ScoreFile':
+    """Open a score saved with `write_score` (see `ScoreFile`)."""
+    return ScoreFile(path)
+
+
+def load_voices(
+    path: str | PathLike, *, budget: int | None = None
+) -> list[list[Note]] | list[Packed[Note]]:
+    """Read the notes of every voice of a score saved with `write_score`.
+
+    args:
+        - `path`: file to read
+        - `budget`: most notes to load as `Note` objects; a score with
+        more notes than this is loaded as `Packed` voices instead
+
+    returns:
+        - notes of each voice: `list`s of `Note`s if the score fits in
+        the budget (or there is none), otherwise `Packed` voices
+
+    notes:
+        - a `list` holds an 8-byte reference per note (equal notes share
+        one instance), and a `Packed` voice holds a 2-byte code per note
+        (see `benchmarks/memory.py`)
+        - to avoid loading the notes at all, use `open_score`
+
+    examples:
+        >>> import os, tempfile
+        >>> from fugo import Duration, Note, load_voices, write_score
+        >>> notes = [Note(n) for n in 'C4 E4 G4'.split()]
+        >>> path = os.path.join(tempfile.mkdtemp(), 'score.fugo')
+        >>> write_score(path, [(notes, [Duration(1, 4)] * 3)])
+        >>> load_voices(path)
+        [[Note('C4'), Note('E4'), Note('G4')]]
+        >>> load_voices(path, budget=2)
+        [Packed([Note('C4'), Note('E4'), Note('G4')])]
+    """
+    with open_score(path) as score:
+        if budget is not None and sum(map(len, score)) > budget:
+            return [Packed.from_codes(Note, voice.codes) for voice in score]
+        return [list(voice) for voice in score]
+
+
+class VoiceView(Sequence[Note]):
+    """Read one voice of a `ScoreFile` without copying it.
+
+    attributes:
+        - `codes`: `Note.code` of each note
+        - `onsets`: onset of each note, in ticks
+        - `durations`: duration of each note, in ticks
+        - `resolution`: number of ticks in a whole note
+
+    notes:
+        - the columns are `memoryview`s into the mapped file; they
+        support the buffer protocol, so e.g. `numpy.asarray(view.codes)`
+        wraps them without copying
+        - `Note`s are only created when indexed; since they are
+        immutable, equal notes share one (cached) instance
+    """
+
+    def __init__(
+        self,
+        codes: memoryview,
+        onsets: memoryview,
+        durations: memoryview,
+        resolution: int,
+    ):
+        self.codes = codes
+        self.onsets = onsets
+        self.durations = durations
+        self.resolution = resolution
+
+    def __len__(self):
+        return len(self.codes)
+
+    @overload
+    def __getitem__(self, index: int) -> Note: ...
+
+    @overload
+    def __getitem__(self, index: slice) -> list[Note]: ...
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [Note.decode(code) for code in self.codes[index]]
+        return Note.decode(self.codes[index])
+
+    def __iter__(self) -> Iterator[Note]:
+        return map(Note.decode, self.codes)
+
+    def onset(self, index: int) -> Fraction:
+        """Return the onset of a note, in whole notes."""
+        return Fraction(self.onsets[index], self.resolution)
+
+    def duration(self, index: int) -> Duration:
+        """Return the duration of a note."""
+        return Duration(self.durations[index], self.resolution)
+
+    def release(self) -> None:
+        """Release the views of the file (called by `ScoreFile.close`)."""
+        for column in (self.codes, self.onsets, self.durations):
+            if isinstance(column, memoryview):
+                column.release()
+
+
+class ScoreFile(Sequence[VoiceView]):
+    """Represent a score saved with `write_score`, mapped into memory.
+
+    attributes:
+        - `version`: format version of the file
+        - `resolution`: number of ticks in a whole note
+        - `keys`: `(onset, key)` of each key change
+        - `meters`: `(onset, meter)` of each meter change
+
+    notes:
+        - opening a file only reads its header and tables; each voice
+        is a `VoiceView` of the mapped file
+        - `close` fails while views of the file (e.g. NumPy arrays) are
+        still alive elsewhere
+
+    examples:
+        >>> import os, tempfile
+        >>> from fugo import Duration, Note, open_score, write_score
+        >>> notes = [Note(n) for n in 'C4 E4 G4'.split()]
+        >>> durations = [Duration(1, 4), Duration(1, 8), Duration(3, 8)]
+        >>> path = os.path.join(tempfile.mkdtemp(), 'score.fugo')
+        >>> write_score(path, [(notes, durations)])
+        >>> with open_score(path) as score:
+        ...     voice = score[0]
+        ...     print(list(voice), voice.onsets.tolist(), score.resolution)
+        [Note('C4'), Note('E4'), Note('G4')] [0, 2, 3] 8
+    """
+
+    def __init__(self, path: str | PathLike):
+        with open(path, 'rb') as file:
+            self._map = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+
+        try:
+            self._load()
+        except BaseException:
+            self.close()
+            raise
+
+    def _load(self):
+        buffer = self._map
+        if len(buffer) < _HEADER.size or buffer[:4] != _MAGIC:
+            raise ValueError('not a fugo score file')
+
+        header = _HEADER.unpack_from(buffer)
+        _, self.version, self.resolution, voices, keys, meters = header
+        if self.version != VERSION:
+            raise ValueError(f'unsupported score file version: {self.version}')
+
+        tables = _COUNT.size * voices + _KEY.size * keys + _METER.size * meters
+        if _HEADER.size + tables > len(buffer):
+            raise ValueError('truncated or corrupt score file')
+
+        offset = _HEADER.size
+        counts = []
+        for _ in range(voices):
+            counts.append(*_COUNT.unpack_from(buffer, offset))
+            offset += _COUNT.size
+
+        self.keys: list[tuple[Fraction, Key]] = []
+        for _ in range(keys):
+            onset, tonic, mode = _KEY.unpack_from(buffer, offset)
+            key = Key.from_attrs(NoteName.from_code(tonic), _MODES[mode])
+            self.keys.append((Fraction(onset, self.resolution), key))
+            offset += _KEY.size
+
+        self.meters: list[tuple[Fraction, Meter]] = []
+        for _ in range(meters):
+            onset, beats, division = _METER.unpack_from(buffer, offset)
+            meter = Meter(beats, division)
+            self.meters.append((Fraction(onset, self.resolution), meter))
+            offset += _METER.size
+
+        size = offset + sum((2 * n + 7) // 8 * 8 + 16 * n for n in counts)
+        if size != len(buffer):
+            raise ValueError('truncated or corrupt score file')
+
+        self._voices = []
+        view = memoryview(buffer)
+        for n in counts:
+            width = (2 * n + 7) // 8 * 8
+            codes = _column(view[offset : offset + 2 * n], 'h')
+            offset += width
+            onsets = _column(view[offset : offset + 8 * n], 'q')
+            offset += 8 * n
+            durations = _column(view[offset : offset + 8 * n], 'q')
+            offset += 8 * n
+            self._voices.append(VoiceView(codes, onsets, durations, self.resolution))
+        view.release()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *_):
+        self.close()
+
+    def __len__(self):
+        return len(self._voices)
+
+    @overload
+    def __getitem__(self, index: int) -> VoiceView: ...
+
+    @overload
+    def __getitem__(self, index: slice) -> list[VoiceView]: ...
+
+    def __getitem__(self, index):
+        return self._voices[index]
+
+    def close(self) -> None:
+        """Release the views and unmap the file."""
+        for voice in getattr(self, '_voices', ()):
+            voice.release()
+        self._voices = []
+        self._map.close()
+
+
+def _column(view: memoryview, format: str) -> memoryview | array:
+    if sys.byteorder == 'little':
+        return view.cast(format)
+
+    # Big-endian hosts can't view the little-endian columns directly.
+    column = array(format, view.tobytes())
+    column.byteswap()
+    view.release()
+    return column
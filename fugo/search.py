@@ -0,0 +1,191 @@
+__all__ = ['Entry', 'SubjectIndex']
+
+from bisect import bisect_right
+from itertools import pairwise
+from typing import Iterable, NamedTuple, Sequence
+
+from fugo import Note
+
+
+# Separates voices in the concatenated token sequence. No melodic
+# interval encodes to this value, so matches never span two voices.
+_SEPARATOR = -1
+
+# Head intervals of a tonal answer, as (letter-name steps, semitones):
+# a perfect fifth is answered by a perfect fourth, and the reverse.
+_ANSWERS = (((4, 7), (3, 5)), ((3, 5), (4, 7)))
+
+
+class Entry(NamedTuple):
+    """Locate an occurrence of a subject."""
+
+    voice: int
+    index: int
+
+
+class SubjectIndex:
+    """Index the melodic intervals of many voices for subject lookup.
+
+    The melodic intervals of every voice are concatenated and indexed
+    with a suffix array, so looking up a subject takes O(m log n) time
+    (for a subject of m notes in a corpus of n notes), independent of
+    the number of voices.
+
+    Two sequences are indexed:
+        - exact: letter-name steps and semitones, which finds real
+        transpositions of a subject
+        - diatonic: letter-name steps only, which also finds entries in
+        other modes
+
+    Tonal answers, which exchange a leading fifth for a fourth (or a
+    fourth for a fifth), are found by looking up each head interval.
+    """
+
+    def __init__(self, voices: Iterable[Sequence[Note]]):
+        self._starts: list[int] = []
+        exact: list[int] = []
+        diatonic: list[int] = []
+
+        for voice in voices:
+            self._starts.append(len(exact))
+            for note1, note2 in pairwise(voice):
+                exact.append(_encode(note1, note2))
+                diatonic.append(_encode(note1, note2, diatonic=True))
+            exact.append(_SEPARATOR)
+            diatonic.append(_SEPARATOR)
+
+        self._exact = exact, _suffix_array(exact)
+        self._diatonic = diatonic, _suffix_array(diatonic)
+
+    def __len__(self):
+        return len(self._starts)
+
+    def find(
+        self,
+        subject: Sequence[Note],
+        *,
+        diatonic: bool = False,
+        tonal: bool = False,
+    ) -> list[Entry]:
+        """Find every entry of a subject in the indexed voices.
+
+        args:
+            - `subject`: notes of the subject (at any transposition)
+            - `diatonic`: ignore interval qualities when matching
+            - `tonal`: also find tonal answers, whose first interval is a
+            fourth where the subject's is a fifth (or the reverse), in the
+            same direction
+
+        returns:
+            - list of `Entry`s, sorted by voice and position
+                - `voice`: index of the voice containing the entry
+                - `index`: index of the entry's first note in the voice
+
+        notes:
+            - without `diatonic`, only perfect fifths and fourths are
+            exchanged
+
+        examples:
+            >>> from fugo import Note, SubjectIndex
+            >>> voice = [Note(n) for n in 'C4 E4 D4 F4 E4 G4'.split()]
+            >>> index = SubjectIndex([voice])
+            >>> index.find([Note('G4'), Note('B4'), Note('A4')])
+            [Entry(voice=0, index=0)]
+            >>> index.find([Note('G4'), Note('B4'), Note('A4')], diatonic=True)
+            [Entry(voice=0, index=0), Entry(voice=0, index=2)]
+            >>> answer = [Note(n) for n in 'G4 C5 B4 A4 G4'.split()]
+            >>> index = SubjectIndex([answer])
+            >>> subject = [Note(n) for n in 'C4 G4 F4 E4 D4'.split()]
+            >>> index.find(subject, diatonic=True)
+            []
+            >>> index.find(subject, diatonic=True, tonal=True)
+            [Entry(voice=0, index=0)]
+        """
+        if len(subject) < 2:
+            raise ValueError('subject must contain at least two notes')
+
+        text, suffixes = self._diatonic if diatonic else self._exact
+        pattern = [_encode(a, b, diatonic=diatonic) for a, b in pairwise(subject)]
+        heads = [pattern[0]]
+        if tonal:
+            heads.extend(_exchange(subject[0], subject[1], diatonic=diatonic))
+
+        entries = []
+        for head in heads:
+            for i in _lookup(text, suffixes, [head] + pattern[1:]):
+                voice = bisect_right(self._starts, i) - 1
+                entries.append(Entry(voice, i - self._starts[voice]))
+
+        return sorted(entries)
+
+
+def _lookup(text: list[int], suffixes: list[int], pattern: list[int]) -> list[int]:
+    # Binary search for the block of suffixes starting with the pattern.
+    m = len(pattern)
+    lo, hi = 0, len(suffixes)
+    while lo < hi:
+        mid = (lo + hi) // 2
+        i = suffixes[mid]
+        if text[i : i + m] < pattern:
+            lo = mid + 1
+        else:
+            hi = mid
+    first = lo
+
+    hi = len(suffixes)
+    while lo < hi:
+        mid = (lo + hi) // 2
+        i = suffixes[mid]
+        if text[i : i + m] <= pattern:
+            lo = mid + 1
+        else:
+            hi = mid
+
+    return suffixes[first:lo]
+
+
+def _encode(note1: Note, note2: Note, *, diatonic: bool = False) -> int:
+    return _token(note2.diatonic - note1.diatonic, note2.pitch - note1.pitch, diatonic)
+
+
+def _exchange(note1: Note, note2: Note, *, diatonic: bool = False) -> list[int]:
+    # Encode the fourth answering a fifth (or the fifth answering a
+    # fourth), in the same direction.
+    steps = note2.diatonic - note1.diatonic
+    semitones = note2.pitch - note1.pitch
+    sign = -1 if steps < 0 else 1
+    for (steps1, semitones1), (steps2, semitones2) in _ANSWERS:
+        if abs(steps) == steps1 and (diatonic or abs(semitones) == semitones1):
+            return [_token(sign * steps2, sign * semitones2, diatonic)]
+    return []
+
+
+def _token(steps: int, semitones: int, diatonic: bool) -> int:
+    if diatonic:
+        return steps * 2 if steps >= 0 else -steps * 2 - 1
+
+    code = steps * 256 + semitones
+    return code * 2 if code >= 0 else -code * 2 - 1
+
+
+def _suffix_array(text: list[int]) -> list[int]:
+    """Build a suffix array by prefix doubling (O(n log^2 n))."""
+    n = len(text)
+    rank = text[:]
+    suffixes = list(range(n))
+    k = 1
+
+    while True:
+        # Past the end sorts before every token (including separators),
+        # so no two suffixes stay tied forever.
+        key = lambda i: (rank[i], rank[i + k] if i + k < n else _SEPARATOR - 1)
+        suffixes.sort(key=key)
+
+        new = [0] * n
+        for a, b in pairwise(suffixes):
+            new[b] = new[a] + (key(a) != key(b))
+        rank = new
+
+        if n == 0 or rank[suffixes[-1]] == n - 1:
+            return suffixes
+        k *= 2
@@ -0,0 +1,210 @@
+__all__ = ['SetClass', 'pitch_class_set', 'set_class', 'set_classes', 'equivalent']
+
+from functools import cache
+from typing import Iterable, NamedTuple
+
+from fugo import Note, NoteName
+from fugo.chord import Chord, Quality
+
+
+class SetClass(NamedTuple):
+    """Describe a set class (a pitch-class set up to transposition and
+    inversion)."""
+
+    name: str
+    prime: tuple[int, ...]
+    vector: tuple[int, ...]
+
+
+Collection = int | Chord | Quality | Iterable[Note | NoteName | int]
+
+
+def pitch_class_set(collection: Collection, /) -> int:
+    """Return the pitch classes in a collection as a bit mask.
+
+    args:
+        - `collection`: one of
+            - an `int` bit mask (returned unchanged)
+            - a `Chord` or chord `Quality` (rooted on C)
+            - an iterable of `Note`s, `NoteName`s, or pitch numbers
+
+    returns:
+        - `int` in which bit `n` is set if pitch class `n` (C = 0) is
+        present
+
+    examples:
+        >>> from fugo import Chord, pitch_class_set
+        >>> bin(pitch_class_set(Chord('D')))
+        '0b1001000100'
+    """
+    match collection:
+        case int():
+            if not 0 <= collection < 1 << 12:
+                raise ValueError(f'invalid pitch-class set: {collection!r}')
+            return collection
+        case Chord():
+            pitches = (name.pitch for name in collection.note_names)
+        case Quality():
+            pitches = (interval.steps for interval in collection)
+        case _:
+            pitches = (
+                item if isinstance(item, int) else item.pitch for item in collection
+            )
+
+    mask = 0
+    for pitch in pitches:
+        mask |= 1 << (pitch % 12)
+    return mask
+
+
+def set_class(collection: Collection, /) -> SetClass:
+    """Return the set class of a collection.
+
+    args:
+        - `collection`: anything accepted by `pitch_class_set`
+
+    returns:
+        - `SetClass`
+            - `name`: Forte name (e.g. '4-Z15')
+            - `prime`: prime form (Rahn's algorithm)
+            - `vector`: interval-class vector
+
+    notes:
+        - every set class is precomputed for all 4096 pitch-class sets
+        on first use, so lookups only cost a list index
+
+    examples:
+        >>> from fugo import Chord, set_class
+        >>> set_class(Chord('Bø7'))
+        SetClass(name='4-27', prime=(0, 2, 5, 8), vector=(0, 1, 2, 1, 1, 1))
+    """
+    return _table()[pitch_class_set(collection)]
+
+
+def set_classes(*voices: Iterable[Note]) -> list[SetClass]:
+    """Return the set class of each vertical slice of some voices.
+
+    notes:
+        - every voice must contain the same number of notes
+    """
+    table = _table()
+    return [table[pitch_class_set(notes)] for notes in zip(*voices, strict=True)]
+
+
+def equivalent(a: Collection, b: Collection, /, *, inversion: bool = True) -> bool:
+    """Test whether two collections are related by transposition (or
+    inversion).
+
+    args:
+        - `a`, `b`: anything accepted by `pitch_class_set`
+        - `inversion`: also accept collections related by inversion
+        (i.e. in the same set class)
+    """
+    a, b = pitch_class_set(a), pitch_class_set(b)
+    if inversion:
+        return _table()[a] is _table()[b]
+
+    transpositions = _transpositions()
+    return transpositions[a] == transpositions[b]
+
+
+# Forte names of the set classes with three to six members, as lists of
+# prime forms in Forte order. Larger set classes are named after their
+# complements (e.g. 8-Z15 is the complement of 4-Z15).
+_FORTE = {
+    3: '012 013 014 015 016 024 025 026 027 036 037 048',
+    4: (
+        '0123 0124 0134 0125 0126 0127 0145 0156 0167 0235 0135 0236 0136 0237'
+        ' 0146 0157 0347 0147 0148 0158 0246 0247 0257 0248 0268 0358 0258 0369'
+        ' 0137'
+    ),
+    5: (
+        '01234 01235 01245 01236 01237 01256 01267 02346 01246 01346 02347 01356'
+        ' 01248 01257 01268 01347 01348 01457 01367 01568 01458 01478 02357 01357'
+        ' 02358 02458 01358 02368 01368 01468 01369 01469 02468 02469 02479 01247'
+        ' 03458 01258'
+    ),
+    6: (
+        '012345 012346 012356 012456 012367 012567 012678 023457 012357 013457'
+        ' 012457 012467 013467 013458 012458 014568 012478 012578 013478 014589'
+        ' 023468 012468 023568 013468 013568 013578 013469 013569 023679 013679'
+        ' 014579 024579 023579 013579 02468T 012347 012348 012378 023458 012358'
+        ' 012368 012369 012568 012569 023469 012469 012479 012579 013479 014679'
+    ),
+}
+
+# Set classes that share their interval-class vector with another.
+_Z = {
+    4: {15, 29},
+    5: {12, 17, 18, 36, 37, 38},
+    6: {3, 4, 6, 10, 11, 12, 13, 17, 19, 23, 24, 25, 26, 28, 29, *range(36, 51)},
+}
+
+_ALL = (1 << 12) - 1
+
+
+def _rotate(mask: int, n: int) -> int:
+    # Transpose down by `n` semitones.
+    return ((mask >> n) | (mask << (12 - n))) & _ALL
+
+
+def _invert(mask: int) -> int:
+    return sum(1 << (-pc % 12) for pc in range(12) if mask >> pc & 1)
+
+
+@cache
+def _transpositions() -> list[int]:
+    # For each set, its transposition with the smallest bit mask that
+    # contains 0 (0 for the empty set).
+    return [
+        min((r for n in range(12) if (r := _rotate(mask, n)) & 1), default=0)
+        for mask in range(1 << 12)
+    ]
+
+
+@cache
+def _table() -> list[SetClass]:
+    transpositions = _transpositions()
+
+    # With pitch class n weighted by 2**n, the smallest transposition of
+    # a set or its inversion is its prime form under Rahn's algorithm.
+    primes = [
+        min(transpositions[mask], transpositions[_invert(mask)])
+        for mask in range(1 << 12)
+    ]
+
+    names = {}
+    for size, forms in _FORTE.items():
+        for number, form in enumerate(forms.split(), start=1):
+            mask = primes[sum(1 << '0123456789TE'.index(pc) for pc in form)]
+            z = 'Z' if number in _Z.get(size, ()) else ''
+            names[mask] = f'{size}-{z}{number}'
+            if size < 6:
+                names[primes[_ALL & ~mask]] = f'{12 - size}-{z}{number}'
+
+    # The remaining set classes are determined by their size and (for
+    # dyads and their complements) interval class.
+    names[0], names[_ALL] = '0-1', '12-1'
+    for pc in range(12):
+        names[primes[1 << pc]] = '1-1'
+        names[primes[_ALL & ~(1 << pc)]] = '11-1'
+    for ic in range(1, 7):
+        dyad = primes[1 | 1 << ic]
+        names[dyad] = f'2-{ic}'
+        names[primes[_ALL & ~dyad]] = f'10-{ic}'
+
+    classes = {}
+    for prime, name in names.items():
+        pcs = tuple(pc for pc in range(12) if prime >> pc & 1)
+        classes[prime] = SetClass(name, pcs, _vector(pcs))
+
+    return [classes[prime] for prime in primes]
+
+
+def _vector(pcs: tuple[int, ...]) -> tuple[int, ...]:
+    vector = [0] * 6
+    for i, a in enumerate(pcs):
+        for b in pcs[i + 1 :]:
+            interval = (b - a) % 12
+            vector[min(interval, 12 - interval) - 1] += 1
+    return tuple(vector)
@@ -0,0 +1,178 @@
+__all__ = ['Match', 'MelodyIndex', 'signature', 'edit_distance']
+
+from collections import Counter, defaultdict
+from heapq import nsmallest
+from itertools import pairwise
+from typing import Hashable, Iterable, NamedTuple, Sequence
+
+from fugo import Note, distance
+from fugo.motion import Direction
+
+
+class Match(NamedTuple):
+    """Describe a melody found by `MelodyIndex.query`."""
+
+    index: int
+    distance: int
+
+
+def signature(melody: Sequence[Note]) -> tuple[int, ...]:
+    """Summarize a melody by its signed melodic intervals.
+
+    args:
+        - `melody`: notes of the melody
+
+    returns:
+        - tuple containing one interval number per melodic interval,
+        positive when the melody rises and negative when it falls
+        (repeated notes are 0)
+
+    notes:
+        - signatures are transposition-invariant and ignore interval
+        quality, so melodies in different keys or modes still match
+        - compound intervals are reduced to their simple equivalents
+
+    examples:
+        >>> from fugo import Note, signature
+        >>> signature([Note('C4'), Note('E4'), Note('D4'), Note('D4')])
+        (3, -2, 0)
+    """
+    numbers = []
+    for note1, note2 in pairwise(melody):
+        match Direction.from_notes(note1, note2):
+            case Direction.UP:
+                numbers.append(distance(note1, note2).size.number)
+            case Direction.DOWN:
+                numbers.append(-distance(note1, note2).size.number)
+            case Direction.NONE:
+                numbers.append(0)
+
+    return tuple(numbers)
+
+
+def edit_distance(a: Sequence[Hashable], b: Sequence[Hashable], /) -> int:
+    """Return the Levenshtein distance between two sequences.
+
+    notes:
+        - uses Hyyrö's bit-parallel formulation of Myers' algorithm,
+        which processes a whole column of the dynamic-programming table
+        per step, so the cost is O(len(b)) big-integer operations
+    """
+    m = len(a)
+    if not m:
+        return len(b)
+
+    # Bit i of peq[x] is set if a[i] == x.
+    peq: dict[Hashable, int] = {}
+    for i, x in enumerate(a):
+        peq[x] = peq.get(x, 0) | (1 << i)
+
+    mask = (1 << m) - 1
+    high = 1 << (m - 1)
+    pv, mv = mask, 0
+    score = m
+
+    for x in b:
+        eq = peq.get(x, 0)
+        xv = eq | mv
+        xh = (((eq & pv) + pv) ^ pv) | eq
+        ph = mv | ~(xh | pv)
+        mh = pv & xh
+
+        if ph & high:
+            score += 1
+        elif mh & high:
+            score -= 1
+
+        ph = (ph << 1) | 1
+        mh <<= 1
+        pv = (mh | ~(xv | ph)) & mask
+        mv = ph & xv & mask
+
+    return score
+
+
+class MelodyIndex:
+    """Index melodies for similarity search.
+
+    Each melody's `signature` is split into overlapping n-grams, which
+    are stored in inverted lists. A query only considers melodies that
+    share n-grams with it, and re-ranks the most promising ones by
+    `edit_distance` between signatures.
+    """
+
+    def __init__(self, melodies: Iterable[Sequence[Note]] = (), *, n: int = 3):
+        if n < 1:
+            raise ValueError(f'invalid n-gram length: {n}')
+
+        self.n = n
+        self._signatures: list[tuple[int, ...]] = []
+        self._postings: defaultdict[tuple[int, ...], list[int]] = defaultdict(list)
+
+        for melody in melodies:
+            self.add(melody)
+
+    def __len__(self):
+        return len(self._signatures)
+
+    def add(self, melody: Sequence[Note]) -> int:
+        """Add a melody to the index and return its index."""
+        index = len(self._signatures)
+        sig = signature(melody)
+        self._signatures.append(sig)
+
+        for gram in set(self._ngrams(sig)):
+            self._postings[gram].append(index)
+
+        return index
+
+    def query(
+        self, melody: Sequence[Note], k: int = 10, *, candidates: int | None = None
+    ) -> list[Match]:
+        """Find the indexed melodies most similar to `melody`.
+
+        args:
+            - `melody`: notes of the query melody
+            - `k`: maximum number of results
+            - `candidates`: number of melodies to re-rank by edit
+            distance (defaults to `10 * k`)
+
+        returns:
+            - list of up to `k` `Match`es, most similar first
+                - `index`: value returned by `add` for the melody
+                - `distance`: edit distance between signatures
+
+        notes:
+            - melodies that share no n-grams with the query are never
+            returned
+
+        examples:
+            >>> from fugo import Note, MelodyIndex
+            >>> def melody(s): return [Note(n) for n in s.split()]
+            >>> index = MelodyIndex([
+            ...     melody('C4 D4 E4 F4 G4'),
+            ...     melody('G4 F4 E4 D4 C4'),
+            ...     melody('D4 E4 F#4 G4 B4'),
+            ... ])
+            >>> index.query(melody('F4 G4 A4 Bb4 C5'), k=2)
+            [Match(index=0, distance=0), Match(index=2, distance=1)]
+        """
+        if candidates is None:
+            candidates = 10 * k
+
+        sig = signature(melody)
+
+        # Count shared n-grams per indexed melody.
+        counts: Counter[int] = Counter()
+        for gram in set(self._ngrams(sig)):
+            counts.update(self._postings.get(gram, ()))
+
+        matches = (
+            Match(index, edit_distance(sig, self._signatures[index]))
+            for index, _ in counts.most_common(candidates)
+        )
+        return nsmallest(k, matches, key=lambda m: (m.distance, m.index))
+
+    def _ngrams(self, sig: tuple[int, ...]) -> Iterable[tuple[int, ...]]:
+        n = min(self.n, len(sig))
+        return (sig[i : i + n] for i in range(len(sig) - n + 1))
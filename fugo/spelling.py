@@ -0,0 +1,139 @@
+__all__ = ['spell', 'spell_voices']
+
+from functools import cache
+from typing import Iterable, Sequence
+
+from fugo import Accidental, Key, LetterName, Mode, Note, NoteName
+
+
+Keys = Key | Sequence[Key] | None
+
+
+def spell(pitches: Sequence[int], key: Keys = None, *, window: int = 8) -> list[Note]:
+    """Spell MIDI note numbers as `Note`s.
+
+    args:
+        - `pitches`: MIDI note numbers of a voice
+        - `key`: key of the voice, one key per note, or `None` if unknown
+        - `window`: number of preceding notes that influence each
+        spelling
+
+    returns:
+        - list of `Note`s, with `note.pitch == pitch` for each pitch
+
+    notes:
+        - spellings are chosen on the line of fifths (... Eb Bb F C G D
+        A E B F# C# ...): each note takes the spelling of its pitch class
+        closest to the centre of gravity of the previous `window`
+        spellings, with the centre of the key's scale counted as one
+        more note (minor keys use the harmonic minor scale, so leading
+        tones are spelled as such)
+        - the centre is kept as a running sum, so a voice is spelled in
+        O(len(pitches)) time
+
+    examples:
+        >>> from fugo import Key, spell
+        >>> print(*spell([62, 66, 69, 70, 73], Key('d')))
+        D4 F#4 A4 Bb4 C#5
+        >>> print(*spell([70, 63, 66, 65, 70], Key('Bb')))
+        Bb4 Eb4 Gb4 F4 Bb4
+    """
+    return [_note(pitch, f) for pitch, f in zip(pitches, _spell(pitches, key, window))]
+
+
+def spell_voices(
+    voices: Iterable[Sequence[int]],
+    key: Keys = None,
+    *,
+    window: int = 8,
+    processes: int | None = None,
+) -> list[list[Note]]:
+    """Spell several voices with `spell`.
+
+    args:
+        - `voices`: MIDI note numbers of each voice
+        - `key`: key of the voices, or one key per note (the same for
+        every voice)
+        - `window`: passed to `spell`
+        - `processes`: number of worker processes (spell in this process
+        if `None`)
+
+    returns:
+        - list with the spelled `Note`s of each voice
+
+    notes:
+        - voices are spelled independently; with `processes`, workers
+        only exchange integers, and the `Note`s are built afterwards
+    """
+    voices = [list(voice) for voice in voices]
+    if processes is None:
+        return [spell(voice, key, window=window) for voice in voices]
+
+    from multiprocessing import Pool
+
+    with Pool(processes) as pool:
+        results = pool.starmap(_spell, [(voice, key, window) for voice in voices])
+
+    return [
+        [_note(pitch, f) for pitch, f in zip(voice, positions)]
+        for voice, positions in zip(voices, results)
+    ]
+
+
+def _spell(pitches: Sequence[int], key: Keys, window: int) -> list[int]:
+    # Return the line-of-fifths position (C = 0, G = 1, F = -1...) of
+    # each note's spelling.
+    if window < 1:
+        raise ValueError(f'invalid window size: {window}')
+
+    if key is None or isinstance(key, Key):
+        centres = None
+        anchor = _centre(key.tonic, key.mode) if key is not None else _centre()
+    else:
+        if len(key) != len(pitches):
+            raise ValueError('pitches and keys must have the same length')
+        centres = [_centre(k.tonic, k.mode) for k in key]
+
+    positions: list[int] = []
+    total = 0
+    for i, pitch in enumerate(pitches):
+        if centres is not None:
+            anchor = centres[i]
+
+        centre = (total + anchor) / (min(i, window) + 1)
+        f = min(_CANDIDATES[pitch % 12], key=lambda f: (abs(f - centre), f))
+
+        positions.append(f)
+        total += f
+        if i >= window:
+            total -= positions[i - window]
+
+    return positions
+
+
+@cache
+def _centre(tonic: NoteName | None = None, mode: Mode | None = None) -> float:
+    # The mean position of a key's scale (that of C major if no key).
+    if tonic is None:
+        return 2.0
+
+    positions = [name.fifths for name in Key.from_attrs(tonic, mode)]
+    if mode is Mode.MINOR:
+        # Raise the seventh degree by a semitone (seven fifths).
+        positions[6] += 7
+    return sum(positions) / len(positions)
+
+
+def _note(pitch: int, f: int) -> Note:
+    letter, accidental = _NAMES[f]
+    octave = (pitch - letter.steps_above_C - accidental.offset) // 12 - 1
+    return Note.from_attrs(letter, accidental, octave)
+
+
+# Each pitch class has three spellings between Fbb (-15) and Bx (19).
+_NAMES = {
+    f: (LetterName[letter], Accidental(offset))
+    for offset in range(-2, 3)
+    for f, letter in enumerate('FCGDAEB', start=7 * offset - 1)
+}
+_CANDIDATES = [sorted(f for f in _NAMES if 7 * f % 12 == pc) for pc in range(12)]
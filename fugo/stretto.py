@@ -0,0 +1,141 @@
+__all__ = ['Stretto', 'find_strettos']
+
+from fractions import Fraction
+from math import gcd, lcm
+from typing import Iterable, NamedTuple, Sequence
+
+from fugo import Consonance, Direction, Duration, Interval, Note
+
+
+# Consonance of the vertical interval between two voices, indexed by
+# interval class (semitones mod 12), as given by `Interval.consonance`
+# for the usual spelling of each class. In two-voice writing, the lower
+# voice is the bass, so the perfect fourth is a dissonance.
+_CONSONANCE = tuple(
+    Interval(name).consonance()
+    for name in 'P1 m2 M2 m3 M3 P4 A4 P5 m6 M6 m7 M7'.split()
+)
+_CONSONANT = tuple(c is not Consonance.DISSONANT for c in _CONSONANCE)
+
+# Interval classes that may not be approached in parallel motion.
+_PERFECT = tuple(c is Consonance.PERFECT for c in _CONSONANCE)
+
+
+class Stretto(NamedTuple):
+    """Describe one way a subject can overlap with itself."""
+
+    offset: Duration
+    interval: Interval
+    direction: Direction
+    overlap: int
+    dissonances: int
+    parallels: int
+
+
+def find_strettos(
+    subject: Sequence[Note],
+    durations: Sequence[Duration] | None = None,
+    *,
+    intervals: Iterable[Interval] = (
+        Interval('P8'),
+        Interval('P5'),
+        Interval('P4'),
+        Interval('P1'),
+    ),
+) -> list[Stretto]:
+    """Find the offsets and intervals at which a subject fits against itself.
+
+    args:
+        - `subject`: notes of the subject
+        - `durations`: length of each note (quarter notes if omitted)
+        - `intervals`: transpositions to try for the following voice;
+        each is tried both above and below the leading voice
+
+    returns:
+        - list of `Stretto`s, best first
+            - `offset`: delay before the following voice enters
+            - `interval`, `direction`: transposition of the following
+            voice relative to the leading voice
+            - `overlap`: number of time slices in which both voices sound
+            - `dissonances`: slices in which the voices are dissonant
+            - `parallels`: parallel unisons, fifths, and octaves
+
+    notes:
+        - results are ranked by `dissonances + parallels`, then by
+        `offset` (closer strettos first)
+        - the subject is sampled on a grid of the largest duration that
+        divides every note, so each slice compares two sounding notes
+
+    examples:
+        >>> from fugo import Note, Interval, find_strettos
+        >>> subject = [Note(n) for n in 'C4 D4 E4 C4'.split()]
+        >>> best, *_ = find_strettos(subject, intervals=[Interval('P5')])
+        >>> best.offset, best.interval, best.direction
+        (Duration(1, 4), Interval('P5'), <Direction.DOWN: 2>)
+    """
+    if durations is None:
+        durations = [Duration.QUARTER] * len(subject)
+    if len(durations) != len(subject):
+        raise ValueError('subject and durations must have the same length')
+    if not subject:
+        return []
+
+    # Sample the subject on a regular grid.
+    unit = Fraction(
+        gcd(*(d.numerator for d in durations)),
+        lcm(*(d.denominator for d in durations)),
+    )
+    repeats = [int(d / unit) for d in durations]
+    grid = [note for note, n in zip(subject, repeats) for _ in range(n)]
+
+    leader = [note.pitch for note in grid]
+    length = len(leader)
+
+    results = []
+    for interval in intervals:
+        for direction in (Direction.UP, Direction.DOWN):
+            if direction is Direction.DOWN and interval.steps == 0:
+                continue
+
+            # Transpose the subject once per interval; every offset is
+            # then scored against the same pitch list.
+            shift = Note.__add__ if direction is Direction.UP else Note.__sub__
+            cache = {}
+            follower = []
+            for note in grid:
+                if note not in cache:
+                    cache[note] = shift(note, interval).pitch
+                follower.append(cache[note])
+
+            for start in range(1, length):
+                leading, following = leader[start:], follower[: length - start]
+                dissonances, parallels = _score(leading, following)
+                results.append(
+                    Stretto(
+                        offset=Duration(start * unit),
+                        interval=interval,
+                        direction=direction,
+                        overlap=length - start,
+                        dissonances=dissonances,
+                        parallels=parallels,
+                    )
+                )
+
+    results.sort(key=lambda s: (s.dissonances + s.parallels, s.offset))
+    return results
+
+
+def _score(voice1: list[int], voice2: list[int]) -> tuple[int, int]:
+    classes = [abs(a - b) % 12 for a, b in zip(voice1, voice2)]
+    dissonances = sum(not _CONSONANT[c] for c in classes)
+
+    parallels = 0
+    for i in range(1, len(classes)):
+        if classes[i] != classes[i - 1] or not _PERFECT[classes[i]]:
+            continue
+        step1 = voice1[i] - voice1[i - 1]
+        step2 = voice2[i] - voice2[i - 1]
+        if step1 and step2 and (step1 > 0) == (step2 > 0):
+            parallels += 1
+
+    return dissonances, parallels
@@ -1,7 +1,9 @@
-__all__ = ['Time', 'Clock']
+__all__ = ['Time', 'Clock', 'TempoMap']
 
+from array import array
+from bisect import bisect_right
 from fractions import Fraction
-from typing import NamedTuple
+from typing import Iterable, NamedTuple
 
 from fugo import Duration, Meter
 
@@ -13,6 +15,12 @@ class Time(NamedTuple):
     beat: int
     pulse: Fraction | int = 0
 
+    def position(self, meter: Meter) -> Fraction:
+        """Return the distance from the start of the score, in whole notes
+        (the inverse of `Clock.time`)."""
+        beats = (self.measure - 1) * meter.beats + self.beat - 1 + self.pulse
+        return Fraction(beats, meter.division)
+
 
 class Clock:
     """Provide context for `Time` objects."""
@@ -25,6 +33,11 @@ class Clock:
         self._time += duration
         return self.time
 
+    @property
+    def position(self) -> Fraction:
+        """Get the distance from the start of the score, in whole notes."""
+        return Fraction(self._time)
+
     @property
     def time(self) -> Time:
         METER = Fraction(self.meter.beats, self.meter.division)
@@ -33,3 +46,124 @@ class Clock:
         beat, pulse = divmod(_beat * self.meter.division, 1)
 
         return Time(measure + 1, beat + 1, pulse)
+
+
+class TempoMap:
+    """Convert score positions to seconds and back.
+
+    args:
+        - `changes`: `(position, tempo)` of each tempo change; positions
+        are in whole notes (the first must be 0), and tempos in beats
+        per minute
+        - `beat`: duration of one beat
+
+    notes:
+        - the tempo is constant between changes; the time at which each
+        change starts is computed once, so each conversion is a binary
+        search over the changes
+        - `seconds_many` converts a whole array of onsets (e.g. the
+        `onsets` of a `VoiceView`) in a single pass
+
+    examples:
+        >>> from fugo import Duration, Meter, TempoMap, Time
+        >>> tempo = TempoMap([(0, 120), (2, 60)])
+        >>> tempo.seconds(Duration(5, 2))
+        6.0
+        >>> tempo.position(6.0)
+        Fraction(5, 2)
+        >>> tempo.seconds(Time(3, 3).position(Meter(4, 4)))
+        6.0
+    """
+
+    def __init__(
+        self,
+        changes: Iterable[tuple[Fraction | int, float]],
+        beat: Duration = Duration.QUARTER,
+    ):
+        changes = sorted((Fraction(position), tempo) for position, tempo in changes)
+        if not changes or changes[0][0] != 0:
+            raise ValueError('the first tempo change must be at position 0')
+        if any(tempo <= 0 for _, tempo in changes):
+            raise ValueError('tempos must be positive')
+        if len({position for position, _ in changes}) != len(changes):
+            raise ValueError('only one tempo change may start at each position')
+
+        self.changes = changes
+        self.beat = beat
+
+        # Start of each segment, in whole notes and in seconds, and its
+        # length of a whole note, in seconds.
+        self._starts = [float(position) for position, _ in changes]
+        self._rates = [60 / (tempo * float(beat)) for _, tempo in changes]
+        self._seconds = [0.0]
+        for i in range(1, len(changes)):
+            length = self._starts[i] - self._starts[i - 1]
+            self._seconds.append(self._seconds[-1] + length * self._rates[i - 1])
+
+    def __repr__(self):
+        return f'TempoMap({self.changes!r}, beat={self.beat!r})'
+
+    def __len__(self):
+        return len(self.changes)
+
+    def tempo(self, position: Fraction | float) -> float:
+        """Return the tempo at a position, in beats per minute."""
+        return self.changes[self._segment(position, self._starts)][1]
+
+    def seconds(self, position: Fraction | float) -> float:
+        """Return the time at a position (in whole notes), in seconds."""
+        # Work in floats; `Duration` arithmetic would return `Duration`s.
+        position = float(position)
+        i = self._segment(position, self._starts)
+        return self._seconds[i] + (position - self._starts[i]) * self._rates[i]
+
+    def position(self, seconds: float) -> Fraction:
+        """Return the position (in whole notes) at a time in seconds.
+
+        notes:
+            - the result is the closest fraction with a denominator of
+            at most a million, so positions round-trip exactly
+        """
+        seconds = float(seconds)
+        i = self._segment(seconds, self._seconds)
+        position = self._starts[i] + (seconds - self._seconds[i]) / self._rates[i]
+        return Fraction(position).limit_denominator(1_000_000)
+
+    def seconds_many(self, onsets: Iterable[float], resolution: int = 1) -> array:
+        """Convert many positions to seconds.
+
+        args:
+            - `onsets`: positions to convert, in ticks
+            - `resolution`: number of ticks in a whole note
+
+        returns:
+            - `array` of doubles with the time of each onset, in seconds
+
+        notes:
+            - while the onsets are in order, the tempo changes are
+            walked alongside them, so a sorted voice of n notes takes
+            O(n + changes) steps; an onset earlier than the one before
+            it falls back to a binary search
+        """
+        starts, rates, seconds = self._starts, self._rates, self._seconds
+        last = len(starts) - 1
+
+        result = array('d')
+        i, previous = 0, 0.0
+        for onset in onsets:
+            position = float(onset / resolution)
+            if position < previous:
+                i = self._segment(position, starts)
+            while i < last and starts[i + 1] <= position:
+                i += 1
+            result.append(seconds[i] + (position - starts[i]) * rates[i])
+            previous = position
+
+        return result
+
+    def _segment(self, value: float, starts: list[float]) -> int:
+        # Index of the segment containing `value`.
+        value = float(value)
+        if value < 0:
+            raise ValueError(f'negative score position or time: {value!r}')
+        return bisect_right(starts, value) - 1
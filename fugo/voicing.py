@@ -0,0 +1,330 @@
+__all__ = ['SATB', 'voice_lead', 'realize']
+
+from functools import cache
+from itertools import combinations
+from typing import Iterator, Sequence
+
+from fugo import Accidental, Chord, Key, LetterName, Note, NoteName
+from fugo.motion import Motion
+
+
+Voicing = tuple[Note, ...]
+Range = tuple[Note, Note]
+Figure = tuple[Accidental | None, int]
+
+# Ranges for bass, tenor, alto, and soprano (lowest voice first).
+SATB: tuple[Range, ...] = (
+    (Note('E2'), Note('C4')),
+    (Note('C3'), Note('G4')),
+    (Note('G3'), Note('D5')),
+    (Note('C4'), Note('G5')),
+)
+
+
+def voice_lead(
+    chords: Sequence[Chord],
+    voices: int = 4,
+    *,
+    ranges: Sequence[Range] | None = None,
+) -> list[Voicing]:
+    """Find the smoothest voicing of a chord progression.
+
+    args:
+        - `chords`: chords to voice, in order
+        - `voices`: number of voices
+        - `ranges`: lowest and highest note of each voice, lowest voice
+        first (defaults to `SATB` for four voices)
+
+    returns:
+        - list with one voicing per chord
+            - voicing: tuple of `Note`s, lowest voice first
+
+    raises:
+        - `ValueError` if no voicing satisfies the constraints
+
+    notes:
+        - the lowest voice always sounds the chord's bass
+        - every chord member is present, except that the fifth is
+        omitted when there are not enough voices
+        - voices never cross, and adjacent upper voices stay within an
+        octave of each other
+        - parallel unisons, fifths, and octaves are forbidden; among
+        the remaining paths, the one with the least total motion (in
+        semitones, summed over voices) is returned
+
+    examples:
+        >>> from fugo import Chord, voice_lead
+        >>> chords = [Chord(c) for c in ('C', 'F/C', 'G7/B', 'C')]
+        >>> for voicing in voice_lead(chords):
+        ...     print(*voicing)
+        C3 C3 G3 E4
+        C3 C3 A3 F4
+        B2 D3 G3 F4
+        C3 C3 G3 E4
+    """
+    if ranges is None:
+        if voices != len(SATB):
+            raise ValueError(f'ranges are required for {voices} voices')
+        ranges = SATB
+    ranges = tuple(ranges)
+
+    if len(ranges) != voices:
+        raise ValueError(f'expected {voices} ranges, got {len(ranges)}')
+
+    layers = []
+    for chord in chords:
+        names = tuple(chord.note_names)
+        required = _required(chord, voices)
+        basses = _notes_in_range(chord.bass, ranges[0])
+        layers.append(_voicings(basses, names, required, ranges[1:]))
+
+    return _solve(layers)
+
+
+def realize(
+    bass: Sequence[Note],
+    figures: Sequence[Sequence[Figure]],
+    key: Key,
+    *,
+    ranges: Sequence[Range] = SATB,
+) -> list[Voicing]:
+    """Realize a figured bass in four parts.
+
+    args:
+        - `bass`: notes of the bass line
+        - `figures`: figures for each bass note, in the format returned
+        by `Chord.figures` (shorthand figures are expanded)
+        - `key`: `Key` supplying accidentals for unaltered figures
+        - `ranges`: lowest and highest note of each voice, lowest voice
+        first (the bass is taken as given)
+
+    returns:
+        - list with one voicing per bass note
+            - voicing: tuple of `Note`s, lowest voice first
+
+    raises:
+        - `ValueError` if no realization satisfies the constraints
+
+    notes:
+        - the upper voices follow the same rules as `voice_lead`
+        - each bass note and set of figures is expanded into candidate
+        voicings once, and the search keeps only the cheapest path to
+        each upper-voice state
+
+    examples:
+        >>> from fugo import Accidental, Key, Note, realize
+        >>> bass = [Note(n) for n in 'C3 B2 C3'.split()]
+        >>> figures = [[], [(None, 6), (None, 5)], []]
+        >>> for voicing in realize(bass, figures, Key('C')):
+        ...     print(*voicing)
+        C3 C3 G3 E4
+        B2 D3 G3 F4
+        C3 C3 G3 E4
+    """
+    if len(bass) != len(figures):
+        raise ValueError('bass and figures must have the same length')
+
+    ranges = tuple(ranges)
+    scale = {name.letter: name for name in key}
+
+    layers = []
+    for note, figure in zip(bass, figures):
+        root = NoteName.from_attrs(note.letter, note.accidental)
+        names = (root, *_upper_names(note, figure, scale))
+        required = frozenset(names)
+        if len(required) > len(ranges) and len(names) > 3:
+            required -= {names[2]}
+        if len(required) > len(ranges):
+            raise ValueError(f'{len(ranges)} voices cannot realize {figure}')
+
+        layers.append(_voicings((note,), names, required, ranges[1:]))
+
+    return _solve(layers)
+
+
+# Complete figures, keyed by the figures that imply them.
+# fmt: off
+_IMPLIED = {
+    (): (5, 3), (3,): (5, 3), (5,): (5, 3), (5, 3): (5, 3),
+    (6,): (6, 3), (6, 3): (6, 3),
+    (6, 4): (6, 4),
+    (7,): (7, 5, 3), (7, 3): (7, 5, 3), (7, 5): (7, 5, 3), (7, 5, 3): (7, 5, 3),
+    (6, 5): (6, 5, 3), (6, 5, 3): (6, 5, 3),
+    (4, 3): (6, 4, 3), (6, 4, 3): (6, 4, 3),
+    (2,): (6, 4, 2), (4, 2): (6, 4, 2), (6, 4, 2): (6, 4, 2),
+}
+# fmt: on
+
+
+def _upper_names(
+    bass: Note, figures: Sequence[Figure], scale: dict[LetterName, NoteName]
+) -> list[NoteName]:
+    given = {number: symbol for symbol, number in figures}
+    numbers = tuple(sorted(given, reverse=True))
+    numbers = _IMPLIED.get(numbers, numbers)
+
+    letters = [*LetterName]
+    start = letters.index(bass.letter)
+
+    names = []
+    for number in numbers:
+        letter = letters[(start + number - 1) % len(letters)]
+        symbol = given.get(number)
+        if symbol is None:
+            names.append(scale[letter])
+        else:
+            names.append(NoteName.from_attrs(letter, symbol))
+
+    return names
+
+
+def _required(chord: Chord, voices: int) -> frozenset[NoteName]:
+    required = set(chord.note_names)
+    if len(required) > voices and len(chord.quality) > 2:
+        required.discard(chord.root + chord.quality[2])
+    if len(required) > voices:
+        raise ValueError(f'{voices} voices cannot sound every member of {chord}')
+    return frozenset(required)
+
+
+def _notes_in_range(name: NoteName, range_: Range) -> tuple[Note, ...]:
+    low, high = range_
+    notes = []
+    for octave in range(low.octave - 1, high.octave + 2):
+        note = Note.from_attrs(name.letter, name.accidental, octave)
+        if low.pitch <= note.pitch <= high.pitch:
+            notes.append(note)
+    return tuple(notes)
+
+
+@cache
+def _voicings(
+    basses: tuple[Note, ...],
+    names: tuple[NoteName, ...],
+    required: frozenset[NoteName],
+    ranges: tuple[Range, ...],
+) -> tuple[Voicing, ...]:
+    # Voicings of identical chords are shared, so they are only
+    # generated once per progression (or once per process, for chords
+    # that recur across progressions).
+    return tuple(_generate(basses, names, required, ranges))
+
+
+def _generate(
+    basses: tuple[Note, ...],
+    names: tuple[NoteName, ...],
+    required: frozenset[NoteName],
+    ranges: tuple[Range, ...],
+) -> Iterator[Voicing]:
+    candidates = [
+        sorted(
+            (note for name in names for note in _notes_in_range(name, range_)),
+            key=lambda note: note.pitch,
+        )
+        for range_ in ranges
+    ]
+
+    def extend(voicing: list[Note], missing: frozenset[NoteName]) -> Iterator[Voicing]:
+        depth = len(voicing) - 1
+        if depth == len(ranges):
+            if not missing:
+                yield tuple(voicing)
+            return
+
+        # Prune: the remaining voices can't supply every missing member.
+        if len(missing) > len(ranges) - depth:
+            return
+
+        below = voicing[-1]
+        for note in candidates[depth]:
+            # Don't cross the voice below.
+            if note.pitch < below.pitch:
+                continue
+            # Keep adjacent upper voices within an octave.
+            if depth and note.pitch - below.pitch > 12:
+                break
+
+            name = NoteName.from_attrs(note.letter, note.accidental)
+            voicing.append(note)
+            yield from extend(voicing, missing - {name})
+            voicing.pop()
+
+    for bass in basses:
+        name = NoteName.from_attrs(bass.letter, bass.accidental)
+        yield from extend([bass], required - {name})
+
+
+def _solve(layers: Sequence[Sequence[Voicing]]) -> list[Voicing]:
+    """Find the cheapest path through layers of candidate voicings.
+
+    Each state is a complete voicing, so paths that arrive at the same
+    voicing are merged and only the cheapest is extended.
+    """
+    if not layers:
+        return []
+
+    for i, layer in enumerate(layers):
+        if not layer:
+            raise ValueError(f'no valid voicing for chord {i}')
+
+    # (cost, voicing, pitches, back pointer)
+    states = [(0, v, tuple(n.pitch for n in v), None) for v in layers[0]]
+
+    for i, layer in enumerate(layers[1:], start=1):
+        states.sort(key=lambda state: state[0])
+        new_states = []
+
+        for voicing in layer:
+            pitches = tuple(n.pitch for n in voicing)
+            best = None
+
+            for state in states:
+                cost, previous, previous_pitches, _ = state
+
+                # States are sorted by cost and motion is never
+                # negative, so no later state can do better.
+                if best is not None and cost >= best[0]:
+                    break
+
+                motion = sum(abs(a - b) for a, b in zip(pitches, previous_pitches))
+                total = cost + motion
+                if best is not None and total >= best[0]:
+                    continue
+                if _parallels(previous, previous_pitches, voicing, pitches):
+                    continue
+
+                best = (total, voicing, pitches, state)
+
+            if best is not None:
+                new_states.append(best)
+
+        if not new_states:
+            raise ValueError(f'no valid voice leading into chord {i}')
+        states = new_states
+
+    state = min(states, key=lambda state: state[0])
+    path = []
+    while state is not None:
+        path.append(state[1])
+        state = state[3]
+
+    return path[::-1]
+
+
+def _parallels(
+    beat1: Voicing, pitches1: tuple[int, ...], beat2: Voicing, pitches2: tuple[int, ...]
+) -> bool:
+    for i, j in combinations(range(len(beat1)), 2):
+        before = (pitches1[j] - pitches1[i]) % 12
+        after = (pitches2[j] - pitches2[i]) % 12
+
+        # Only perfect intervals held across the beat can be parallel;
+        # check the remaining pairs with the full motion classifier.
+        if before != after or before not in (0, 7):
+            continue
+
+        motion = Motion.from_beats((beat1[i], beat1[j]), (beat2[i], beat2[j]))
+        if motion in (Motion.PARALLEL, Motion.ANTIPARALLEL):
+            return True
+
+    return False
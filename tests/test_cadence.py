@@ -0,0 +1,68 @@
+import pytest
+
+from fugo import Cadence, Chord, Key, Meter, Time, find_cadences, metric_weight
+
+
+def _chords(s: str) -> list[Chord]:
+    return [Chord(c) for c in s.split()]
+
+
+def _times(n: int) -> list[Time]:
+    # One chord per half note in 4/4.
+    return [Time(i // 2 + 1, 1 + 2 * (i % 2)) for i in range(n)]
+
+
+def _cadences(progression: str, key: str) -> list[tuple[int, Cadence]]:
+    chords = _chords(progression)
+    points = find_cadences(chords, _times(len(chords)), Key(key), Meter(4, 4))
+    return [(point.index, point.cadence) for point in points]
+
+
+def test_metric_weight():
+    assert metric_weight(Time(1, 1), Meter(4, 4)) == 1.0
+    assert metric_weight(Time(1, 3), Meter(4, 4)) == 0.75
+    assert metric_weight(Time(1, 2), Meter(4, 4)) == 0.5
+    assert metric_weight(Time(1, 4, 1 / 2), Meter(4, 4)) == 0.25
+    assert metric_weight(Time(1, 2), Meter(3, 4)) == 0.5
+    assert metric_weight(Time(1, 4), Meter(6, 8)) == 0.75
+    assert metric_weight(Time(1, 3), Meter(6, 8)) == 0.5
+
+
+def test_authentic():
+    assert _cadences('C F G C', 'C') == [(3, Cadence.PERFECT_AUTHENTIC)]
+    assert _cadences('C F G7 C', 'C') == [(3, Cadence.PERFECT_AUTHENTIC)]
+    assert _cadences('C F G C/E', 'C') == [(3, Cadence.IMPERFECT_AUTHENTIC)]
+    assert _cadences('C F Bº C', 'C') == [(3, Cadence.IMPERFECT_AUTHENTIC)]
+    assert _cadences('Am Dm E Am', 'a') == [(3, Cadence.PERFECT_AUTHENTIC)]
+    assert _cadences('Am Dm G#º7 Am', 'a') == [(3, Cadence.IMPERFECT_AUTHENTIC)]
+
+
+def test_half():
+    assert _cadences('C F C G', 'C') == [(3, Cadence.HALF)]
+    assert _cadences('C Am D G', 'C') == [(3, Cadence.HALF)]
+    assert _cadences('C G G7 C', 'C') == [(3, Cadence.PERFECT_AUTHENTIC)]
+    assert _cadences('C G F C', 'C') == [(1, Cadence.HALF)]
+
+
+def test_deceptive():
+    assert _cadences('C F G Am', 'C') == [(3, Cadence.DECEPTIVE)]
+    assert _cadences('Am Dm E7 F', 'a') == [(3, Cadence.DECEPTIVE)]
+    assert _cadences('C F Bº Am', 'C') == []
+
+
+def test_phrygian():
+    assert _cadences('Am C Dm/F E', 'a') == [(3, Cadence.PHRYGIAN)]
+    assert _cadences('Am C Dm E', 'a') == [(3, Cadence.HALF)]
+
+
+def test_strength():
+    chords = _chords('C F G C G C')
+    times = [Time(1, 1), Time(1, 2), Time(1, 3), Time(1, 4), Time(2, 3), Time(3, 1)]
+    points = find_cadences(chords, times, Key('C'), Meter(4, 4))
+    assert [point.strength for point in points] == [0.5, 1.0]
+    assert points[1].time == Time(3, 1)
+
+
+def test_invalid():
+    with pytest.raises(ValueError):
+        find_cadences(_chords('C G'), [Time(1, 1)], Key('C'), Meter(4, 4))
@@ -1,5 +1,10 @@
+import dataclasses
+import pickle
+
+import pytest
+
 from fugo import Accidental, Interval, Key, NoteName
-from fugo import Chord, Quality
+from fugo import Chord, Quality, figures_many, precompute_figures
 
 
 def test_parsing():
@@ -144,3 +149,53 @@ def test_figures():
         for k, figures in cases.items():
             key = Key(k)
             assert chord.figures(key) == figures
+
+
+def test_figures_many():
+    key = Key('G')
+    chords = [Chord(c) for c in 'G C/E D7/F# G'.split()]
+    SHARP = Accidental.SHARP
+
+    assert figures_many(chords, key) == [[], [(None, 6)], [(None, 6), (None, 5)], []]
+    assert figures_many(chords, key) == [chord.figures(key) for chord in chords]
+    assert figures_many(chords[2:3]) == [
+        [(Accidental.NATURAL, 6), (Accidental.NATURAL, 5), (Accidental.NATURAL, 3)]
+    ]
+    assert figures_many([Chord('E')], key, shorthand=False) == [[(None, 5), (SHARP, 3)]]
+
+
+def test_precompute_figures():
+    precompute_figures([Key('Fb locrian'), Key('D')])
+
+    figures = Chord('A7').figures(Key('D'))
+    assert figures == [(None, 7)]
+
+    # Returned lists are copies, not the stored table entries.
+    figures.clear()
+    assert Chord('A7').figures(Key('D')) == [(None, 7)]
+
+
+def test_hash():
+    assert hash(Chord('G7')) == hash(Chord('G7'))
+    assert len({Chord('C'), Chord('C'), Chord('C/E'), Chord('Cm')}) == 3
+
+
+def test_immutable():
+    chord = Chord('G7/B')
+    with pytest.raises(dataclasses.FrozenInstanceError):
+        chord.inversion = 0
+    assert not hasattr(chord, '__dict__')
+    assert pickle.loads(pickle.dumps(chord)) == chord
+    assert Chord(NoteName('G'), Quality.MAJ_MIN_7, 1) == chord
+
+
+def test_code():
+    for name in ('C', 'Bbm/Db', 'F#º7/C', 'Ebø7/Db', 'Dx+'):
+        chord = Chord(name)
+        assert Chord.from_code(chord.code) == chord
+        assert pickle.loads(pickle.dumps(chord)) == chord
+
+    custom = Chord(NoteName('C'), [Interval('P1'), Interval('P5')])
+    with pytest.raises(ValueError):
+        custom.code
+    assert pickle.loads(pickle.dumps(custom)) == custom
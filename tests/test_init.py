@@ -0,0 +1,35 @@
+import importlib
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+import fugo
+
+
+def test_exports():
+    for module, names in fugo._EXPORTS.items():
+        assert importlib.import_module(f'fugo.{module}').__all__ == names
+
+    assert len(set(fugo.__all__)) == len(fugo.__all__)
+    assert set(fugo.__all__) <= set(dir(fugo))
+
+
+def test_lazy():
+    code = (
+        'import sys, fugo\n'
+        'assert not [m for m in sys.modules if m.startswith("fugo.")]\n'
+        'fugo.Note\n'
+        'assert "fugo.note" in sys.modules and "fugo.score" not in sys.modules\n'
+        'assert fugo.time.Clock is fugo.Clock\n'
+    )
+    root = Path(fugo.__file__).parent.parent
+    subprocess.run([sys.executable, '-c', code], check=True, cwd=root)
+
+
+def test_missing():
+    with pytest.raises(AttributeError):
+        fugo.Missing
+    with pytest.raises(ImportError):
+        from fugo import Missing  # noqa: F401
@@ -0,0 +1,92 @@
+import json
+
+import pytest
+
+import fugo
+import fugo.motion
+from fugo import Chord, Instrumentation, Interval, Key, Note
+from fugo.note import distance
+
+
+def _notes(s: str, /) -> list[Note]:
+    return [Note(n) for n in s.split()]
+
+
+def test_calls():
+    upper = _notes('E5 F5 G5 A5')
+    lower = _notes('C5 D5 C5 F5')
+
+    with Instrumentation() as stats:
+        fugo.analyze_motion(upper, lower)
+        Note('C4') + Interval('P5')
+
+    calls = stats.snapshot()['calls']
+    assert calls['motion.analyze_motion']['count'] == 1
+    assert calls['motion.Motion.from_beats']['count'] == 3
+    assert calls['note.distance']['count'] == 6
+    assert calls['note.Note.__add__']['count'] == 1
+    assert calls['note.Note.from_string']['count'] == 1
+    assert calls['motion.analyze_motion']['seconds'] > 0
+    assert 'chord.Chord.figures' not in calls
+
+
+def test_caches():
+    with Instrumentation() as stats:
+        for _ in range(3):
+            list(Key('Ab dorian'))
+        assert stats.snapshot()['calls']['key.Key.__iter__']['count'] == 3
+        Chord('C').figures(Key('C'))
+
+    caches = stats.snapshot()['caches']
+    assert caches['key._scale']['hits'] >= 2
+    assert 0 < caches['key._scale']['hit_rate'] <= 1
+    assert 'chord._variants' in caches
+
+
+def test_disabled():
+    # Methods (and properties and classmethods, as stored on the class)
+    # and module-level functions, in every namespace that binds them.
+    def patched():
+        return [
+            vars(Note)['__add__'],
+            vars(Note)['from_string'],
+            vars(Interval)['steps'],
+            vars(Key)['__iter__'],
+            vars(Chord)['figures'],
+            fugo.note.distance,
+            fugo.motion.distance,
+            fugo.analyze_motion,
+            fugo.motion.analyze_motion,
+        ]
+
+    originals = patched()
+
+    stats = Instrumentation()
+    stats.enable()
+    for current, original in zip(patched(), originals):
+        assert current is not original
+    stats.disable()
+
+    for current, original in zip(patched(), originals):
+        assert current is original
+    assert fugo.motion.distance is distance
+
+    # Counts are kept after disabling, and nothing more is counted.
+    Note('C4')
+    assert stats.snapshot() == {'calls': {}, 'caches': stats.snapshot()['caches']}
+
+
+def test_reset():
+    with Instrumentation() as stats:
+        Note('C4')
+        stats.reset()
+        Note('D4')
+        Note('E4')
+    assert stats.snapshot()['calls']['note.Note.from_string']['count'] == 2
+    assert json.loads(stats.json()) == stats.snapshot()
+
+
+def test_exclusive():
+    with Instrumentation():
+        with pytest.raises(RuntimeError):
+            Instrumentation().enable()
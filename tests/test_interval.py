@@ -1,4 +1,10 @@
-from fugo import Interval, Note, distance
+import dataclasses
+import pickle
+from array import array
+
+import pytest
+
+from fugo import Consonance, Interval, Note, Packed, consonances, distance
 from fugo.interval import Size, Quality
 
 
@@ -63,3 +69,51 @@ def test_addition():
 
     for a, b, c in cases:
         assert Interval(a) + Interval(b) == Interval(c), Interval(a) + Interval(b)
+
+
+def test_immutable():
+    interval = Interval('m3')
+    with pytest.raises(dataclasses.FrozenInstanceError):
+        interval.size = Size.SIXTH
+    assert not hasattr(interval, '__dict__')
+    assert pickle.loads(pickle.dumps(interval)) == interval
+    assert Interval(Quality.MINOR, Size.THIRD) == interval
+
+
+def test_code():
+    for quality in Quality:
+        for size in Size:
+            try:
+                interval = Interval(quality, size)
+            except ValueError:
+                continue
+            assert Interval.from_code(interval.code) == interval
+
+
+def test_consonance():
+    expected = {
+        Consonance.PERFECT: 'P1 P5 P8',
+        Consonance.IMPERFECT: 'm3 M3 m6 M6',
+        Consonance.DISSONANT: 'd1 A1 m2 M2 A2 d3 A3 d4 P4 A4 d5 A5 m7 M7 d8 A8',
+    }
+    for consonance, intervals in expected.items():
+        for interval in intervals.split():
+            assert Interval(interval).consonance() is consonance
+
+    assert Interval('P4').consonance(bass=False) is Consonance.PERFECT
+    assert Interval('A4').consonance(bass=False) is Consonance.DISSONANT
+    assert distance(Note('C4'), Note('E5')).consonance() is Consonance.IMPERFECT
+
+
+def test_consonances():
+    intervals = [Interval(i) for i in 'P1 m2 M3 P4 A4 P5 M6 M7 P8 d5'.split()]
+    codes = [interval.code for interval in intervals]
+
+    for bass in (True, False):
+        expected = bytes(i.consonance(bass=bass).value for i in intervals)
+        assert consonances(codes, bass=bass) == expected
+        assert consonances(array('h', codes), bass=bass) == expected
+        assert consonances(memoryview(array('q', codes)), bass=bass) == expected
+        assert consonances(Packed(intervals).codes, bass=bass) == expected
+
+    assert consonances([]) == b''
@@ -1,4 +1,9 @@
-from fugo import NoteName
+import dataclasses
+import pickle
+
+import pytest
+
+from fugo import Chord, NoteName
 from fugo import Degree, Mode, Key
 
 
@@ -35,3 +40,67 @@ def test_get_degree():
     assert Key('B')[Degree.LEADING_TONE] == NoteName('A#')
     assert Key('B')[Degree.SUBTONIC] == NoteName('A')
     assert Key('B')[Degree(7)] == NoteName('A#')
+
+
+def test_triads():
+    triads = [Chord(c) for c in 'C Dm Em F G Am Bº'.split()]
+    assert list(Key('C').triads) == triads
+
+    triads = [Chord(c) for c in 'F#m G#º A Bm C#m D E'.split()]
+    assert list(Key('f#').triads) == triads
+
+
+def test_sevenths():
+    sevenths = [Chord(c) for c in 'Dm7 Em7 FM7 G7 Am7 Bø7 CM7'.split()]
+    assert list(Key('D dorian').sevenths) == sevenths
+
+
+def test_numeral():
+    key = Key('Bb')
+    expected = {
+        'Bb': 'I',
+        'Cm/Eb': 'ii',
+        'Aº': 'viiº',
+        'F7': 'V7',
+        'EbM7/G': 'IVM7',
+        'C7': 'V7/V',
+        'D': 'V/vi',
+        'A': 'V/iii',
+        'G7/F': 'V7/ii',
+        'E': None,
+        'Bbm': None,
+    }
+
+    for chord, numeral in expected.items():
+        assert key.numeral(Chord(chord)) == numeral
+
+    assert Key('c').numeral(Chord('Bb7')) == 'VII7'
+
+    # Minor keys include the chords of the raised leading tone.
+    minor = {'E': 'V', 'E7/G#': 'V7', 'Em': 'v', 'G#º': 'viiº', 'G#º7': 'viiº7'}
+    for chord, numeral in minor.items():
+        assert Key('a').numeral(Chord(chord)) == numeral
+    assert Key('A dorian').numeral(Chord('G#º')) is None
+
+
+def test_hash():
+    assert hash(Key('C')) == hash(Key('C'))
+    assert len({Key('C'), Key('C'), Key('c')}) == 2
+
+
+def test_immutable():
+    key = Key('f#')
+    with pytest.raises(dataclasses.FrozenInstanceError):
+        key.mode = Mode.MAJOR
+    assert not hasattr(key, '__dict__')
+    assert pickle.loads(pickle.dumps(key)) == key
+    assert Key(NoteName('F#'), Mode.MINOR) == key
+
+
+def test_code():
+    codes = set()
+    for name in ('C', 'c#', 'Ebb', 'Ax dorian', 'Fb lydian'):
+        key = Key(name)
+        assert Key.from_code(key.code) == key
+        codes.add(key.code)
+    assert len(codes) == 5
@@ -0,0 +1,53 @@
+import random
+
+import pytest
+
+from fugo import Chord, ChordModel, Key
+
+
+def _chords(s: str, /) -> list[Chord]:
+    return [Chord(c) for c in s.split()]
+
+
+PIECES = [
+    (_chords('C F G7 C Am Dm G7 C'), Key('C')),
+    (_chords('G C D7 G Em Am D7 G'), Key('G')),
+]
+
+
+def test_probability():
+    model = ChordModel(3)
+    model.train(PIECES)
+
+    # Both pieces are I IV V7 I vi ii V7 I (relative to their keys).
+    assert len(model) == 5
+    assert model.probability(Chord('G7'), _chords('Am Dm'), Key('C')) == 1.0
+    assert model.probability(Chord('Bb'), _chords('F'), Key('F')) == 0.5
+    assert model.probability(Chord('C7'), _chords('Gm'), Key('F')) == 1.0
+    assert model.probability(Chord('E'), _chords('C'), Key('C')) == 0.0
+
+
+def test_parallel_training():
+    serial = ChordModel(3)
+    serial.train(PIECES * 10)
+
+    parallel = ChordModel(3)
+    parallel.train(PIECES * 10, processes=2)
+
+    context = _chords('Bb C7')
+    for chord in _chords('F Dm Bb C7'):
+        expected = serial.probability(chord, context, Key('F'))
+        assert parallel.probability(chord, context, Key('F')) == expected
+
+
+def test_sample():
+    model = ChordModel(3)
+    model.train(PIECES)
+
+    chords = model.sample(8, Key('D'), rng=random.Random(0))
+    assert len(chords) == 8
+    assert chords[0] == Chord('D')
+    assert set(chords) <= set(_chords('D G A7 Bm Em'))
+
+    with pytest.raises(ValueError):
+        ChordModel().sample(4, Key('C'))
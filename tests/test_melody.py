@@ -0,0 +1,204 @@
+from itertools import permutations
+
+import pytest
+
+from fugo import Direction, Duration, Interval, Melody, Note, Packed, distance
+from fugo import extract_features
+
+
+def _notes(s: str, /) -> list[Note]:
+    return [Note(n) for n in s.split()]
+
+
+SUBJECT = _notes('D4 A4 F4 D4 C#4 D4 E4 F4 G4 F4 E4 D4')
+
+
+def test_transpose():
+    for name in ('P5', 'm3', 'A4', 'd7', 'P8'):
+        interval = Interval(name)
+        melody = Melody(SUBJECT)
+        assert melody.transpose(interval).notes() == [n + interval for n in SUBJECT]
+        assert melody.transpose(interval, down=True).notes() == [
+            n - interval for n in SUBJECT
+        ]
+
+    chained = Melody(SUBJECT).transpose(Interval('M3')).transpose(Interval('m3'))
+    assert chained.notes() == [n + Interval('P5') for n in SUBJECT]
+
+
+def test_invert():
+    melody = Melody(_notes('C4 E4 G4 Bb3 F#5'))
+    assert melody.invert().notes() == _notes('C4 Ab3 F3 D4 Gb2')
+    assert melody.invert(Note('E4')).notes() == _notes('G#4 E4 C#4 A#4 D3')
+    assert melody.invert().invert().notes() == _notes('C4 E4 G4 Bb3 F#5')
+
+    # The default axis is the first note after the preceding steps.
+    answer = melody.transpose(Interval('P5')).invert()
+    assert answer.notes() == _notes('G4 Eb4 C4 A4 Db3')
+
+
+def test_retrograde():
+    melody = Melody(SUBJECT, [Duration(1, 4)] * 11 + [Duration(1, 2)])
+    assert melody.retrograde().notes() == SUBJECT[::-1]
+    assert melody.retrograde().durations()[0] == Duration(1, 2)
+    assert melody.retrograde().retrograde().notes() == SUBJECT
+
+    # Inverting a retrograde uses its first note (the original's last).
+    assert melody.retrograde().invert().notes()[-1] == Note('D4')
+    assert melody.retrograde().invert().notes()[4] == Note('B3')
+
+
+def test_augment():
+    durations = [Duration(1, 8), Duration(3, 8), Duration(1, 4)]
+    melody = Melody(_notes('C4 D4 E4'), durations)
+    assert melody.augment().durations() == [d * 2 for d in durations]
+    assert melody.diminish(3).durations() == [d / 3 for d in durations]
+    assert melody.augment(3).diminish(3).durations() == durations
+    assert all(isinstance(d, Duration) for d in melody.augment().durations())
+
+    with pytest.raises(ValueError):
+        Melody(_notes('C4')).augment(2)
+
+
+def test_lazy():
+    melody = Melody(SUBJECT)
+    melody.transpose(Interval('P4')).invert().retrograde()
+    assert melody.notes() == SUBJECT
+
+    # Iterators are read once, so the melody can be read many times.
+    answer = Melody(iter(SUBJECT)).transpose(Interval('P5')).invert().retrograde()
+    expected = Melody(SUBJECT).transpose(Interval('P5')).invert().retrograde()
+    assert list(answer) == expected.notes()
+    assert list(answer) == expected.notes()
+
+
+def test_step_order():
+    # Applying the steps lazily gives the same notes as applying them
+    # one at a time, in any order.
+    steps = [
+        lambda melody: melody.transpose(Interval('P5')),
+        lambda melody: melody.transpose(Interval('m3'), down=True),
+        lambda melody: melody.invert(),
+        lambda melody: melody.invert(Note('E4')),
+        lambda melody: melody.retrograde(),
+    ]
+    notes = _notes('C4 D4 E4 Bb3')
+    for order in permutations(steps, 3):
+        expected = notes
+        for step in order:
+            expected = step(Melody(expected)).notes()
+
+        for source in (notes, Packed(notes), iter(notes)):
+            melody = Melody(source)
+            for step in order:
+                melody = step(melody)
+            assert melody.notes() == expected
+
+    melody = Melody(_notes('C4 D4 E4'))
+    assert melody.invert().retrograde().notes() == _notes('Ab3 Bb3 C4')
+    assert melody.retrograde().invert().notes() == _notes('E4 F#4 G#4')
+
+
+def test_pack():
+    packed = Packed(SUBJECT)
+    melody = Melody(packed).transpose(Interval('M2')).retrograde()
+    assert isinstance(melody.pack(), Packed)
+    assert list(melody.pack()) == [n + Interval('M2') for n in SUBJECT[::-1]]
+    assert list(melody) == list(melody.pack())
+    assert Melody(SUBJECT).invert().pack() == Packed(Melody(packed).invert())
+
+
+def test_unspellable():
+    melody = Melody(_notes('C4 Bx4'))
+    with pytest.raises(ValueError):
+        melody.transpose(Interval('A4')).notes()
+
+    # Only the final notes need to be spellable.
+    there_and_back = melody.transpose(Interval('A4')).transpose(
+        Interval('A4'), down=True
+    )
+    assert there_and_back.notes() == _notes('C4 Bx4')
+
+
+def test_sequence():
+    durations = [Duration(1, 4)] * len(SUBJECT)
+    for source in (SUBJECT, Packed(SUBJECT), iter(SUBJECT)):
+        melody = Melody(source, durations).transpose(Interval('P5')).retrograde()
+        expected = [n + Interval('P5') for n in SUBJECT[::-1]]
+        assert len(melody) == len(SUBJECT)
+        assert [melody[i] for i in range(len(melody))] == expected
+        assert melody[-1] == expected[-1]
+        with pytest.raises(IndexError):
+            melody[len(SUBJECT)]
+
+    melody = Melody(_notes('C4 D4 E4'))
+    melody[1] = Note('F4')
+    assert melody[1] == Note('F4')
+    assert melody.invert()[1] == Note('G3')
+
+
+def test_features():
+    melody = Melody(_notes('C4 E4 D4 D4 B3 Cb5'))
+    assert melody.intervals == tuple(
+        distance(a, b) for a, b in zip(melody.notes(), melody.notes()[1:])
+    )
+    assert melody.contour == (
+        Direction.UP,
+        Direction.DOWN,
+        Direction.NONE,
+        Direction.DOWN,
+        Direction.UP,
+    )
+    assert melody.range == (Note('B3'), Note('Cb5'))
+    assert melody.histogram == (1, 0, 2, 0, 1, 0, 0, 0, 0, 0, 0, 2)
+    assert melody.leaps == 3
+    assert melody.features is melody.features
+
+    empty = Melody([])
+    assert empty.range is None
+    assert empty.intervals == ()
+    assert empty.leaps == 0
+
+
+def test_invalidation():
+    notes = _notes('C4 D4 E4')
+    melody = Melody(notes, [Duration(1, 4)] * 3)
+    answer = melody.transpose(Interval('P5'))
+    assert melody.leaps == 0
+
+    melody.append(Note('C5'), Duration(1, 2))
+    assert melody.leaps == 1
+    assert melody.range == (Note('C4'), Note('C5'))
+    melody[0] = Note('G3')
+    assert melody.range == (Note('G3'), Note('C5'))
+    assert melody.notes() == _notes('G3 D4 E4 C5')
+    assert melody.durations()[-1] == Duration(1, 2)
+
+    # The original list and derived melodies are unaffected.
+    assert notes == _notes('C4 D4 E4')
+    assert answer.notes() == _notes('G4 A4 B4')
+
+    # Changing a transformed melody applies the transformation first.
+    answer.extend(_notes('D5'), [Duration(1, 4)])
+    assert answer.notes() == _notes('G4 A4 B4 D5')
+    assert answer.histogram[2] == 1
+
+    with pytest.raises(ValueError):
+        answer.append(Note('E5'))
+    with pytest.raises(ValueError):
+        Melody(notes).append(Note('E5'), Duration(1, 4))
+
+
+def test_extract_features():
+    melodies = [
+        Melody(SUBJECT),
+        SUBJECT[::-1],
+        Melody(SUBJECT).transpose(Interval('M2')),
+        [],
+    ]
+    features = extract_features(melodies)
+    assert features[0] is melodies[0].features
+    assert features[1] == Melody(SUBJECT[::-1]).features
+    assert features[2].intervals == features[0].intervals
+    assert features[2].lowest == Note('D#4')
+    assert features[3].lowest is None
@@ -0,0 +1,108 @@
+from itertools import product
+
+from fugo import Chord, Duration, Key, Mode, Note
+from fugo import find_keys, track_keys
+
+
+def _chords(s: str, /) -> list[Chord]:
+    return [Chord(c) for c in s.split()]
+
+
+def _names(keys: list[Key]) -> list[str]:
+    return [f'{key.tonic} {key.mode.name}' for key in keys]
+
+
+def test_modulation():
+    chords = _chords('C F G7 C D7 G Am D7 G')
+    keys = track_keys(chords, modes=[Mode.MAJOR, Mode.MINOR])
+
+    assert _names(keys) == ['C MAJOR'] * 4 + ['G MAJOR'] * 5
+
+
+def test_single_key():
+    chords = _chords('Eb Ab Bb7 Eb Cm Fm Bb7 Eb')
+    keys = track_keys(chords)
+
+    assert _names(keys) == ['Eb MAJOR'] * len(chords)
+
+
+def test_empty():
+    assert track_keys([]) == []
+
+
+def test_hand_worked():
+    modes = [Mode.MAJOR, Mode.MINOR]
+    chords = _chords('Am E Am')
+
+    # Staying in A minor costs -1 + 2 + -1 = 0 (the G# of E is
+    # chromatic); moving to E major and back costs -1 + -1 + -1 plus
+    # 1.5 + 0.5 * 4 + 0.5 = 4 for each key change.
+    keys = track_keys(chords, modes=modes)
+    assert _names(keys) == ['A MINOR'] * 3
+
+    # With free key changes, each chord takes its cheapest key.
+    free = dict(modulation=0.0, distance=0.0, mode_change=0.0)
+    keys = track_keys(chords, modes=modes, **free)
+    assert _names(keys) == ['A MINOR', 'E MAJOR', 'A MINOR']
+
+    # C costs -1 in C major and 0 in F major, F costs 0 and -1, and G
+    # costs 0 and 2 (for the B). Moving to F major for the F chord saves
+    # 1, but each of the two key changes costs 1.5 + 0.5 = 2.
+    keys = track_keys(_chords('C F G C'), modes=modes)
+    assert _names(keys) == ['C MAJOR'] * 4
+
+
+def test_matches_exhaustive_search():
+    # Compare against a brute-force search over every path through the
+    # keys with at most one sharp or flat, with the model written out.
+    modes = [Mode.MAJOR, Mode.MINOR]
+    chords = _chords('Am E C Dm Bb')
+    members = ['A C E', 'E G# B', 'C E G', 'D F A', 'Bb D F']
+    scales = {
+        'C MAJOR': (0, 'C D E F G A B'),
+        'G MAJOR': (1, 'G A B C D E F#'),
+        'F MAJOR': (-1, 'F G A Bb C D E'),
+        'A MINOR': (0, 'A B C D E F G'),
+        'E MINOR': (1, 'E F# G A B C D'),
+        'D MINOR': (-1, 'D E F G A Bb C'),
+    }
+    keys = list(scales)
+
+    def emission(chord: str, key: str) -> float:
+        notes = chord.split()
+        missing = sum(note not in scales[key][1].split() for note in notes)
+        return 2.0 * missing - (1.0 if notes[0] == key.split()[0] else 0.0)
+
+    def transition(a: str, b: str) -> float:
+        if a == b:
+            return 0.0
+        steps = abs(scales[a][0] - scales[b][0])
+        return 1.5 + 0.5 * steps + (0.5 if a.split()[1] != b.split()[1] else 0.0)
+
+    def cost(path: tuple[str, ...]) -> float:
+        total = sum(emission(c, key) for c, key in zip(members, path))
+        return total + sum(transition(a, b) for a, b in zip(path, path[1:]))
+
+    best = min(cost(path) for path in product(keys, repeat=len(chords)))
+    path = tuple(_names(track_keys(chords, modes=modes)))
+
+    assert set(path) <= set(keys)
+    assert cost(path) == best
+
+
+def test_find_keys():
+    melody = [Note(n) for n in 'C4 D4 E4 F4 G4 E4 C4 F#4 G4 A4 B4 D5 G4'.split()]
+    keys = find_keys(melody, window=6)
+
+    assert len(keys) == len(melody) - 5
+    assert _names(keys[:1]) == ['C MAJOR']
+    assert _names(keys[-1:]) == ['G MAJOR']
+
+
+def test_find_keys_durations():
+    # Long notes on A keep the arpeggio from reading as C major.
+    melody = [Note(n) for n in 'A3 C4 E4 A4 E4 C4'.split()]
+    durations = [Duration.WHOLE, *[Duration.EIGHTH] * 4, Duration.WHOLE]
+
+    assert _names(find_keys(melody, durations)) == ['A MINOR']
+    assert find_keys([]) == []
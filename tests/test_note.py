@@ -1,4 +1,9 @@
-from fugo import Accidental, LetterName
+import dataclasses
+import pickle
+
+import pytest
+
+from fugo import Accidental, LetterName, NoteName
 from fugo import Interval, Note
 
 
@@ -82,3 +87,41 @@ def test_subtraction():
 
     for a, b, c in cases:
         assert Note(a) - Interval(b) == Note(c), Note(a) - Interval(b)
+
+
+def test_diatonic():
+    """Test the `Note.diatonic` property."""
+    expected = {
+        Note('C-1'): 0,
+        Note('B#3'): 34,
+        Note('C4'): 35,
+        Note('Cb4'): 35,
+        Note('G4'): 39,
+    }
+
+    for note, number in expected.items():
+        assert note.diatonic == number
+
+
+def test_immutable():
+    for obj in (Note('C#4'), NoteName('C#')):
+        with pytest.raises(dataclasses.FrozenInstanceError):
+            obj.letter = LetterName.D
+        assert not hasattr(obj, '__dict__')
+        assert pickle.loads(pickle.dumps(obj)) == obj
+
+    assert Note(LetterName.C, Accidental.SHARP, 4) == Note('C#4')
+    assert NoteName(LetterName.C, Accidental.SHARP) == NoteName('C#')
+
+
+def test_code():
+    for string in ('C4', 'Bbb-1', 'Cx8', 'E#3', 'Fb-5'):
+        note = Note(string)
+        assert Note.from_code(note.code) == note
+        assert Note.decode(note.code) == note
+        assert Note.decode(note.code) is Note.decode(note.code)
+        assert note.code // 5 == note.diatonic
+
+    notes = [Note(n) for n in 'Cbb4 Cb4 C4 C#4 Cx4 Dbb4'.split()]
+    first = notes[0].code
+    assert [note.code for note in notes] == list(range(first, first + 6))
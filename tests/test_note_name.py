@@ -167,3 +167,9 @@ def test_subtraction():
 
     for a, b, c in cases:
         assert NoteName(a) - NoteName(b) == Interval(c)
+
+
+def test_fifths():
+    names = 'Fbb Cbb Gbb Fb Bb F C G D A E B F# B# Cx Bx'.split()
+    fifths = [NoteName(name).fifths for name in names]
+    assert fifths == [-15, -14, -13, -8, -2, -1, 0, 1, 2, 3, 4, 5, 6, 12, 14, 19]
@@ -0,0 +1,68 @@
+import pickle
+from array import array
+
+import pytest
+
+from fugo import Chord, Interval, Key, Note, NoteName, Packed
+
+
+def _notes(s: str, /) -> list[Note]:
+    return [Note(n) for n in s.split()]
+
+
+def test_sequence():
+    notes = _notes('C4 Bb3 C#5 Fbb-1 Gx9')
+    packed = Packed(notes)
+
+    assert len(packed) == 5
+    assert list(packed) == notes
+    assert packed[2] == Note('C#5')
+    assert packed[-1] == Note('Gx9')
+    assert packed[1:3] == Packed(notes[1:3])
+    assert Note('Bb3') in packed
+    assert packed[0] is packed[0]
+
+
+def test_kinds():
+    for items in (
+        [NoteName('C#'), NoteName('Ebb')],
+        [Interval('P5'), Interval('d7')],
+        [Key('c'), Key('F# dorian')],
+        [Chord('G7/F'), Chord('Bbm')],
+    ):
+        packed = Packed(items)
+        assert packed.kind is type(items[0])
+        assert list(pickle.loads(pickle.dumps(packed))) == items
+
+
+def test_pickle():
+    notes = _notes('C4 D4 E4 F4 G4 A4 B4 C5') * 1000
+    packed = Packed(notes)
+
+    data = pickle.dumps(packed)
+    assert len(data) < 2 * len(notes) + 100
+    assert pickle.loads(data) == packed
+
+    assert len(pickle.dumps(notes)) < 10 * len(notes)
+    assert pickle.loads(pickle.dumps(notes)) == notes
+
+
+def test_invalid():
+    assert len(Packed([], Note)) == 0
+
+    with pytest.raises(ValueError):
+        Packed([])
+    with pytest.raises(TypeError):
+        Packed([Note('C4'), NoteName('C')])
+    with pytest.raises(TypeError):
+        Packed([1, 2, 3])
+
+
+def test_from_codes():
+    notes = [Note(n) for n in 'C4 D4 Eb4'.split()]
+    codes = [note.code for note in notes]
+    assert Packed.from_codes(Note, codes) == Packed(notes)
+    assert list(Packed.from_codes(Note, memoryview(array('h', codes)))) == notes
+
+    shared = array('h', codes)
+    assert Packed.from_codes(Note, shared).codes is shared
@@ -0,0 +1,71 @@
+import pytest
+
+from fugo import Interval, Note, NoteName, RowMatch, ToneRow
+
+
+# The row of Webern's Symphony, Op. 21.
+ROW = 'A F# G Ab E F B Bb D C# C Eb'
+
+
+def test_parsing():
+    row = ToneRow.from_string(ROW)
+    assert row.pitch_classes == (9, 6, 7, 8, 4, 5, 11, 10, 2, 1, 0, 3)
+    assert row.names == tuple(NoteName(n) for n in ROW.split())
+    assert ToneRow.from_string('9 6 7 8 4 5 11 10 2 1 0 3').names is None
+
+    with pytest.raises(ValueError):
+        ToneRow.from_string('C D E')
+    with pytest.raises(ValueError):
+        ToneRow(range(11))
+
+
+def test_matrix():
+    row = ToneRow(range(12))
+    matrix = row.matrix
+
+    assert matrix[0] == tuple(range(12))
+    assert [r[0] for r in matrix] == [0, *range(11, 0, -1)]
+    for r in matrix:
+        assert sorted(r) == list(range(12))
+
+
+def test_forms():
+    row = ToneRow.from_string(ROW)
+    forms = row.forms
+
+    assert len(forms) == 48
+    assert forms['P9'] == row.pitch_classes
+    assert forms['R9'] == row.pitch_classes[::-1]
+    assert forms['I9'] == (9, 0, 11, 10, 2, 1, 7, 8, 4, 5, 6, 3)
+    assert forms['RI9'] == forms['I9'][::-1]
+    assert forms['P0'] == tuple((pc + 3) % 12 for pc in row.pitch_classes)
+
+
+def test_transformations():
+    row = ToneRow.from_string('C B G Ab Eb Db D Bb F# F E A')
+
+    assert row.transpose(Interval('m3')) == ToneRow.from_string(
+        'Eb D Bb Cb Gb Fb F Db A Ab G C'
+    )
+    assert row.invert().pitch_classes == row.forms['I0']
+    assert row.retrograde().names == row.names[::-1]
+    assert row.invert().invert() == row
+
+    unspelled = ToneRow(row.pitch_classes)
+    assert unspelled.transpose(Interval('m3')).names is None
+    assert unspelled.transpose(Interval('m3')).pitch_classes == row.forms['P3']
+
+
+def test_find():
+    row = ToneRow.from_string('C B G Ab Eb Db D Bb F# F E A')
+
+    voice1 = [3, 7, *row.forms['R2'], 1]
+    voice2 = [Note.from_attrs(n.letter, n.accidental, 4) for n in row.names]
+    voice2 += [Note('F4'), Note('F#4'), *row.forms['I5'][2:]]
+
+    assert row.find(voice1, voice2) == [
+        RowMatch(0, 2, 'R2'),
+        RowMatch(1, 0, 'P0'),
+        RowMatch(1, 12, 'I5'),
+    ]
+    assert row.find([Note('C4')] * 20) == []
@@ -0,0 +1,90 @@
+import struct
+from fractions import Fraction
+
+import pytest
+
+from fugo import Duration, Key, Meter, Note, Packed, ScoreFile, open_score, write_score
+from fugo import load_voices
+
+
+def _notes(s: str, /) -> list[Note]:
+    return [Note(n) for n in s.split()]
+
+
+SOPRANO = _notes('C5 B4 C5 D5 Eb5')
+BASS = _notes('C3 G2 Ab2 Bbb-1 Cx8')
+
+
+@pytest.fixture
+def path(tmp_path):
+    path = tmp_path / 'score.fugo'
+    write_score(
+        path,
+        [
+            (SOPRANO, [Duration(1, 4)] * 4 + [Duration(1, 2)]),
+            (BASS, [Duration(1, 12)] * 3 + [Duration(3, 8), Duration(1)]),
+            ([], []),
+        ],
+        keys=[(0, Key('c')), (Fraction(3, 2), Key('Eb'))],
+        meters=[(0, Meter(4, 4)), (1, Meter(3, 4))],
+    )
+    return path
+
+
+def test_round_trip(path):
+    with open_score(path) as score:
+        assert isinstance(score, ScoreFile)
+        assert len(score) == 3
+        assert score.resolution == 24
+
+        soprano, bass, empty = score
+        assert list(soprano) == SOPRANO
+        assert list(bass) == BASS
+        assert bass[3] == Note('Bbb-1')
+        assert bass[1:3] == BASS[1:3]
+        assert len(empty) == 0
+
+        assert soprano.onsets.tolist() == [0, 6, 12, 18, 24]
+        assert soprano.duration(4) == Duration(1, 2)
+        assert bass.onset(4) == Fraction(5, 8)
+        assert bass.codes.tolist() == [note.code for note in BASS]
+
+        assert score.keys == [(0, Key('c')), (Fraction(3, 2), Key('Eb'))]
+        assert score.meters == [(0, Meter(4, 4)), (1, Meter(3, 4))]
+
+
+def test_close(path):
+    score = open_score(path)
+    codes = score[0].codes
+    score.close()
+    with pytest.raises(ValueError):
+        codes[0]
+
+
+def test_load_voices(path):
+    expected = [SOPRANO, BASS, []]
+    assert load_voices(path) == expected
+    assert load_voices(path, budget=10) == expected
+
+    voices = load_voices(path, budget=9)
+    assert all(isinstance(voice, Packed) for voice in voices)
+    assert [list(voice) for voice in voices] == expected
+    assert voices[1][3] == Note('Bbb-1')
+
+
+def test_invalid(tmp_path, path):
+    data = path.read_bytes()
+
+    bad = tmp_path / 'bad.fugo'
+    for corrupt in (
+        b'MIDI' + data[4:],
+        data[:4] + struct.pack('<H', 99) + data[6:],
+        data[:-8],
+        data + bytes(8),
+    ):
+        bad.write_bytes(corrupt)
+        with pytest.raises(ValueError):
+            open_score(bad)
+
+    with pytest.raises(ValueError):
+        write_score(bad, [(SOPRANO, [Duration(1, 4)])])
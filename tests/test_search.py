@@ -0,0 +1,80 @@
+import pytest
+
+from fugo import Entry, Note, SubjectIndex
+
+
+def _notes(s: str, /) -> list[Note]:
+    return [Note(n) for n in s.split()]
+
+
+def test_exact():
+    voices = [
+        _notes('C4 D4 E4 C4 G4 A4 B4 G4'),
+        _notes('F3 G3 A3 F3 C4'),
+        _notes('D4 E4 F4 D4'),
+    ]
+    index = SubjectIndex(voices)
+    subject = _notes('C4 D4 E4 C4')
+
+    assert len(index) == 3
+    assert index.find(subject) == [Entry(0, 0), Entry(0, 4), Entry(1, 0)]
+
+
+def test_diatonic():
+    voices = [
+        _notes('C4 D4 E4 C4 G4 A4 B4 G4'),
+        _notes('D4 E4 F4 D4'),
+    ]
+    index = SubjectIndex(voices)
+    subject = _notes('C4 D4 E4 C4')
+
+    assert index.find(subject) == [Entry(0, 0), Entry(0, 4)]
+    assert index.find(subject, diatonic=True) == [
+        Entry(0, 0),
+        Entry(0, 4),
+        Entry(1, 0),
+    ]
+
+
+def test_across_voices():
+    # The end of one voice and the start of the next are not adjacent.
+    index = SubjectIndex([_notes('C4 D4'), _notes('E4 F4')])
+    assert index.find(_notes('C4 D4 E4')) == []
+
+
+def test_short_subject():
+    index = SubjectIndex([_notes('C4 D4')])
+    with pytest.raises(ValueError):
+        index.find(_notes('C4'))
+
+
+def test_short_trailing_voices():
+    # Voices too short to have intervals leave adjacent separators.
+    for last in ([], _notes('E4')):
+        index = SubjectIndex([_notes('C4 D4'), last])
+        assert index.find(_notes('D4 E4')) == [Entry(0, 0)]
+
+
+def test_tonal():
+    # The answer replies to the subject's opening fifth with a fourth.
+    subject = _notes('C4 G4 F4 E4 D4 C4')
+    voices = [
+        _notes('C4 G4 F4 E4 D4 C4'),
+        _notes('E4 G4 C5 B4 A4 G4 F#4 G4'),
+        _notes('C5 F5 E5 D5 C5 B4'),
+    ]
+    index = SubjectIndex(voices)
+
+    assert index.find(subject, diatonic=True) == [Entry(0, 0)]
+    assert index.find(subject, diatonic=True, tonal=True) == [
+        Entry(0, 0),
+        Entry(1, 1),
+        Entry(2, 0),
+    ]
+
+    # Exact matching also compares the qualities of the other intervals.
+    answer = voices[1][1:7]
+    assert index.find(subject, tonal=True) == [Entry(0, 0)]
+    assert index.find(answer, tonal=True) == [Entry(1, 1), Entry(2, 0)]
+    assert index.find(answer) == [Entry(1, 1), Entry(2, 0)]
+    assert index.find(_notes('C4 D4 E4'), tonal=True) == []
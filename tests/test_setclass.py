@@ -0,0 +1,67 @@
+from collections import Counter
+
+from fugo import Chord, Note, NoteName, Quality
+from fugo import SetClass, equivalent, pitch_class_set, set_class, set_classes
+
+
+def test_pitch_class_set():
+    assert pitch_class_set(0b101) == 0b101
+    assert pitch_class_set([0, 4, 7, 12]) == 0b10010001
+    assert pitch_class_set(Chord('C')) == 0b10010001
+    assert pitch_class_set(Quality.MAJOR) == 0b10010001
+    assert pitch_class_set([Note('E5'), Note('C3'), Note('B#4')]) == 0b10001
+    assert pitch_class_set([NoteName('Dbb'), NoteName('E')]) == 0b10001
+
+
+def test_set_class():
+    expected = {
+        'C': SetClass('3-11', (0, 3, 7), (0, 0, 1, 1, 1, 0)),
+        'Am': SetClass('3-11', (0, 3, 7), (0, 0, 1, 1, 1, 0)),
+        'G7': SetClass('4-27', (0, 2, 5, 8), (0, 1, 2, 1, 1, 1)),
+        'Fo7': SetClass('4-28', (0, 3, 6, 9), (0, 0, 4, 0, 0, 2)),
+        'E+': SetClass('3-12', (0, 4, 8), (0, 0, 0, 3, 0, 0)),
+    }
+
+    for chord, expected_class in expected.items():
+        assert set_class(Chord(chord)) == expected_class
+
+
+def test_names():
+    assert set_class([0, 1, 4, 6]).name == '4-Z15'
+    assert set_class([0, 1, 3, 7]).name == '4-Z29'
+    assert set_class([0, 1, 5, 6, 8]).name == '5-20'
+    assert set_class([0, 2, 4, 5, 7, 9, 11]).name == '7-35'
+    assert set_class(range(12)).name == '12-1'
+    assert set_class([]).name == '0-1'
+    assert set_class([3, 9]).name == '2-6'
+
+    # 224 set classes (or 208 with Forte's restriction to 3-9 members).
+    assert len({set_class(mask) for mask in range(4096)}) == 224
+
+
+def test_z_relation():
+    # Exactly the Z-related set classes share an interval-class vector
+    # (ignoring the empty set and single notes, which have no intervals).
+    classes = {set_class(mask) for mask in range(4096)}
+    classes = {sc for sc in classes if len(sc.prime) > 1}
+    counts = Counter(sc.vector for sc in classes)
+
+    for sc in classes:
+        assert ('Z' in sc.name) == (counts[sc.vector] > 1), sc
+
+
+def test_equivalent():
+    assert equivalent(Chord('C'), Chord('Eb'))
+    assert equivalent(Chord('C'), Chord('Cm'))
+    assert not equivalent(Chord('C'), Chord('Cm'), inversion=False)
+    assert equivalent(Chord('C'), Chord('F#'), inversion=False)
+    assert not equivalent(Chord('C'), Chord('C7'))
+
+
+def test_set_classes():
+    soprano = [Note('E5'), Note('F5'), Note('E5')]
+    alto = [Note('C5'), Note('B4'), Note('C5')]
+    bass = [Note('C3'), Note('G2'), Note('C3')]
+
+    names = [sc.name for sc in set_classes(soprano, alto, bass)]
+    assert names == ['2-4', '3-8', '2-4']
@@ -0,0 +1,40 @@
+from fugo import Match, MelodyIndex, Note, edit_distance, signature
+
+
+def _notes(s: str, /) -> list[Note]:
+    return [Note(n) for n in s.split()]
+
+
+def test_signature():
+    assert signature(_notes('C4 G4 F4 F4 C5')) == (5, -2, 0, 5)
+    assert signature(_notes('C4 E5')) == (3,)
+    assert signature(_notes('C4')) == ()
+
+
+def test_edit_distance():
+    assert edit_distance('kitten', 'sitting') == 3
+    assert edit_distance('', 'abc') == 3
+    assert edit_distance('abc', '') == 3
+    assert edit_distance((1, 2, 3), (1, 2, 3)) == 0
+
+
+def test_query():
+    index = MelodyIndex(
+        [
+            _notes('C4 D4 E4 F4 G4 A4'),
+            _notes('A4 G4 F4 E4 D4 C4'),
+            _notes('C4 D4 E4 F4 G4 C5'),
+            _notes('C4 C4 C4 C4'),
+        ]
+    )
+    assert len(index) == 4
+
+    query = _notes('G3 A3 B3 C4 D4 E4')
+    assert index.query(query, k=2) == [Match(0, 0), Match(2, 1)]
+
+
+def test_add():
+    index = MelodyIndex()
+    assert index.add(_notes('E4 F4 G4 E4')) == 0
+    assert index.add(_notes('E4 D4 C4 E4')) == 1
+    assert index.query(_notes('C4 D4 E4 C4'), k=5) == [Match(0, 0)]
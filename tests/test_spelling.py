@@ -0,0 +1,60 @@
+import random
+
+import pytest
+
+from fugo import Key, Note, spell, spell_voices
+
+
+def _notes(s: str, /) -> list[Note]:
+    return [Note(n) for n in s.split()]
+
+
+def _pitches(s: str, /) -> list[int]:
+    return [note.pitch for note in _notes(s)]
+
+
+def test_spell():
+    for scale in (
+        'C4 D4 E4 F4 G4 A4 B4 C5',
+        'Eb4 F4 G4 Ab4 Bb4 C5 D5 Eb5',
+        'F#4 G#4 A#4 B4 C#5 D#5 E#5 F#5',
+    ):
+        assert spell(_pitches(scale)) == _notes(scale)
+
+    scale = 'Db4 Eb4 F4 Gb4 Ab4 Bb4 C5 Db5'
+    assert spell(_pitches(scale), Key('Db')) == _notes(scale)
+
+
+def test_key():
+    assert spell(_pitches('G#3 A3 B3'), Key('a')) == _notes('G#3 A3 B3')
+    assert spell([68, 70, 72], Key('Ab')) == _notes('Ab4 Bb4 C5')
+    assert spell([61, 66], Key('B')) == _notes('C#4 F#4')
+    assert spell([61, 66], Key('Db')) == _notes('Db4 Gb4')
+
+
+def test_keys():
+    notes = _notes('Db4 Gb4 Ab4 Db5 E4 G#4 B4 C#5 F#4')
+    keys = [Key('Db')] * 4 + [Key('E')] * 5
+    assert spell([note.pitch for note in notes], keys, window=1) == notes
+
+    with pytest.raises(ValueError):
+        spell([60, 62], [Key('C')])
+
+
+def test_round_trip():
+    rng = random.Random(0)
+    pitches = [rng.randrange(24, 108) for _ in range(1000)]
+    for key in (None, Key('C'), Key('F#'), Key('eb')):
+        assert [note.pitch for note in spell(pitches, key)] == pitches
+
+
+def test_spell_voices():
+    voices = [_pitches('C5 B4 C5 D5'), _pitches('Eb4 D4 Eb4 F4'), [36, 43, 48]]
+    expected = [spell(voice, Key('c')) for voice in voices]
+    assert spell_voices(voices, Key('c')) == expected
+    assert spell_voices(voices, Key('c'), processes=2) == expected
+
+
+def test_invalid():
+    with pytest.raises(ValueError):
+        spell([60], window=0)
@@ -0,0 +1,45 @@
+from fugo import Direction, Duration, Interval, Note, find_strettos
+
+
+def _notes(s: str, /) -> list[Note]:
+    return [Note(n) for n in s.split()]
+
+
+def test_ranking():
+    subject = _notes('C4 D4 E4 C4')
+    results = find_strettos(subject, intervals=[Interval('P5')])
+
+    best = results[0]
+    assert best.offset == Duration.QUARTER
+    assert best.direction == Direction.DOWN
+    assert best.overlap == 3
+    assert best.dissonances == best.parallels == 0
+
+    scores = [r.dissonances + r.parallels for r in results]
+    assert scores == sorted(scores)
+
+
+def test_parallels():
+    # A chain of fifths against itself at the unison, one note later,
+    # moves in parallel fifths throughout.
+    subject = _notes('C4 G4 D5 A5')
+    results = find_strettos(subject, intervals=[Interval('P1')])
+
+    by_offset = {r.offset: r for r in results}
+    assert by_offset[Duration.QUARTER].parallels == 2
+    assert by_offset[Duration.QUARTER].dissonances == 0
+    assert by_offset[Duration.HALF].parallels == 0
+
+
+def test_durations():
+    subject = _notes('C4 E4 G4')
+    durations = [Duration.HALF, Duration.QUARTER, Duration.QUARTER]
+    results = find_strettos(subject, durations, intervals=[Interval('P1')])
+
+    offsets = {r.offset for r in results}
+    assert offsets == {Duration.QUARTER, Duration.HALF, 3 * Duration.QUARTER}
+    assert all(r.direction == Direction.UP for r in results)
+
+
+def test_empty():
+    assert find_strettos([]) == []
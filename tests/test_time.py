@@ -1,7 +1,10 @@
+from array import array
 from fractions import Fraction
 
+import pytest
+
 from fugo import Meter, Duration
-from fugo import Clock, Time
+from fugo import Clock, TempoMap, Time
 
 
 def test_clock_tick_4_4():
@@ -51,3 +54,64 @@ def test_clock_tick_6_8():
 
     clock.tick(Duration.EIGHTH)
     assert clock.time == Time(5, 5, Fraction(1, 2))
+
+
+def test_time_position():
+    for meter in (Meter(4, 4), Meter(6, 8), Meter(3, 2)):
+        clock = Clock(meter)
+        for duration in [Duration.QUARTER, Duration(3, 8), Duration(1, 12)] * 5:
+            clock.tick(duration)
+            assert clock.time.position(meter) == clock.position
+
+
+def test_tempo_map():
+    tempo = TempoMap([(0, 120), (1, 60), (Fraction(3, 2), 240)])
+    assert len(tempo) == 3
+    assert tempo.tempo(0) == tempo.tempo(Fraction(1, 2)) == 120
+    assert tempo.tempo(1) == 60
+
+    expected = {0: 0, Fraction(1, 2): 1, 1: 2, Fraction(5, 4): 3, Fraction(3, 2): 4}
+    expected[Fraction(7, 4)] = 4.25
+    for position, seconds in expected.items():
+        assert tempo.seconds(position) == seconds
+        assert tempo.position(seconds) == position
+
+    # Accumulated durations convert to plain seconds.
+    seconds = tempo.seconds(Duration(5, 4))
+    assert type(seconds) is float and seconds == 3
+    assert type(TempoMap([(0, 100)]).seconds(Duration(1, 3))) is float
+    assert tempo.tempo(Duration(3, 2)) == 240
+    assert type(tempo.seconds_many([Duration(1, 2)])[0]) is float
+
+    # Tempos may be measured in other beats (e.g. dotted quarters).
+    compound = TempoMap([(0, 60)], beat=Duration(3, 8))
+    assert compound.seconds(Fraction(3, 4)) == 2
+
+
+def test_tempo_map_invalid():
+    with pytest.raises(ValueError):
+        TempoMap([(1, 120)])
+    with pytest.raises(ValueError):
+        TempoMap([(0, 120), (0, 60)])
+    with pytest.raises(ValueError):
+        TempoMap([(0, 0)])
+    with pytest.raises(ValueError):
+        TempoMap([(0, 120)]).seconds(-1)
+
+
+def test_seconds_many():
+    changes = [(Fraction(i, 4), 60 + i % 7 * 10) for i in range(100)]
+    tempo = TempoMap(changes)
+
+    onsets = list(range(0, 40 * 24, 5))
+    expected = [tempo.seconds(Fraction(onset, 24)) for onset in onsets]
+    assert tempo.seconds_many(onsets, 24).tolist() == pytest.approx(expected)
+    assert tempo.seconds_many(array('q', onsets), 24).tolist() == pytest.approx(
+        expected
+    )
+
+    # Unsorted onsets are converted too.
+    shuffled = onsets[::2] + onsets[1::2]
+    assert tempo.seconds_many(shuffled, 24).tolist() == pytest.approx(
+        expected[::2] + expected[1::2]
+    )
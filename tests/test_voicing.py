@@ -0,0 +1,85 @@
+from itertools import combinations, pairwise
+
+import pytest
+
+from fugo import Accidental, Chord, Key, Note, NoteName, realize, voice_lead
+
+
+def _name(note: Note, /) -> NoteName:
+    return NoteName.from_attrs(note.letter, note.accidental)
+
+
+def _chords(s: str, /) -> list[Chord]:
+    return [Chord(c) for c in s.split()]
+
+
+def test_voice_lead():
+    chords = _chords('C Am F G7 C Dm7/F G C')
+    path = voice_lead(chords)
+
+    assert len(path) == len(chords)
+    for chord, voicing in zip(chords, path):
+        assert len(voicing) == 4
+        assert _name(voicing[0]) == chord.bass
+        names = {_name(n) for n in voicing}
+        assert names == set(chord.note_names)
+        assert [n.pitch for n in voicing] == sorted(n.pitch for n in voicing)
+
+
+def test_no_parallels():
+    path = voice_lead(_chords('C Dm Em F G Am G C'))
+
+    for beat1, beat2 in pairwise(path):
+        for i, j in combinations(range(4), 2):
+            before = beat1[j].pitch - beat1[i].pitch
+            after = beat2[j].pitch - beat2[i].pitch
+            moved = beat1[i] != beat2[i]
+            if moved and before == after:
+                assert before % 12 not in (0, 7)
+
+
+def test_omitted_fifth():
+    ranges = [
+        (Note('E2'), Note('C4')),
+        (Note('C3'), Note('G4')),
+        (Note('G3'), Note('D5')),
+    ]
+    path = voice_lead(_chords('G7 C'), 3, ranges=ranges)
+    names = {_name(n) for n in path[0]}
+    assert names == {NoteName('G'), NoteName('B'), NoteName('F')}
+
+
+def test_invalid():
+    with pytest.raises(ValueError):
+        voice_lead(_chords('C'), 3)
+    with pytest.raises(ValueError):
+        voice_lead(_chords('C7'), 2, ranges=[(Note('C2'), Note('C3'))] * 2)
+    assert voice_lead([]) == []
+
+
+def test_realize():
+    key = Key('G')
+    chords = _chords('G C/E D7/F# G/B C D7 G')
+    bass = [Note(n) for n in 'G2 E3 F#3 B2 C3 D3 G2'.split()]
+    figures = [chord.figures(key) for chord in chords]
+
+    path = realize(bass, figures, key)
+
+    for note, chord, voicing in zip(bass, chords, path):
+        assert voicing[0] == note
+        assert {_name(n) for n in voicing} == set(chord.note_names)
+
+
+def test_realize_accidentals():
+    # A raised third over the dominant of A minor.
+    bass = [Note('A2'), Note('E3'), Note('A2')]
+    figures = [[], [(Accidental.SHARP, 3)], []]
+
+    path = realize(bass, figures, Key('a'))
+
+    assert {_name(n) for n in path[1]} == {NoteName('E'), NoteName('G#'), NoteName('B')}
+
+
+def test_realize_invalid():
+    with pytest.raises(ValueError):
+        realize([Note('C3')], [], Key('C'))